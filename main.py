@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import random
 import json
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
@@ -11,13 +12,11 @@ import numpy as np
 
 from src.process.process import Process
 from src.process.process_state import ProcessState
-from src.schedulers.fcfs import FCFSScheduler
-from src.schedulers.sjf import SJFScheduler
-from src.schedulers.round_robin import RoundRobinScheduler
 from src.schedulers.priority import PriorityScheduler
-from src.schedulers.mlfq import MLFQScheduler
-from src.visualization.gantt import GanttChart
-from src.utils.metrics import SchedulingMetrics
+from src.visualization.table import DEFAULT_ROW_HEIGHT, VirtualTable
+from src.visualization.gantt import GanttChart, LiveGanttChart
+from src.visualization.timeline import LiveTimeline
+from src.utils.metrics import PERCENTILES, SchedulingMetrics
 from src.interrupt.timer import TimerInterrupt
 from src.process.process import Process
 from src.process.process_state import ProcessState
@@ -26,6 +25,19 @@ from src.schedulers.realtime.rate_monotonic import RateMonotonicScheduler
 
 # Import cho Earliest Deadline First Scheduler
 from src.schedulers.realtime.earliest_deadline import EarliestDeadlineFirstScheduler
+from src.schedulers.factory import SCHEDULER_TYPES, create_scheduler, scheduler_type_of
+from src.simulation.cache import ResultCache
+from src.simulation.checkpoint import load_checkpoint, save_checkpoint
+from src.simulation.comparison import submit_comparison, workload_spec
+from src.simulation.worker import (
+    DEFAULT_STEPS_PER_SECOND, SPEED_SLIDER_MAX, SPEED_SLIDER_MIN, SimulationWorker,
+    describe_speed, steps_per_second_at,
+)
+from src.workload.generator import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, generate_workload
+from src.workload.loader import load_csv, load_json
+
+# Screen refresh while a simulation runs, about 30 frames per second
+FRAME_INTERVAL_MS = 33
 
 class CPUSchedulerGUI:
     def __init__(self, root):
@@ -36,9 +48,17 @@ class CPUSchedulerGUI:
         # Initialize basic attributes
         self.processes = []
         self.current_time = 0
-        self.simulation_speed = 1.0
+        # Steps per second, None for unthrottled
+        self.simulation_speed = DEFAULT_STEPS_PER_SECOND
         self.is_running = False
         self.timer_interrupt = None
+        self.comparison_executor = None
+        self.comparison_futures = None
+        # Identical comparisons are answered from disk instead of re-simulated
+        self.result_cache = ResultCache()
+        # Background simulation and the snapshot currently on screen
+        self.simulation_worker = None
+        self.snapshot = None
         
         # Initialize UI variables
         self.scheduler_var = tk.StringVar()
@@ -410,11 +430,25 @@ class CPUSchedulerGUI:
         self.gantt_figure = Figure(figsize=(8, 4))
         self.gantt_canvas = FigureCanvasTkAgg(self.gantt_figure, viz_frame)
         self.gantt_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.gantt_view = LiveGanttChart(self.gantt_figure, self.gantt_canvas, {
+            ProcessState.NEW: '#f0f0f0',      # Light gray
+            ProcessState.READY: '#ffd700',     # Gold
+            ProcessState.RUNNING: '#32cd32',   # Lime green
+            ProcessState.WAITING: '#ff6347',   # Tomato red
+            ProcessState.TERMINATED: '#4169e1'  # Royal blue
+        })
         
         # Process State Timeline
         self.timeline_figure = Figure(figsize=(8, 2))
         self.timeline_canvas = FigureCanvasTkAgg(self.timeline_figure, viz_frame)
         self.timeline_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.timeline_view = LiveTimeline(self.timeline_figure, self.timeline_canvas, {
+            ProcessState.NEW: 'gray',
+            ProcessState.READY: 'yellow',
+            ProcessState.RUNNING: 'green',
+            ProcessState.WAITING: 'red',
+            ProcessState.TERMINATED: 'blue'
+        })
 
     def update_visualization(self):
         """Update all visualization components with enhanced features"""
@@ -426,76 +460,8 @@ class CPUSchedulerGUI:
     def update_gantt_chart(self):
         """Enhanced Gantt chart with I/O operations and context switches"""
         try:
-            self.gantt_figure.clear()
-            ax = self.gantt_figure.add_subplot(111)
-            
-            if not self.processes:
-                self.gantt_canvas.draw()
-                return
-            
-            y_positions = range(len(self.processes))
-            colors = {
-                ProcessState.NEW: '#f0f0f0',      # Light gray
-                ProcessState.READY: '#ffd700',     # Gold
-                ProcessState.RUNNING: '#32cd32',   # Lime green
-                ProcessState.WAITING: '#ff6347',   # Tomato red
-                ProcessState.TERMINATED: '#4169e1'  # Royal blue
-            }
-
-            # Plot timeline for each process
-            for i, process in enumerate(self.processes):
-                # Plot execution segments
-                if process.start_time is not None:
-                    executed_time = process.burst_time - process.remaining_time
-                    if executed_time > 0:
-                        ax.barh(
-                            i, 
-                            executed_time,
-                            left=process.start_time,
-                            color=colors[process.state],
-                            alpha=0.8,
-                            label=f'P{process.pid}'
-                        )
-                        
-                    # Add text label
-                    ax.text(
-                        process.start_time + executed_time/2,
-                        i,
-                        f'P{process.pid}',
-                        va='center',
-                        ha='center'
-                    )
-
-                # Plot I/O operations
-                if hasattr(process, 'io_operations'):
-                    for io_op in process.io_operations:
-                        ax.barh(
-                            i,
-                            io_op['duration'],
-                            left=io_op['start_time'],
-                            color='red',
-                            alpha=0.3,
-                            hatch='//',
-                            label='I/O'
-                        )
-
-            # Customize chart appearance
-            ax.set_yticks(y_positions)
-            ax.set_yticklabels([f'P{p.pid}' for p in self.processes])
-            ax.set_xlabel('Time')
-            ax.set_ylabel('Process')
-            ax.set_title('CPU Scheduling Gantt Chart')
-            ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-
-            # Add legend only once for each type
-            handles, labels = ax.get_legend_handles_labels()
-            by_label = dict(zip(labels, handles))
-            ax.legend(by_label.values(), by_label.keys(), 
-                    loc='upper right', bbox_to_anchor=(1.15, 1))
-
-            self.gantt_figure.tight_layout()
-            self.gantt_canvas.draw()
-            
+            # Artists persist between frames, only what changed is redrawn
+            self.gantt_view.update(self.displayed_processes(), self.displayed_trace())
         except Exception as e:
             print(f"Error updating Gantt chart: {e}")
             
@@ -531,7 +497,6 @@ class CPUSchedulerGUI:
 
         # Handle interrupts
         self.handle_timer_interrupt()
-        self.handle_io_operations()
         self.handle_priority_interrupt()
 
         # Run one step of simulation
@@ -540,7 +505,7 @@ class CPUSchedulerGUI:
             self.log_event(f"Time {self.current_time}: Execution step completed")
             
             # Schedule next update
-            delay = int(1000 / self.simulation_speed)
+            delay = int(1000 / self.simulation_speed) if self.simulation_speed else 0
             self.root.after(delay, self.run_simulation)
         else:
             # Simulation completed
@@ -605,134 +570,81 @@ class CPUSchedulerGUI:
         if not self.processes:
             messagebox.showwarning("Warning", "Vui lòng thêm tiến trình trước.")
             return
+        if self.comparison_futures is not None:
+            # A comparison is already running
+            return
 
-        # Lưu các tiến trình gốc
-        original_processes = self.processes.copy()
-
-        # Danh sách thuật toán
-        schedulers = [
-            'FCFS', 'SJF', 'Round Robin', 'Priority (Non-preemptive)',
-            'Priority (Preemptive)', 'Multi-Level Queue', 'Rate Monotonic',
-            'Earliest Deadline First'
-        ]
-
-        comparison_data = {}
-
-        for scheduler_type in schedulers:
-            scheduler = self.create_scheduler(scheduler_type)
-            processes_copy = self.clone_processes(original_processes)
-            if scheduler_type == 'Rate Monotonic':
-                # Gán period tạm thời cho Rate Monotonic
-                period = 10  # Giá trị mặc định hoặc cần xác định cách lấy giá trị phù hợp
-                for process in processes_copy:
-                    scheduler.add_process(process, period)
-            elif scheduler_type == 'Earliest Deadline First':
-                # Gán period và deadline tạm thời cho EDF
-                period = 10
-                deadline = 8
-                for process in processes_copy:
-                    scheduler.add_process(process, deadline=deadline, period=period)
-            else:
-                # Các thuật toán khác không yêu cầu thêm tham số
-                for process in processes_copy:
-                    scheduler.add_process(process)
+        try:
+            quantum = int(self.quantum_var.get())
+            context_switch = int(self.context_switch_var.get())
+            # Validate settings here, workers only report results
+            create_scheduler('FCFS', quantum, context_switch)
+        except ValueError as e:
+            messagebox.showerror("Lỗi tạo scheduler", str(e))
+            return
 
-            # Chạy mô phỏng
-            while not scheduler.is_all_completed():
-                scheduler.run_step()
+        # Workers get the workload spec, not live Process objects
+        if self.comparison_executor is None:
+            self.comparison_executor = ProcessPoolExecutor(
+                max_workers=min(len(SCHEDULER_TYPES), os.cpu_count() or 1)
+            )
+        self.comparison_futures = submit_comparison(
+            self.comparison_executor,
+            workload_spec(self.processes),
+            SCHEDULER_TYPES,
+            quantum,
+            context_switch,
+            cache=self.result_cache
+        )
+        self.log_event(f"So sánh {len(SCHEDULER_TYPES)} thuật toán (Quantum={quantum}, CS={context_switch})")
+        self.root.after(50, self.poll_comparison)
 
-            # Tính toán metrics
-            metrics = self.calculate_detailed_metrics(scheduler)
-            comparison_data[scheduler_type] = metrics
+    def poll_comparison(self):
+        """Collect comparison results without blocking the Tk event loop"""
+        futures = self.comparison_futures
+        if futures is None:
+            return
+        if not all(future.done() for future in futures.values()):
+            self.root.after(50, self.poll_comparison)
+            return
 
-        # Khôi phục các tiến trình ban đầu
-        self.processes = original_processes
+        self.comparison_futures = None
+        try:
+            comparison_data = {
+                scheduler_type: future.result()
+                for scheduler_type, future in futures.items()
+            }
+        except Exception as e:
+            messagebox.showerror("Error", f"So sánh thất bại: {e}")
+            return
 
         # Hiển thị kết quả
         self.show_detailed_comparison(comparison_data)
 
+    def shutdown(self):
+        """Stop the simulation thread and comparison worker processes"""
+        self.stop_worker()
+        if self.comparison_executor is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9
+            for future in (self.comparison_futures or {}).values():
+                future.cancel()
+            self.comparison_executor.shutdown(wait=False)
+            self.comparison_executor = None
+
 
     def update_timeline(self):
         """Update process state timeline visualization"""
         try:
-            self.timeline_figure.clear()
-            ax = self.timeline_figure.add_subplot(111)
-            
-            if not self.processes:
-                self.timeline_canvas.draw()
-                return
-                
-            # Plot state changes
-            for i, process in enumerate(self.processes):
-                # Plot different states with different colors
-                states = {
-                    ProcessState.NEW: 'gray',
-                    ProcessState.READY: 'yellow',
-                    ProcessState.RUNNING: 'green',
-                    ProcessState.WAITING: 'red',
-                    ProcessState.TERMINATED: 'blue'
-                }
-                
-                # Create timeline
-                ax.broken_barh(
-                    [(process.arrival_time, self.current_time - process.arrival_time)],
-                    (i-0.4, 0.8),
-                    facecolors=states[process.state],
-                    alpha=0.5
-                )
-                
-                # Add labels
-                ax.text(
-                    0, i,
-                    f'P{process.pid}',
-                    ha='right',
-                    va='center'
-                )
-                
-            # Customize appearance
-            ax.set_ylim(-0.5, len(self.processes)-0.5)
-            ax.set_xlabel('Time')
-            ax.set_title('Process State Timeline')
-            ax.grid(True)
-            
-            self.timeline_figure.tight_layout()
-            self.timeline_canvas.draw()
-            
+            self.timeline_view.update(self.displayed_processes(), self.current_time)
         except Exception as e:
             print(f"Error updating timeline: {e}")
         
     def calculate_detailed_metrics(self, scheduler):
         """Calculate comprehensive performance metrics"""
-        processes = scheduler.processes
-        total_time = scheduler.current_time
-        
-        # Basic metrics
-        total_waiting = sum(p.waiting_time for p in processes)
-        total_turnaround = sum(p.turnaround_time for p in processes)
-        total_response = sum(
-            (p.start_time - p.arrival_time) for p in processes 
-            if p.start_time is not None
-        )
-        
-        # Advanced metrics
-        cpu_burst_time = sum(p.burst_time for p in processes)
-        io_time = sum(
-            sum(io['duration'] for io in getattr(p, 'io_operations', []))
-            for p in processes
+        return SchedulingMetrics.calculate_detailed_metrics(
+            scheduler.processes, scheduler.current_time
         )
         
-        num_processes = len(processes)
-        
-        return {
-            'avg_waiting_time': total_waiting / num_processes,
-            'avg_turnaround_time': total_turnaround / num_processes,
-            'avg_response_time': total_response / num_processes,
-            'cpu_utilization': (cpu_burst_time / total_time * 100) if total_time > 0 else 0,
-            'throughput': num_processes / total_time if total_time > 0 else 0,
-            'context_switches': sum(p.context_switches for p in processes),
-            'io_utilization': (io_time / total_time * 100) if total_time > 0 else 0
-        }
-        
     def show_detailed_comparison(self, comparison_data):
         """Show detailed comparison with enhanced visualization"""
         comparison_window = tk.Toplevel(self.root)
@@ -761,6 +673,7 @@ class CPUSchedulerGUI:
         """Create detailed comparison table"""
         columns = (
             "Scheduler", "Avg Wait", "Avg Turnaround", "Avg Response",
+            "P95 Wait", "P95 Turnaround", "P95 Response",
             "CPU Util", "Throughput", "Context Switches", "I/O Util"
         )
         
@@ -776,6 +689,9 @@ class CPUSchedulerGUI:
                 f"{metrics['avg_waiting_time']:.2f}",
                 f"{metrics['avg_turnaround_time']:.2f}",
                 f"{metrics['avg_response_time']:.2f}",
+                f"{metrics['p95_waiting_time']:.2f}",
+                f"{metrics['p95_turnaround_time']:.2f}",
+                f"{metrics['p95_response_time']:.2f}",
                 f"{metrics['cpu_utilization']:.1f}%",
                 f"{metrics['throughput']:.2f}",
                 metrics['context_switches'],
@@ -983,45 +899,37 @@ class CPUSchedulerGUI:
         speed_frame = ttk.Frame(control_frame)
         speed_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(speed_frame, text="Speed (x):").pack(side=tk.LEFT)
+        ttk.Label(speed_frame, text="Speed:").pack(side=tk.LEFT)
+        # Logarithmic, in steps per second; the right end runs unthrottled
         self.speed_scale = ttk.Scale(
             speed_frame,
-            from_=0.1,
-            to=4.0,  # Increased maximum speed to 4x
+            from_=SPEED_SLIDER_MIN,
+            to=SPEED_SLIDER_MAX,
             orient=tk.HORIZONTAL,
-            value=1.0,
+            value=SPEED_SLIDER_MIN,
             command=self.update_speed
         )
         self.speed_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
         # Current speed label
-        self.speed_label = ttk.Label(speed_frame, text="1.0x")
+        self.speed_label = ttk.Label(speed_frame, text=describe_speed(DEFAULT_STEPS_PER_SECOND))
         self.speed_label.pack(side=tk.RIGHT)
-        
-        def update_speed_label(value):
-            self.speed_label.config(text=f"{float(value):.1f}x")
-            self.simulation_speed = float(value)
-        
-        self.speed_scale.config(command=update_speed_label)
 
-    def handle_io_operations(self):
-        """Handle I/O operations for current processes"""
-        for process in self.processes:
-            if hasattr(process, 'io_operations'):
-                for io_op in process.io_operations:
-                    if not io_op['completed']:
-                        # Start I/O operation
-                        if (io_op['start_time'] == self.current_time and 
-                            process.state == ProcessState.RUNNING):
-                            process.update_state(ProcessState.WAITING)
-                            self.log_event(f"Process {process.pid} started I/O operation")
-                        
-                        # Complete I/O operation
-                        elif (io_op['start_time'] + io_op['duration'] == self.current_time and
-                              process.state == ProcessState.WAITING):
-                            io_op['completed'] = True
-                            process.update_state(ProcessState.READY)
-                            self.log_event(f"Process {process.pid} completed I/O operation")
+    def log_io_event(self, process, started, log=None):
+        """
+        Log an I/O operation starting or completing (scheduler io_listener)
+
+        Args:
+            process: Process whose I/O operation changed
+            started: True when the operation started, False when it completed
+            log: Receives the message, defaults to log_event
+        """
+        if log is None:
+            log = self.log_event
+        if started:
+            log(f"Process {process.pid} started I/O operation")
+        else:
+            log(f"Process {process.pid} completed I/O operation")
 
     def get_highest_priority_process(self):
         """Get the process with highest priority from ready queue"""
@@ -1052,20 +960,31 @@ class CPUSchedulerGUI:
 
     def update_process_table(self):
         """Update process status table with current processes"""
-        # Clear existing items
-        for item in self.process_table.get_children():
-            self.process_table.delete(item)
-        
-        # Add all processes
-        for process in self.processes:
-            self.process_table.insert("", "end", values=(
-                process.pid,
-                process.priority,
-                process.state.value,
-                process.remaining_time,
-                process.waiting_time,
-                "Yes" if hasattr(process, 'io_operations') else "No"
-            ))
+        # Only visible rows whose values changed are sent to Tk
+        self.process_view.set_rows(self.displayed_processes())
+
+    def process_row(self, process):
+        """Cell values of a process in the status table"""
+        return (
+            process.pid,
+            process.priority,
+            process.state.value,
+            process.remaining_time,
+            process.waiting_time,
+            "Yes" if getattr(process, 'io_operations', None) else "No"
+        )
+
+    def create_virtual_table(self, tree, scrollbar, row_values, key=None):
+        """Attach a VirtualTable to a Treeview and its scrollbar"""
+        view = VirtualTable(tree, row_values, key=key, scrollbar=scrollbar,
+                            window=int(tree.cget('height')))
+        scrollbar.configure(command=view.yview)
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        # One row of the widget is taken by the headings
+        tree.bind('<Configure>', lambda e: view.resize(e.height // row_height - 1))
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            tree.bind(sequence, view.on_mousewheel)
+        return view
 
     def setup_process_table(self, parent):
         """Setup process status display table"""
@@ -1086,12 +1005,11 @@ class CPUSchedulerGUI:
             self.process_table.heading(col, text=col)
             self.process_table.column(col, width=100)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
-            table_frame, orient=tk.VERTICAL,
-            command=self.process_table.yview
+        # Add scrollbar, driven by the virtual table rather than the tree
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
+        self.process_view = self.create_virtual_table(
+            self.process_table, scrollbar, self.process_row, key=lambda p: p.pid
         )
-        self.process_table.configure(yscrollcommand=scrollbar.set)
         
         self.process_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1105,46 +1023,44 @@ class CPUSchedulerGUI:
             max_burst = int(self.max_burst_var.get())
             max_priority = int(self.max_priority_var.get())
             io_probability = int(self.io_prob_var.get()) if self.io_prob_var.get() else 0
+            if not self.io_enabled.get():
+                io_probability = 0
 
             if num_processes <= 0 or max_arrival < 0 or max_burst <= 0 or max_priority <= 0:
                 raise ValueError("Values must be positive numbers")
                 
             if not 0 <= io_probability <= 100:
                 raise ValueError("I/O probability must be between 0 and 100")
-            
+
+            # A blank seed draws a fresh one, logged so the run can be repeated
+            if self.seed_var.get():
+                seed = int(self.seed_var.get())
+            else:
+                seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+            # Arrivals span about 0..max_arrival and bursts are capped at
+            # max_burst whatever the distributions
+            workload = generate_workload(
+                num_processes,
+                seed=seed,
+                arrivals=self.arrival_process_var.get(),
+                arrival_rate=num_processes / max(max_arrival, 1),
+                max_arrival=max_arrival,
+                bursts=self.burst_distribution_var.get(),
+                mean_burst=max(max_burst / 2, 1),
+                max_burst=max_burst,
+                max_priority=max_priority,
+                io_probability=io_probability / 100,
+                io_mean=max(max_burst / 4, 1),
+            )
+
             # Clear existing processes
             self.processes.clear()
-            
-            # Generate new processes
-            for i in range(num_processes):
-                process = Process(
-                    pid=i+1,
-                    arrival_time=random.randint(0, max_arrival),
-                    burst_time=random.randint(1, max_burst),
-                    priority=random.randint(1, max_priority)
-                )
-                
-                # Add random I/O operations
-                if random.randint(1, 100) <= io_probability:
-                    io_start = random.randint(0, process.burst_time - 1)
-                    io_duration = random.randint(1, max_burst // 2)
-                    
-                    io_op = {
-                        'start_time': io_start,
-                        'duration': io_duration,
-                        'completed': False
-                    }
-                    
-                    process.io_operations = [io_op]
-                
-                self.processes.append(process)
-                
-            # Sort processes by arrival time
-            self.processes.sort(key=lambda p: p.arrival_time)
+            self.processes.extend(workload.processes())
             
             # Update display
             self.update_process_table()
-            self.log_event(f"Generated {num_processes} random processes")
+            self.log_event(f"Generated {num_processes} random processes (seed {seed})")
             
             if io_probability > 0:
                 self.log_event(
@@ -1172,7 +1088,8 @@ class CPUSchedulerGUI:
             ("Max Arrival Time:", "max_arrival_var", "10"),
             ("Max Burst Time:", "max_burst_var", "10"),
             ("Max Priority:", "max_priority_var", "5"),
-            ("I/O Probability (%):", "io_prob_var", "20")
+            ("I/O Probability (%):", "io_prob_var", "20"),
+            ("Seed (blank = random):", "seed_var", "")
         ]
         
         # Validation command
@@ -1196,6 +1113,24 @@ class CPUSchedulerGUI:
         advanced_frame = ttk.LabelFrame(self.random_frame, text="Advanced Options")
         advanced_frame.grid(row=len(fields), column=0, columnspan=2, pady=5, sticky="ew")
         
+        # Distributions
+        distributions = [
+            ("Arrivals:", "arrival_process_var", ARRIVAL_PROCESSES),
+            ("Burst Times:", "burst_distribution_var", BURST_DISTRIBUTIONS),
+        ]
+        for label, var_name, choices in distributions:
+            row = ttk.Frame(advanced_frame)
+            row.pack(fill=tk.X, padx=5, pady=2)
+            ttk.Label(row, text=label).pack(side=tk.LEFT)
+            setattr(self, var_name, tk.StringVar(value="uniform"))
+            ttk.Combobox(
+                row,
+                textvariable=getattr(self, var_name),
+                values=choices,
+                state="readonly",
+                width=12
+            ).pack(side=tk.RIGHT)
+
         # I/O Settings
         self.io_enabled = tk.BooleanVar(value=True)
         ttk.Checkbutton(
@@ -1252,106 +1187,19 @@ class CPUSchedulerGUI:
 
     def import_from_csv(self, filename: str):
         """Import processes from CSV file"""
-        with open(filename, 'r') as file:
-            reader = csv.DictReader(file)
-            
-            # Validate required fields
-            required_fields = {'pid', 'arrival_time', 'burst_time'}
-            if not required_fields.issubset(reader.fieldnames):
-                missing = required_fields - set(reader.fieldnames)
-                raise ValueError(f"Missing required fields: {missing}")
-                
-            # Clear existing processes
-            self.processes.clear()
-            
-            # Read processes
-            for row in reader:
-                try:
-                    process = Process(
-                        pid=int(row['pid']),
-                        arrival_time=int(row['arrival_time']),
-                        burst_time=int(row['burst_time']),
-                        priority=int(row.get('priority', 0))
-                    )
-                    
-                    # Add I/O operations if present
-                    if 'io_start' in row and 'io_duration' in row:
-                        io_start = int(row['io_start'])
-                        io_duration = int(row['io_duration'])
-                        if io_start >= 0 and io_duration > 0:
-                            process.io_operations = [{
-                                'start_time': io_start,
-                                'duration': io_duration,
-                                'completed': False
-                            }]
-                    
-                    self.processes.append(process)
-                    
-                except ValueError as e:
-                    raise ValueError(f"Invalid data in row {reader.line_num}: {e}")
-                    
-            # Sort processes by arrival time
-            self.processes.sort(key=lambda p: p.arrival_time)
-            
-            # Update display
-            self.update_process_table()
-            self.log_event(f"Imported {len(self.processes)} processes from CSV")
+        self.processes[:] = load_csv(filename)
+
+        # Update display
+        self.update_process_table()
+        self.log_event(f"Imported {len(self.processes)} processes from CSV")
 
     def import_from_json(self, filename: str):
         """Import processes from JSON file"""
-        with open(filename, 'r') as file:
-            try:
-                data = json.load(file)
-            except json.JSONDecodeError:
-                raise ValueError("Invalid JSON format")
-                
-            if not isinstance(data, list):
-                raise ValueError("JSON file must contain a list of processes")
-                
-            # Clear existing processes
-            self.processes.clear()
-            
-            # Read processes
-            for item in data:
-                # Validate required fields
-                required_fields = {'pid', 'arrival_time', 'burst_time'}
-                if not required_fields.issubset(item.keys()):
-                    missing = required_fields - set(item.keys())
-                    raise ValueError(f"Missing required fields: {missing}")
-                    
-                try:
-                    process = Process(
-                        pid=int(item['pid']),
-                        arrival_time=int(item['arrival_time']),
-                        burst_time=int(item['burst_time']),
-                        priority=int(item.get('priority', 0))
-                    )
-                    
-                    # Add I/O operations if present
-                    if 'io_operations' in item:
-                        io_ops = item['io_operations']
-                        if isinstance(io_ops, list):
-                            process.io_operations = [
-                                {
-                                    'start_time': int(op['start_time']),
-                                    'duration': int(op['duration']),
-                                    'completed': False
-                                }
-                                for op in io_ops
-                                if 'start_time' in op and 'duration' in op
-                            ]
-                    
-                    self.processes.append(process)
-                    
-                except (ValueError, TypeError) as e:
-                    raise ValueError(f"Invalid data in process {item.get('pid', '?')}: {e}")
-                    
-            # Sort processes by arrival time
-            self.processes.sort(key=lambda p: p.arrival_time)
-            
-            # Update display
-            self.update_process_table()
-            self.log_event(f"Imported {len(self.processes)} processes from JSON")
+        self.processes[:] = load_json(filename)
+
+        # Update display
+        self.update_process_table()
+        self.log_event(f"Imported {len(self.processes)} processes from JSON")
 
     def setup_file_input_fields(self):
         """Setup file import interface"""
@@ -1447,9 +1295,11 @@ class CPUSchedulerGUI:
 
 
     def update_speed(self, value):
-        """Update simulation speed"""
-        self.simulation_speed = float(value)
-        self.log_event(f"Simulation speed updated to {value}x")
+        """Update simulation speed from a speed slider position"""
+        self.simulation_speed = steps_per_second_at(float(value))
+        speed = describe_speed(self.simulation_speed)
+        self.speed_label.config(text=speed)
+        self.log_event(f"Simulation speed updated to {speed}")
 
     def setup_simulation_controls(self, parent):
         """Setup simulation control panel"""
@@ -1461,18 +1311,19 @@ class CPUSchedulerGUI:
         speed_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(speed_frame, text="Speed:").pack(side=tk.LEFT)
+        # Logarithmic, in steps per second; the right end runs unthrottled
         self.speed_scale = ttk.Scale(
             speed_frame,
-            from_=0.1,
-            to=2.0,
+            from_=SPEED_SLIDER_MIN,
+            to=SPEED_SLIDER_MAX,
             orient=tk.HORIZONTAL,
-            value=1.0,
+            value=SPEED_SLIDER_MIN,
             command=self.update_speed
         )
         self.speed_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
         # Current speed label
-        self.speed_label = ttk.Label(speed_frame, text="1.0x")
+        self.speed_label = ttk.Label(speed_frame, text=describe_speed(DEFAULT_STEPS_PER_SECOND))
         self.speed_label.pack(side=tk.RIGHT)
         
         # Control Buttons
@@ -1507,6 +1358,18 @@ class CPUSchedulerGUI:
             command=self.compare_all_schedulers
         ).pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="Save Checkpoint",
+            command=self.save_checkpoint_file
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Load Checkpoint",
+            command=self.load_checkpoint_file
+        ).pack(side=tk.LEFT, padx=5)
+
     def start_simulation(self):
         """Start or resume simulation"""
         if not self.processes:
@@ -1531,6 +1394,7 @@ class CPUSchedulerGUI:
     def pause_simulation(self):
         """Pause simulation"""
         self.is_running = False
+        self.stop_worker()
 
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED)
@@ -1541,6 +1405,7 @@ class CPUSchedulerGUI:
         # Reset simulation variables
         self.current_time = 0
         self.is_running = False
+        self.stop_worker()
         
         # Reset scheduler
         if hasattr(self, 'current_scheduler'):
@@ -1551,6 +1416,7 @@ class CPUSchedulerGUI:
             process.state = ProcessState.NEW
             process.remaining_time = process.burst_time
             process.waiting_time = 0
+            process.ready_since = None
             process.turnaround_time = 0
             process.start_time = None
             process.completion_time = None
@@ -1558,12 +1424,13 @@ class CPUSchedulerGUI:
             if hasattr(process, 'io_operations'):
                 for io_op in process.io_operations:
                     io_op['completed'] = False
+                    io_op.pop('started_at', None)
         
         # Reset UI state
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED)
-        self.speed_scale.set(1.0)
-        self.simulation_speed = 1.0
+        self.speed_scale.set(SPEED_SLIDER_MIN)
+        self.simulation_speed = DEFAULT_STEPS_PER_SECOND
         
         # Update displays
         self.update_process_table()
@@ -1574,8 +1441,58 @@ class CPUSchedulerGUI:
             
         self.log_event("Simulation reset")
 
+    def save_checkpoint_file(self):
+        """Save the running simulation to a file it can be resumed from"""
+        if not hasattr(self, 'current_scheduler'):
+            messagebox.showwarning("Warning", "Start a simulation first")
+            return
+        if self.is_running:
+            # The scheduler must not step while it is saved
+            self.pause_simulation()
+
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".ckpt",
+            filetypes=[("Checkpoint files", "*.ckpt"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            save_checkpoint(self.current_scheduler, filename)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not save checkpoint: {e}")
+            return
+        self.log_event(f"Checkpoint saved at t={self.current_scheduler.current_time}: {filename}")
+
+    def load_checkpoint_file(self):
+        """Replace the current simulation with one restored from a file"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("Checkpoint files", "*.ckpt"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            scheduler = load_checkpoint(filename)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not load checkpoint: {e}")
+            return
+
+        self.is_running = False
+        self.stop_worker()
+        self.current_scheduler = scheduler
+        live = {id(p) for p in scheduler.processes}
+        self.processes = scheduler.processes + [
+            p for p in scheduler.completed_processes if id(p) not in live
+        ]
+        self.scheduler_var.set(scheduler_type_of(scheduler))
+        self.current_time = scheduler.current_time
+
+        self.start_button.config(state=tk.NORMAL)
+        self.pause_button.config(state=tk.DISABLED)
+        self.update_visualization()
+        self.log_event(f"Checkpoint loaded at t={scheduler.current_time}: {filename}")
+
     def run_simulation(self):
-        """Main simulation loop"""
+        """Start the simulation worker and the display loop"""
         if not self.is_running:
             return
         
@@ -1590,24 +1507,84 @@ class CPUSchedulerGUI:
                 
             self.log_event(f"Started {scheduler_type} scheduler")
         
-        # Run one simulation step
-        if self.current_scheduler.run_step():
-            # Update displays
+        # The scheduler runs on its own thread; Tk only draws the newest
+        # snapshot, so redraws never hold back the simulation
+        worker = SimulationWorker(
+            self.current_scheduler,
+            self.processes,
+            steps_per_second=lambda: self.simulation_speed,
+        )
+        # The scheduler starts and completes I/O itself, only log it
+        self.current_scheduler.io_listener = lambda process, started: self.log_io_event(
+            process, started, worker.post_event
+        )
+        # Something to draw before the first step completes
+        worker.publish()
+        self.simulation_worker = worker
+        worker.start()
+        self.render_frame()
+
+    def render_frame(self):
+        """Draw the latest simulation snapshot, at most once per frame"""
+        worker = self.simulation_worker
+        if worker is None:
+            return
+        
+        for message in worker.drain_events():
+            self.log_event(message)
+        
+        snapshot = worker.latest
+        if snapshot is not None and snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            self.current_time = snapshot.time
             self.update_visualization()
-            
-            # Handle I/O operations
-            self.handle_io_operations()
-            
-            # Schedule next update
-            delay = int(1000 / self.simulation_speed)
-            self.root.after(delay, self.run_simulation)
-        else:
+        
+        if snapshot is not None and snapshot.finished:
             # Simulation completed
+            self.simulation_worker = None
             self.is_running = False
             self.start_button.config(state=tk.NORMAL)
             self.pause_button.config(state=tk.DISABLED)
+            if worker.error is not None:
+                self.log_event(f"Simulation error: {worker.error}")
             self.generate_final_report()
             self.log_event("Simulation completed")
+        elif self.is_running:
+            self.root.after(FRAME_INTERVAL_MS, self.render_frame)
+
+    def stop_worker(self):
+        """Stop the simulation thread and wait for the current step"""
+        worker = self.simulation_worker
+        if worker is not None:
+            self.simulation_worker = None
+            worker.stop()
+            for message in worker.drain_events():
+                self.log_event(message)
+
+    def displayed_processes(self):
+        """Processes to draw: the latest snapshot while the worker owns them"""
+        if self.simulation_worker is not None:
+            if self.snapshot is not None:
+                return self.snapshot.processes
+            return self.processes
+        # Waiting time is accounted when a process leaves READY; bring the
+        # live processes up to date, as snapshots do for the worker
+        scheduler = getattr(self, 'current_scheduler', None)
+        if scheduler is not None:
+            scheduler.update_waiting_times()
+        return self.processes
+
+    def displayed_metrics(self):
+        """Online metrics matching displayed_processes, if enabled"""
+        if self.simulation_worker is not None and self.snapshot is not None:
+            return self.snapshot.metrics
+        return getattr(getattr(self, 'current_scheduler', None), 'metrics', None)
+
+    def displayed_trace(self):
+        """Execution trace matching displayed_processes, if recorded"""
+        if self.simulation_worker is not None and self.snapshot is not None:
+            return self.snapshot.trace
+        return getattr(getattr(self, 'current_scheduler', None), 'trace', None)
 
 
     def create_scheduler(self, scheduler_type: str):
@@ -1631,40 +1608,11 @@ class CPUSchedulerGUI:
             if context_switch < 0:
                 raise ValueError("Context switch overhead không thể âm")
 
-            if scheduler_type == 'FCFS':
-                scheduler = FCFSScheduler()
-
-            elif scheduler_type == 'SJF':
-                scheduler = SJFScheduler()
-
-            elif scheduler_type == 'Round Robin':
-                scheduler = RoundRobinScheduler(time_quantum=quantum)
-
-            elif scheduler_type == 'Priority (Non-preemptive)':
-                scheduler = PriorityScheduler(preemptive=False)
-
-            elif scheduler_type == 'Priority (Preemptive)':
-                scheduler = PriorityScheduler(preemptive=True)
-
-            elif scheduler_type == 'Multi-Level Queue':
-                scheduler = MLFQScheduler(
-                    num_queues=3,  # Có thể cấu hình
-                    base_quantum=quantum
-                )
-
-            elif scheduler_type == 'Rate Monotonic':
-                scheduler = RateMonotonicScheduler()
-
-            elif scheduler_type == 'Earliest Deadline First':
-                scheduler = EarliestDeadlineFirstScheduler()
-
-            else:
-                raise ValueError(f"Loại scheduler không hợp lệ: {scheduler_type}")
-
-            # Cấu hình chung nếu có
-            for attr in ['context_switch_penalty', 'context_switch_overhead']:
-                if hasattr(scheduler, attr):
-                    setattr(scheduler, attr, context_switch)
+            scheduler = create_scheduler(scheduler_type, quantum, context_switch)
+            # Real execution segments for the Gantt chart
+            scheduler.enable_trace()
+            # Running totals and latency percentiles for the metrics panel
+            scheduler.enable_metrics()
 
             self.log_event(f"Tạo scheduler {scheduler_type} (Quantum={quantum}, CS={context_switch})")
             return scheduler
@@ -1838,6 +1786,10 @@ class CPUSchedulerGUI:
             self.averages_table.heading(col, text=col)
             self.averages_table.column(col, width=150)
         
+        # Rows are (metric, value) pairs keyed by metric name
+        self.averages_view = VirtualTable(
+            self.averages_table, lambda row: row, key=lambda row: row[0], window=3
+        )
         self.averages_table.pack(fill=tk.X)
 
     def setup_process_details(self, parent):
@@ -1863,19 +1815,17 @@ class CPUSchedulerGUI:
             self.details_table.heading(col, text=col)
             self.details_table.column(col, width=100)
         
-        scrollbar = ttk.Scrollbar(
-            details_frame,
-            orient=tk.VERTICAL,
-            command=self.details_table.yview
+        scrollbar = ttk.Scrollbar(details_frame, orient=tk.VERTICAL)
+        self.details_view = self.create_virtual_table(
+            self.details_table, scrollbar, self.process_details_row, key=lambda p: p.pid
         )
-        self.details_table.configure(yscrollcommand=scrollbar.set)
         
         self.details_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
     def update_metrics_display(self):
         """Cập nhật tất cả các số liệu hiệu năng"""
-        if not self.processes:
+        if not self.displayed_processes():
             self.reset_metrics_display()
             return
 
@@ -1903,80 +1853,85 @@ class CPUSchedulerGUI:
     def calculate_current_metrics(self):
         """Calculate current performance metrics"""
         total_time = self.current_time if self.current_time > 0 else 1
-        completed = [p for p in self.processes if p.is_completed()]
+        processes = self.displayed_processes()
+        totals = self.displayed_metrics()
         
         # Calculate metrics
-        total_burst = sum(p.burst_time for p in self.processes)
-        total_waiting = sum(p.waiting_time for p in self.processes)
-        total_turnaround = sum(
-            (p.completion_time - p.arrival_time)
-            for p in completed if p.completion_time is not None
-        )
-        total_response = sum(
-            (p.start_time - p.arrival_time)
-            for p in self.processes if p.start_time is not None
-        )
-        total_context_switches = sum(p.context_switches for p in self.processes)
+        total_burst = sum(p.burst_time for p in processes)
+        total_waiting = sum(p.waiting_time for p in processes)
+        if totals is not None:
+            # Kept up to date by the scheduler on dispatch and completion
+            n_completed = totals.count
+            total_turnaround = totals.turnaround
+            total_response = totals.response
+        else:
+            completed = [p for p in processes if p.is_completed()]
+            n_completed = len(completed)
+            total_turnaround = sum(
+                (p.completion_time - p.arrival_time)
+                for p in completed if p.completion_time is not None
+            )
+            total_response = sum(
+                (p.start_time - p.arrival_time)
+                for p in processes if p.start_time is not None
+            )
+        total_context_switches = sum(p.context_switches for p in processes)
         
         # Calculate averages
-        n_processes = len(self.processes)
-        n_completed = len(completed)
+        n_processes = len(processes)
         
-        return {
-            'cpu_utilization': (total_burst - sum(p.remaining_time for p in self.processes)) / total_time * 100,
+        metrics = {
+            'cpu_utilization': (total_burst - sum(p.remaining_time for p in processes)) / total_time * 100,
             'throughput': n_completed / total_time if n_completed > 0 else 0,
             'avg_waiting': total_waiting / n_processes if n_processes > 0 else 0,
             'avg_turnaround': total_turnaround / n_completed if n_completed > 0 else 0,
             'avg_response': total_response / n_processes if n_processes > 0 else 0,
             'context_switches': total_context_switches
         }
+        if totals is not None:
+            # Tail latencies of finished (response: dispatched) processes
+            metrics.update(totals.percentiles())
+        return metrics
 
     def update_averages_table(self, metrics):
         """Update the averages metrics table"""
-        # Clear current items
-        for item in self.averages_table.get_children():
-            self.averages_table.delete(item)
-        
-        # Add metrics
-        self.averages_table.insert("", "end", values=(
-            "Average Waiting Time",
-            f"{metrics['avg_waiting']:.2f}"
-        ))
-        self.averages_table.insert("", "end", values=(
-            "Average Turnaround Time",
-            f"{metrics['avg_turnaround']:.2f}"
-        ))
-        self.averages_table.insert("", "end", values=(
-            "Average Response Time",
-            f"{metrics['avg_response']:.2f}"
-        ))
+        # Rows are updated in place, only changed values reach Tk
+        rows = [
+            ("Average Waiting Time", f"{metrics['avg_waiting']:.2f}"),
+            ("Average Turnaround Time", f"{metrics['avg_turnaround']:.2f}"),
+            ("Average Response Time", f"{metrics['avg_response']:.2f}"),
+        ]
+        for name in ('waiting_time', 'turnaround_time', 'response_time'):
+            for q in PERCENTILES:
+                key = f"p{q}_{name}"
+                if key in metrics:
+                    label = name.replace('_', ' ').title()
+                    rows.append((f"P{q} {label}", f"{metrics[key]:.2f}"))
+        self.averages_view.set_rows(rows)
 
     def update_process_details(self):
         """Update the process details table"""
-        # Clear current items
-        for item in self.details_table.get_children():
-            self.details_table.delete(item)
-        
-        # Add process details
-        for process in self.processes:
-            turnaround_time = (
-                process.completion_time - process.arrival_time
-                if process.completion_time is not None
-                else "-"
-            )
-            response_time = (
-                process.start_time - process.arrival_time
-                if process.start_time is not None
-                else "-"
-            )
-            
-            self.details_table.insert("", "end", values=(
-                process.pid,
-                process.burst_time,
-                process.waiting_time,
-                turnaround_time,
-                response_time
-            ))
+        self.details_view.set_rows(self.displayed_processes())
+
+    def process_details_row(self, process):
+        """Cell values of a process in the details table"""
+        turnaround_time = (
+            process.completion_time - process.arrival_time
+            if process.completion_time is not None
+            else "-"
+        )
+        response_time = (
+            process.start_time - process.arrival_time
+            if process.start_time is not None
+            else "-"
+        )
+        return (
+            process.pid,
+            process.burst_time,
+            process.waiting_time,
+            turnaround_time,
+            response_time
+        )
 
     def reset_metrics_display(self):
         """Reset all metrics displays to initial state"""
@@ -1986,14 +1941,16 @@ class CPUSchedulerGUI:
         self.context_switch_label.config(text="0")
         
         # Clear tables
-        for table in [self.averages_table, self.details_table]:
-            for item in table.get_children():
-                table.delete(item)
+        for view in [self.averages_view, self.details_view]:
+            view.clear()
 
 def main():
     root = tk.Tk()
     app = CPUSchedulerGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,376 @@
+# src/cli.py
+"""
+Headless command-line runner
+
+    python -m src.cli run workload.csv -s fcfs -s rr --quantum 4 -o metrics.csv
+    python -m src.cli sweep workload.csv -s rr -p time_quantum=1:16 -o sweep.csv
+    python -m src.cli generate workload.npy -n 1000000 --arrivals mmpp --bursts pareto --seed 7
+    python -m src.cli bench -s rr -n 1000 -n 100000 --baseline bench.json
+
+Only uses the simulation core, so it runs without a display (no tkinter
+or matplotlib imports).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+from .schedulers.factory import SCHEDULER_ALIASES, SCHEDULER_TYPES, create_scheduler, resolve_scheduler_type
+from .simulation.benchmark import (
+    DEFAULT_BURST_SCALES, DEFAULT_SIZES, DEFAULT_SLOPE_TOLERANCE, DEFAULT_TIME_LIMIT,
+    DEFAULT_TOLERANCE, benchmark_report, find_regressions, load_baseline, run_benchmark,
+    save_baseline,
+)
+from .simulation.cache import DEFAULT_MAX_BYTES, ResultCache, default_cache_dir, workload_digest
+from .simulation.comparison import run_processes, run_stream
+from .simulation.sweep import SWEEP_PARAMETERS, check_parameters, sweep
+from .workload.loader import load_workload
+from .workload.binary import convert_workload, save_binary
+from .workload.generator import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, generate_workload
+from .workload.stream import stream_workload
+
+OUTPUT_FORMATS = ('json', 'csv')
+BOOLEAN_VALUES = {'true': True, 'yes': True, '1': True,
+                  'false': False, 'no': False, '0': False}
+
+
+def write_rows(rows: Iterable[Dict], stream: IO[str], output_format: str) -> None:
+    """
+    Write result rows as a JSON list or as CSV with a header
+
+    Rows are written and flushed one at a time, so results of long runs
+    show up as soon as they are produced.
+
+    Args:
+        rows: Dicts sharing the same keys
+        stream: Text stream to write to
+        output_format: 'json' or 'csv'
+    """
+    if output_format == 'json':
+        # Same text as json.dump(list(rows), stream, indent=2)
+        count = 0
+        stream.write('[')
+        for row in rows:
+            stream.write(',\n  ' if count else '\n  ')
+            stream.write(json.dumps(row, indent=2).replace('\n', '\n  '))
+            stream.flush()
+            count += 1
+        stream.write('\n]\n' if count else ']\n')
+        return
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(stream, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        stream.flush()
+
+
+def output_format_for(path: Optional[str], requested: Optional[str]) -> str:
+    """Pick the output format from the flag or the output file extension"""
+    if requested:
+        return requested
+    if path and os.path.splitext(path)[1].lower() == '.csv':
+        return 'csv'
+    return 'json'
+
+
+def result_cache(args: argparse.Namespace) -> Optional[ResultCache]:
+    """Result cache selected on the command line, if any"""
+    if args.cache is None:
+        return None
+    return ResultCache(args.cache or None, max_bytes=args.cache_size * 1024 * 1024)
+
+
+def run_command(args: argparse.Namespace) -> List[Dict]:
+    """Run the selected schedulers over the workload and return result rows"""
+    scheduler_types = [resolve_scheduler_type(name) for name in args.scheduler or SCHEDULER_TYPES]
+
+    cache = result_cache(args)
+    digest = workload_digest(args.workload) if cache is not None else None
+    rows = []
+    for scheduler_type in scheduler_types:
+        key = hit = None
+        if cache is not None:
+            scheduler = create_scheduler(scheduler_type, args.quantum, args.context_switch)
+            key = cache.key(args.workload, scheduler, digest,
+                            event_driven=not args.tick, streamed=args.stream)
+            hit = cache.get(key)
+        if hit is not None:
+            metrics = hit.metrics
+        else:
+            # Each run gets freshly loaded processes
+            run = run_stream if args.stream else run_processes
+            source = stream_workload(args.workload) if args.stream else load_workload(args.workload)
+            metrics = run(
+                scheduler_type,
+                source,
+                quantum=args.quantum,
+                context_switch=args.context_switch,
+                event_driven=not args.tick
+            )
+            if cache is not None:
+                cache.put(key, metrics)
+        row = {
+            'scheduler': scheduler_type,
+            'quantum': args.quantum,
+            'context_switch': args.context_switch,
+        }
+        row.update(metrics)
+        rows.append(row)
+    return rows
+
+
+def parse_values(name: str, text: str) -> List:
+    """
+    Parse the candidate values of a sweep parameter
+
+    Values are comma separated; integers also accept inclusive ranges
+    `start:stop` or `start:stop:step`, `preemptive` takes true/false and
+    `boost_interval` takes none.
+    """
+    values = []
+    for item in text.split(','):
+        item = item.strip()
+        if name == 'preemptive':
+            if item.lower() not in BOOLEAN_VALUES:
+                raise ValueError(f"Invalid value for preemptive: {item}")
+            values.append(BOOLEAN_VALUES[item.lower()])
+        elif name == 'boost_interval' and item.lower() == 'none':
+            values.append(None)
+        elif ':' in item:
+            bounds = [int(bound) for bound in item.split(':')]
+            if len(bounds) not in (2, 3) or (len(bounds) == 3 and bounds[2] <= 0):
+                raise ValueError(f"Invalid range for {name}: {item}")
+            values.extend(range(bounds[0], bounds[1] + 1, *bounds[2:]))
+        else:
+            values.append(int(item))
+    return values
+
+
+def parse_grid(parameters: Optional[List[str]]) -> Dict[str, List]:
+    """Build a sweep grid from NAME=VALUES arguments"""
+    grid = {}
+    for parameter in parameters or []:
+        name, separator, text = parameter.partition('=')
+        name = name.strip().replace('-', '_')
+        if not separator or not text:
+            raise ValueError(f"Expected NAME=VALUES, got: {parameter}")
+        check_parameters([name])
+        grid[name] = parse_values(name, text)
+    return grid
+
+
+def sweep_command(args: argparse.Namespace) -> Iterator[Dict]:
+    """Run the selected schedulers over a parameter grid, yielding rows as they finish"""
+    scheduler_types = [resolve_scheduler_type(name) for name in args.scheduler or SCHEDULER_TYPES]
+    grid = parse_grid(args.param)
+    return sweep(args.workload, grid, scheduler_types,
+                 event_driven=not args.tick, max_workers=args.jobs,
+                 cache=result_cache(args))
+
+
+def convert_command(args: argparse.Namespace) -> None:
+    """Convert a text workload to the binary format"""
+    count = convert_workload(args.source, args.destination)
+    print(f"Wrote {count} records to {args.destination}", file=sys.stderr)
+
+
+def generate_command(args: argparse.Namespace) -> None:
+    """Write a random workload in the binary format"""
+    workload = generate_workload(
+        args.count, seed=args.seed, arrivals=args.arrivals, arrival_rate=args.rate,
+        bursts=args.bursts, mean_burst=args.mean_burst, max_burst=args.max_burst,
+        max_priority=args.max_priority, io_probability=args.io_probability,
+        io_mean=args.io_mean,
+    )
+    save_binary(args.destination, workload.records())
+    print(f"Wrote {len(workload)} records to {args.destination}", file=sys.stderr)
+
+
+def bench_command(args: argparse.Namespace) -> Iterator[Dict]:
+    """Benchmark schedulers, yielding case results; sets args.exit_code on regressions"""
+    scheduler_types = [resolve_scheduler_type(name) for name in args.scheduler or SCHEDULER_TYPES]
+    # Read the baseline first, so a bad path fails before hours of benchmarking
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    settings = {'seed': args.seed, 'event_driven': not args.tick}
+
+    results = []
+    for result in run_benchmark(scheduler_types, args.size or DEFAULT_SIZES,
+                                args.burst_scale or DEFAULT_BURST_SCALES,
+                                seed=args.seed, event_driven=not args.tick,
+                                time_limit=args.time_limit or None):
+        results.append(result)
+        print(f"{result['scheduler']} n={result['processes']} "
+              f"burst x{result['burst_scale']}: {result['wall_time']:.3f}s, "
+              f"{result['ticks_per_second']:.0f} ticks/s", file=sys.stderr)
+        yield result
+
+    report = benchmark_report(results, settings)
+    for slope in report['slopes']:
+        print(f"{slope['scheduler']} burst x{slope['burst_scale']}: "
+              f"slope {slope['slope']:.2f}", file=sys.stderr)
+    if args.save:
+        save_baseline(report, args.save)
+    if baseline is not None:
+        if baseline['machine'] != report['machine']:
+            print("warning: baseline was recorded on a different machine", file=sys.stderr)
+        regressions = find_regressions(report, baseline, args.tolerance, args.slope_tolerance)
+        for regression in regressions:
+            size = '' if regression['processes'] is None else f" n={regression['processes']}"
+            print(f"REGRESSION {regression['scheduler']}{size} burst x{regression['burst_scale']}: "
+                  f"{regression['metric']} {regression['baseline']:.3f} -> "
+                  f"{regression['current']:.3f}", file=sys.stderr)
+        if regressions:
+            args.exit_code = 1
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options selecting the result cache"""
+    parser.add_argument(
+        '--cache', nargs='?', const='', metavar='DIR',
+        help='Reuse results of identical earlier runs, stored in DIR '
+             '(default: ' + default_cache_dir() + ')'
+    )
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        metavar='MB', help='Cache size limit in MB (default: %(default)s)')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='Run CPU scheduling simulations without the GUI'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Simulate a workload file and report metrics')
+    run.add_argument('workload', help='Workload file (.csv, .json, binary .npy or, with --stream, '
+                                      '.ndjson; same schema as the GUI import)')
+    run.add_argument(
+        '-s', '--scheduler', action='append',
+        help='Scheduler to run, may be repeated (default: all). Short names: '
+             + ', '.join(SCHEDULER_ALIASES)
+    )
+    run.add_argument('-q', '--quantum', type=int, default=2,
+                     help='Time quantum for Round Robin and MLFQ (default: 2)')
+    run.add_argument('-c', '--context-switch', type=int, default=0,
+                     help='Context switch overhead (default: 0, as in sweep)')
+    run.add_argument('-f', '--format', choices=OUTPUT_FORMATS,
+                     help='Output format (default: from output extension, else json)')
+    run.add_argument('-o', '--output', help='Output file (default: stdout)')
+    run.add_argument('--stream', action='store_true',
+                     help='Read the (arrival-ordered) workload lazily with bounded memory')
+    run.add_argument('--tick', action='store_true',
+                     help='Step one time unit at a time instead of event to event')
+    add_cache_arguments(run)
+    run.set_defaults(handler=run_command)
+
+    sweep_parser = commands.add_parser(
+        'sweep', help='Run schedulers over a grid of parameters in parallel'
+    )
+    sweep_parser.add_argument('workload', help='Workload file (.csv, .json or binary .npy)')
+    sweep_parser.add_argument(
+        '-s', '--scheduler', action='append',
+        help='Scheduler to sweep, may be repeated (default: all)'
+    )
+    sweep_parser.add_argument(
+        '-p', '--param', action='append', metavar='NAME=VALUES',
+        help='Parameter values to try, may be repeated, e.g. time_quantum=1:8 or '
+             'preemptive=true,false. Every combination is run. Names: '
+             + ', '.join(SWEEP_PARAMETERS)
+    )
+    sweep_parser.add_argument('-j', '--jobs', type=int,
+                              help='Worker processes (default: one per CPU)')
+    sweep_parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS,
+                              help='Output format (default: from output extension, else json)')
+    sweep_parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    sweep_parser.add_argument('--tick', action='store_true',
+                              help='Step one time unit at a time instead of event to event')
+    add_cache_arguments(sweep_parser)
+    sweep_parser.set_defaults(handler=sweep_command)
+
+    convert = commands.add_parser('convert', help='Convert a CSV/JSON/NDJSON workload to binary (.npy)')
+    convert.add_argument('source', help='Workload file (.csv, .json, .ndjson)')
+    convert.add_argument('destination', help='Binary workload file to write (.npy)')
+    convert.set_defaults(handler=convert_command)
+
+    generate = commands.add_parser('generate', help='Write a random workload to binary (.npy)')
+    generate.add_argument('destination', help='Binary workload file to write (.npy)')
+    generate.add_argument('-n', '--count', type=int, default=1000,
+                          help='Number of processes (default: %(default)s)')
+    generate.add_argument('--seed', type=int, help='Random seed (default: fresh entropy)')
+    generate.add_argument('--arrivals', choices=ARRIVAL_PROCESSES, default='poisson',
+                          help='Arrival process (default: %(default)s)')
+    generate.add_argument('--rate', type=float, default=1.0,
+                          help='Mean arrivals per time unit (default: %(default)s)')
+    generate.add_argument('--bursts', choices=BURST_DISTRIBUTIONS, default='lognormal',
+                          help='Burst time distribution (default: %(default)s)')
+    generate.add_argument('--mean-burst', type=float, default=5.0,
+                          help='Mean burst time (default: %(default)s)')
+    generate.add_argument('--max-burst', type=int, help='Cap on burst times')
+    generate.add_argument('--max-priority', type=int, default=5,
+                          help='Priorities are drawn from 1..N (default: %(default)s)')
+    generate.add_argument('--io-probability', type=float, default=0.0,
+                          help='Chance (0 to 1) that a process has an I/O operation '
+                               '(default: %(default)s)')
+    generate.add_argument('--io-mean', type=float, default=5.0,
+                          help='Mean I/O duration (default: %(default)s)')
+    generate.set_defaults(handler=generate_command)
+
+    bench = commands.add_parser(
+        'bench', help='Measure how schedulers scale with the number of processes'
+    )
+    bench.add_argument('-s', '--scheduler', action='append',
+                       help='Scheduler to benchmark, may be repeated (default: all)')
+    bench.add_argument('-n', '--size', type=int, action='append',
+                       help='Process count, may be repeated (default: '
+                            + ', '.join(map(str, DEFAULT_SIZES)) + ')')
+    bench.add_argument('-b', '--burst-scale', type=float, action='append',
+                       help='Mean burst multiplier, may be repeated (default: '
+                            + ', '.join(map(str, DEFAULT_BURST_SCALES)) + ')')
+    bench.add_argument('--seed', type=int, default=0, help='Workload seed (default: 0)')
+    bench.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT,
+                       help='Skip larger sizes once a case takes this many seconds, '
+                            '0 for no limit (default: %(default)s)')
+    bench.add_argument('--save', metavar='PATH', help='Save the results as a JSON baseline')
+    bench.add_argument('--baseline', metavar='PATH',
+                       help='Compare against a saved baseline; exit with 1 on regressions')
+    bench.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                       help='Relative slowdown or memory growth flagged (default: %(default)s)')
+    bench.add_argument('--slope-tolerance', type=float, default=DEFAULT_SLOPE_TOLERANCE,
+                       help='Increase of the scaling slope flagged (default: %(default)s)')
+    bench.add_argument('-f', '--format', choices=OUTPUT_FORMATS,
+                       help='Output format (default: from output extension, else json)')
+    bench.add_argument('-o', '--output', help='Output file (default: stdout)')
+    bench.add_argument('--tick', action='store_true',
+                       help='Step one time unit at a time instead of event to event')
+    bench.set_defaults(handler=bench_command)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        rows = args.handler(args)
+        if rows is None:
+            return 0
+
+        output_format = output_format_for(args.output, args.format)
+        if args.output:
+            with open(args.output, 'w', newline='') as stream:
+                write_rows(rows, stream, output_format)
+        else:
+            write_rows(rows, sys.stdout, output_format)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return getattr(args, 'exit_code', 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
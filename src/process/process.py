@@ -1,12 +1,18 @@
 # src/process/process.py
 from dataclasses import dataclass, field
-from typing import Optional
-from datetime import datetime
+from typing import Callable, ClassVar, Dict, List, Optional
 from .process_state import ProcessState
 
+# Ways of stamping last_state_change on a state transition
+TIMESTAMP_SIMULATED = "simulated"  # Scheduler clock, set by the scheduler
+TIMESTAMP_OFF = "off"              # Not recorded
+
 @dataclass
 class Process:
     """Represents a process in the system"""
+    # Shared by all processes, see TIMESTAMP_* above
+    timestamp_mode: ClassVar[str] = TIMESTAMP_SIMULATED
+    
     # Core attributes
     pid: int
     arrival_time: int
@@ -26,7 +32,11 @@ class Process:
     # Timestamps
     start_time: Optional[int] = field(default=None)
     completion_time: Optional[int] = field(default=None)
-    last_state_change: datetime = field(default_factory=datetime.now)
+    ready_since: Optional[int] = field(default=None)  # Scheduler wait clock on entering READY
+    last_state_change: Optional[int] = field(default=None)  # Simulated time of the last transition
+    
+    # Called with (process, old_state) after every state change
+    state_listener: Optional[Callable] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize after creation"""
@@ -35,10 +45,12 @@ class Process:
     def update_state(self, new_state: ProcessState) -> None:
         """Update process state"""
         if self.state != new_state:
+            old_state = self.state
             self.state = new_state
-            self.last_state_change = datetime.now()
             if new_state == ProcessState.RUNNING:
                 self.context_switches += 1  # Tăng số context switches
+            if self.state_listener is not None:
+                self.state_listener(self, old_state)
     
     def execute(self, time_quantum: int) -> int:
         """Execute process for given time quantum"""
@@ -55,4 +67,40 @@ class Process:
     
     def is_completed(self) -> bool:
         """Check if process has completed"""
-        return self.state == ProcessState.TERMINATED
\ No newline at end of file
+        return self.state == ProcessState.TERMINATED
+
+
+# Attributes saved by processes_to_columns, besides state and I/O operations
+CHECKPOINT_FIELDS = (
+    'pid', 'arrival_time', 'burst_time', 'priority', 'remaining_time',
+    'waiting_time', 'turnaround_time', 'response_time', 'context_switches',
+    'start_time', 'completion_time', 'ready_since',
+)
+
+
+def processes_to_columns(processes: List[Process]) -> Dict[str, list]:
+    """Save processes as JSON-serializable columns"""
+    columns = {name: [getattr(p, name) for p in processes] for name in CHECKPOINT_FIELDS}
+    columns['state'] = [p.state.name for p in processes]
+    columns['last_state_change'] = [p.last_state_change for p in processes]
+    columns['io_operations'] = [
+        [dict(io_op) for io_op in p.io_operations] if hasattr(p, 'io_operations') else None
+        for p in processes
+    ]
+    return columns
+
+
+def processes_from_columns(columns: Dict[str, list]) -> List[Process]:
+    """Rebuild processes saved with processes_to_columns (without listeners)"""
+    processes = []
+    for i in range(len(columns['pid'])):
+        process = Process(pid=columns['pid'][i], arrival_time=columns['arrival_time'][i],
+                          burst_time=columns['burst_time'][i], priority=columns['priority'][i],
+                          state=ProcessState[columns['state'][i]])
+        for name in CHECKPOINT_FIELDS[4:]:
+            setattr(process, name, columns[name][i])
+        process.last_state_change = columns['last_state_change'][i]
+        if columns['io_operations'][i] is not None:
+            process.io_operations = columns['io_operations'][i]
+        processes.append(process)
+    return processes
@@ -0,0 +1,167 @@
+# src/process/process_table.py
+from typing import Dict, Iterator, List, Optional, Sequence
+import numpy as np
+from .process import Process
+from .process_state import ProcessState
+
+# Integer codes used for the state column
+STATES: List[ProcessState] = list(ProcessState)
+STATE_CODES: Dict[ProcessState, int] = {state: code for code, state in enumerate(STATES)}
+
+# Marks an unset optional time (start_time, completion_time, ready_since)
+MISSING = -1
+
+
+def _column(name: str, optional: bool = False) -> property:
+    """Property that reads and writes one row of a ProcessTable column"""
+    def getter(self):
+        value = int(getattr(self._table, name)[self._index])
+        if optional and value == MISSING:
+            return None
+        return value
+
+    def setter(self, value):
+        if value is None:
+            value = MISSING
+        getattr(self._table, name)[self._index] = value
+
+    return property(getter, setter)
+
+
+class ProcessView(Process):
+    """
+    Process-compatible view of one row of a ProcessTable
+
+    Reads and writes go straight to the table columns, so schedulers,
+    SchedulingMetrics and GanttChart can use views like regular processes.
+    Attributes without a column (I/O operations, listeners) live on the view.
+    """
+
+    pid = _column('pid')
+    arrival_time = _column('arrival_time')
+    burst_time = _column('burst_time')
+    priority = _column('priority')
+    remaining_time = _column('remaining_time')
+    waiting_time = _column('waiting_time')
+    turnaround_time = _column('turnaround_time')
+    context_switches = _column('context_switches')
+    start_time = _column('start_time', optional=True)
+    completion_time = _column('completion_time', optional=True)
+    ready_since = _column('ready_since', optional=True)
+
+    def __init__(self, table: 'ProcessTable', index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def state(self) -> ProcessState:
+        return STATES[self._table.state[self._index]]
+
+    @state.setter
+    def state(self, value: ProcessState) -> None:
+        self._table.state[self._index] = STATE_CODES[value]
+
+
+class ProcessTable:
+    """
+    Columnar (struct-of-arrays) storage for large process sets
+
+    Every per-process value lives in a typed NumPy array, which keeps memory
+    at a few dozen bytes per process and makes metrics and state scans
+    vectorized. Views returned by indexing or iteration act as Process
+    objects for the existing schedulers.
+    """
+
+    def __init__(self,
+                 pid: Sequence[int],
+                 arrival_time: Sequence[int],
+                 burst_time: Sequence[int],
+                 priority: Optional[Sequence[int]] = None):
+        self.pid = np.asarray(pid, dtype=np.int64)
+        n = len(self.pid)
+        self.arrival_time = np.asarray(arrival_time, dtype=np.int64)
+        self.burst_time = np.asarray(burst_time, dtype=np.int64)
+        if priority is None:
+            self.priority = np.zeros(n, dtype=np.int32)
+        else:
+            self.priority = np.asarray(priority, dtype=np.int32)
+        if not (len(self.arrival_time) == len(self.burst_time) == len(self.priority) == n):
+            raise ValueError("All columns must have the same length")
+
+        self.remaining_time = self.burst_time.copy()
+        self.state = np.full(n, STATE_CODES[ProcessState.NEW], dtype=np.int8)
+        self.waiting_time = np.zeros(n, dtype=np.int64)
+        self.turnaround_time = np.zeros(n, dtype=np.int64)
+        self.context_switches = np.zeros(n, dtype=np.int32)
+        self.start_time = np.full(n, MISSING, dtype=np.int64)
+        self.completion_time = np.full(n, MISSING, dtype=np.int64)
+        self.ready_since = np.full(n, MISSING, dtype=np.int64)
+        self._views: List[Optional[ProcessView]] = [None] * n
+
+    @classmethod
+    def from_processes(cls, processes: Sequence[Process]) -> 'ProcessTable':
+        """Build a table holding the static attributes of existing processes"""
+        return cls(
+            pid=[p.pid for p in processes],
+            arrival_time=[p.arrival_time for p in processes],
+            burst_time=[p.burst_time for p in processes],
+            priority=[p.priority for p in processes],
+        )
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __getitem__(self, index: int) -> ProcessView:
+        """Get the (cached) view of one row"""
+        view = self._views[index]
+        if view is None:
+            view = self._views[index] = ProcessView(self, index)
+        return view
+
+    def __iter__(self) -> Iterator[ProcessView]:
+        return (self[i] for i in range(len(self)))
+
+    def views(self) -> List[ProcessView]:
+        """Get views of all rows as a list"""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the columns"""
+        return sum(
+            column.nbytes for column in (
+                self.pid, self.arrival_time, self.burst_time, self.priority,
+                self.remaining_time, self.state, self.waiting_time,
+                self.turnaround_time, self.context_switches, self.start_time,
+                self.completion_time, self.ready_since,
+            )
+        )
+
+    def count(self, state: ProcessState) -> int:
+        """Count processes in a given state"""
+        return int(np.count_nonzero(self.state == STATE_CODES[state]))
+
+    def is_all_completed(self) -> bool:
+        """Check if every process has terminated"""
+        return self.count(ProcessState.TERMINATED) == len(self)
+
+    def metrics(self, total_time: int) -> Dict[str, float]:
+        """Vectorized equivalent of SchedulingMetrics.calculate_metrics"""
+        if len(self) == 0:
+            return {}
+
+        total_time = max(1, total_time)
+        started = self.start_time != MISSING
+        total_response = int((self.start_time[started] - self.arrival_time[started]).sum())
+        total_burst_time = int(self.burst_time.sum())
+        n_processes = len(self)
+
+        metrics = {
+            "avg_waiting_time": int(self.waiting_time.sum()) / n_processes,
+            "avg_turnaround_time": int(self.turnaround_time.sum()) / n_processes,
+            "avg_response_time": total_response / n_processes,
+            "cpu_utilization": min((total_burst_time / total_time) * 100, 100),
+            "throughput": n_processes / total_time,
+            "context_switches": int(self.context_switches.sum())
+        }
+        return {k: round(v, 2) for k, v in metrics.items()}
@@ -1,18 +1,63 @@
 # src/schedulers/base_scheduler.py
+import heapq
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..process.process import Process
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from ..process.process import (
+    Process, TIMESTAMP_SIMULATED, processes_from_columns, processes_to_columns
+)
 from ..process.process_state import ProcessState
+from .ready_queue import ReadyQueue
+from ..utils.metrics import MetricTotals
+from ..utils.trace import TraceRecorder, REASON_BLOCKED, REASON_COMPLETED, REASON_PREEMPTED, REASON_QUANTUM
 
 class BaseScheduler(ABC):
     """Abstract base class for CPU scheduling algorithms"""
-    
+
+    # Whether an arrival can take the CPU away from the running process
+    preempts_on_arrival: bool = False
+
     def __init__(self):
         self.current_time: int = 0
         self.processes: List[Process] = []
         self.current_process: Optional[Process] = None
         self.completed_processes: List[Process] = []
-        
+        # Event-driven mode jumps the clock to the next event instead of ticking
+        self.event_driven: bool = False
+        # Heap of READY processes for schedulers that select by a key
+        self.ready_heap: Optional[ReadyQueue] = None
+        # Future arrivals as (arrival_time, registration order, process)
+        self.arrival_queue: List[tuple] = []
+        self._registered: int = 0
+        # Clock time during which ready processes do not accrue waiting time
+        self.stalled_time: int = 0
+        # Registered processes that have not terminated yet
+        self.outstanding_processes: int = 0
+        # Running I/O operations as (completion time, start order, process,
+        # I/O operation), so steps need not scan the blocked processes
+        self.io_completions: List[tuple] = []
+        self._io_started: int = 0
+        # Called with (process, started) when an I/O operation starts or ends
+        self.io_listener: Optional[Callable[[Process, bool], None]] = None
+        # Called with (process, old state) after the scheduler has seen a
+        # state change
+        self.state_change_listener: Optional[Callable[[Process, ProcessState], None]] = None
+        # Lazily pulled arrivals (see attach_arrivals)
+        self.arrival_source: Optional[Iterator[Process]] = None
+        self.pending_arrival: Optional[Process] = None
+        self.add_arrival: Optional[Callable[[Process], None]] = None
+        # Processes taken from arrival_source so far, pending_arrival included
+        self.arrivals_consumed: int = 0
+        # When False, finished processes are dropped instead of kept
+        self.retain_completed: bool = True
+        self.completion_listener: Optional[Callable[[Process], None]] = None
+        self._finished_in_list: int = 0
+        # Optional execution segment recorder (see enable_trace)
+        self.trace: Optional[TraceRecorder] = None
+        # Optional online metrics (see enable_metrics)
+        self.metrics: Optional[MetricTotals] = None
+
     def run_step(self) -> bool:
         """
         Execute one step of the scheduling algorithm
@@ -27,51 +72,533 @@ class BaseScheduler(ABC):
                     self.current_process.start_time = self.current_time
                 self.current_process.update_state(ProcessState.RUNNING)
 
+        ticks = self.next_event_delta()
         if self.current_process:
             try:
-                self.current_process.execute(1)
+                self.execute_current(ticks)
 
                 if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time + 1
-                    self.current_process.turnaround_time = (
-                        self.current_process.completion_time -
-                        self.current_process.arrival_time
-                    )
-                    self.completed_processes.append(self.current_process)
+                    self.finish_process(self.current_process, self.current_time + ticks)
                     self.current_process = None
 
             except ValueError as e:
                 print(f"Error: {e}")
 
-        self.update_waiting_times()
-        self.current_time += 1
+        self.advance_clock(ticks)
 
         return not self.is_all_completed()
 
-    
+
+    def enable_metrics(self) -> MetricTotals:
+        """
+        Start accumulating metrics and return the accumulator
+
+        Response time is added on first dispatch and the other times on
+        completion, so metrics and percentiles can be read at any point
+        without a pass over the processes.
+        """
+        self.metrics = MetricTotals()
+        return self.metrics
+
+    def enable_trace(self, capacity: int = 1024) -> TraceRecorder:
+        """Start recording execution segments and return the recorder"""
+        self.trace = TraceRecorder(capacity)
+        return self.trace
+
+    def execute_current(self, ticks: int) -> int:
+        """
+        Run the current process for `ticks` time units from current_time
+
+        Returns:
+            CPU time the process actually used
+        """
+        process = self.current_process
+        time_used = process.execute(ticks)
+        if process.state == ProcessState.TERMINATED:
+            # Finished at the end of the time used, not at the step start
+            self.stamp_transition(process, self.current_time + time_used)
+        if self.trace is not None:
+            self.trace.extend(process.pid, self.current_time, self.current_time + ticks)
+            if process.state == ProcessState.TERMINATED:
+                self.trace.end_segment(REASON_COMPLETED)
+        return time_used
+
     @abstractmethod
     def add_process(self, process: Process) -> None:
         """Add a new process to the scheduler"""
         pass
-    
+
     @abstractmethod
     def get_next_process(self) -> Optional[Process]:
         """Select the next process to execute"""
         pass
-    
-    def update_process_states(self) -> None:
-        """Update states of all processes based on arrival time"""
+
+    def register_process(self, process: Process) -> None:
+        """Start tracking a process and observe its state changes"""
+        self.processes.append(process)
+        process.state_listener = self.on_state_change
+        if process.state == ProcessState.NEW:
+            heapq.heappush(
+                self.arrival_queue,
+                (process.arrival_time, self._registered, process)
+            )
+        self._registered += 1
+        if not process.is_completed():
+            self.outstanding_processes += 1
+        if process.state == ProcessState.READY:
+            process.ready_since = self.wait_clock()
+        elif process.state == ProcessState.WAITING:
+            self.track_io(process)
+        if self.ready_heap is not None:
+            self.ready_heap.track(process)
+            if process.state == ProcessState.READY:
+                self.ready_heap.push(process)
+
+    def attach_arrivals(self,
+                        source: Iterable[Process],
+                        add: Optional[Callable[[Process], None]] = None,
+                        retain_completed: bool = False) -> None:
+        """
+        Pull processes from an arrival-ordered source as time reaches them
+
+        Only processes that have arrived are registered, and with
+        retain_completed=False finished ones are dropped again, so memory
+        is bounded by the live processes rather than the trace length.
+        Use completion_listener to observe finished processes.
+
+        Args:
+            source: Processes ordered by arrival time (e.g. stream_workload)
+            add: Callable registering one process, defaults to add_process
+            retain_completed: Keep finished processes in processes and
+                completed_processes
+        """
+        self.arrival_source = iter(source)
+        self.add_arrival = add or self.add_process
+        self.retain_completed = retain_completed
+        self.arrivals_consumed = 0
+        self.next_source_arrival()
+
+    def resume_arrivals(self,
+                        source: Iterable[Process],
+                        add: Optional[Callable[[Process], None]] = None) -> None:
+        """
+        Reattach the arrival source of a streamed simulation restored from
+        a checkpoint
+
+        Args:
+            source: The same arrival-ordered source, from its beginning;
+                the processes already taken before the checkpoint are skipped
+            add: Callable registering one process, defaults to add_process
+        """
+        self.arrival_source = iter(source)
+        self.add_arrival = add or self.add_process
+        deque(islice(self.arrival_source, self.arrivals_consumed), maxlen=0)
+        if self.pending_arrival is None:
+            self.next_source_arrival()
+
+    def next_source_arrival(self) -> None:
+        """Take the next process of arrival_source as pending_arrival"""
+        if self.arrival_source is None:
+            raise ValueError("Arrival source missing, call resume_arrivals() after restoring")
+        self.pending_arrival = next(self.arrival_source, None)
+        if self.pending_arrival is not None:
+            self.arrivals_consumed += 1
+
+    def pull_arrivals(self, time: int) -> None:
+        """Register source processes arriving by `time`"""
+        while self.pending_arrival is not None and self.pending_arrival.arrival_time <= time:
+            process = self.pending_arrival
+            self.next_source_arrival()
+            self.add_arrival(process)
+            # Schedulers that make processes ready on add wait from arrival
+            if process.state == ProcessState.READY and process.ready_since is not None:
+                process.ready_since = (
+                    max(process.arrival_time, self.current_time) - self.stalled_time
+                )
+                self.stamp_transition(process, max(process.arrival_time, self.current_time))
+
+    def release_process(self, process: Process) -> None:
+        """Forget per-process bookkeeping of a dropped finished process"""
+        if self.ready_heap is not None:
+            self.ready_heap.forget(process)
+        process.state_listener = None
+
+    def prune_completed(self) -> None:
+        """Drop finished processes from the process list"""
+        live = []
+        for process in self.processes:
+            if process.state == ProcessState.TERMINATED and process is not self.current_process:
+                self.release_process(process)
+            else:
+                live.append(process)
+        self.processes = live
+        self._finished_in_list = 0
+
+    def stamp_transition(self, process: Process, time: int) -> None:
+        """Record the simulated time of a process's last state change"""
+        if Process.timestamp_mode == TIMESTAMP_SIMULATED:
+            process.last_state_change = time
+
+    def on_state_change(self, process: Process, old_state: ProcessState) -> None:
+        """Keep scheduler bookkeeping in sync with a process state change"""
+        # Transitions at a step boundary; ones inside a step are restamped
+        self.stamp_transition(process, self.current_time)
+        if (self.trace is not None and old_state == ProcessState.RUNNING
+                and process.state != ProcessState.TERMINATED):
+            self.trace.end_segment(self.stop_reason(process))
+        if (self.metrics is not None and process.state == ProcessState.RUNNING
+                and process.context_switches == 1):
+            # First dispatch; schedulers set start_time to the current time
+            self.metrics.dispatch(process, self.current_time)
+        if process.state == ProcessState.READY:
+            process.ready_since = self.wait_clock()
+        elif old_state == ProcessState.READY and process.ready_since is not None:
+            process.waiting_time += self.wait_clock() - process.ready_since
+            process.ready_since = None
+        if process.state == ProcessState.TERMINATED:
+            self.outstanding_processes -= 1
+        elif old_state == ProcessState.TERMINATED:
+            self.outstanding_processes += 1
+        if self.ready_heap is not None:
+            if process.state == ProcessState.READY:
+                self.ready_heap.push(process)
+            elif old_state == ProcessState.READY:
+                self.ready_heap.discard(process)
+        if self.state_change_listener is not None:
+            self.state_change_listener(process, old_state)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable snapshot of the whole simulation state
+
+        Processes are saved once, as columns; queues refer to them by
+        index. Restore with load_state_dict() on a fresh scheduler of the
+        same class. Listeners and the arrival source itself are not saved,
+        see resume_arrivals().
+        """
+        saved = list(self.processes)
+        live = {id(p) for p in saved}
+        # Finished processes may have been pruned from processes
+        saved.extend(p for p in self.completed_processes if id(p) not in live)
+        if self.pending_arrival is not None:
+            saved.append(self.pending_arrival)
+        index = {id(p): i for i, p in enumerate(saved)}
+        ref = lambda process: index[id(process)]
+
+        ready_heap = None
+        if self.ready_heap is not None:
+            heap = self.ready_heap
+            ready_heap = {
+                'registered': heap._registered,
+                'order': [[i, heap._order[id(p)]] for i, p in enumerate(saved)
+                          if id(p) in heap._order],
+                'queued': [i for i, p in enumerate(saved) if p in heap],
+            }
+        return {
+            'current_time': self.current_time,
+            'stalled_time': self.stalled_time,
+            'event_driven': self.event_driven,
+            'registered': self._registered,
+            'outstanding_processes': self.outstanding_processes,
+            'retain_completed': self.retain_completed,
+            'finished_in_list': self._finished_in_list,
+            'processes': processes_to_columns(saved),
+            'live': len(self.processes),
+            'completed': [ref(p) for p in self.completed_processes],
+            'current': None if self.current_process is None else ref(self.current_process),
+            'arrival_queue': [
+                [arrival, order, ref(p)] for arrival, order, p in self.arrival_queue
+                if p.state == ProcessState.NEW and id(p) in index
+            ],
+            'ready_heap': ready_heap,
+            'io_started': self._io_started,
+            'io_completions': [
+                [end, order, ref(p), p.io_operations.index(io_op)]
+                for end, order, p, io_op in self.io_completions
+                if not io_op['completed'] and id(p) in index
+            ],
+            'arrivals_consumed': self.arrivals_consumed,
+            'pending_arrival': None if self.pending_arrival is None else ref(self.pending_arrival),
+            'trace': None if self.trace is None else self.trace.state_dict(),
+            'metrics': None if self.metrics is None else self.metrics.state_dict(),
+            'scheduler': self.queue_state(ref),
+        }
+
+    def load_state_dict(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a state saved with state_dict()
+
+        The scheduler continues exactly where the saved one stopped. A
+        streamed simulation also needs resume_arrivals() with its source.
+        """
+        saved = processes_from_columns(state['processes'])
+        live = state['live']
+        self.processes = saved[:live]
         for process in self.processes:
-            if process.arrival_time <= self.current_time:
-                if process.state == ProcessState.NEW:
-                    process.update_state(ProcessState.READY)
-    
+            process.state_listener = self.on_state_change
+        self.current_time = state['current_time']
+        self.stalled_time = state['stalled_time']
+        self.event_driven = state['event_driven']
+        self._registered = state['registered']
+        self.outstanding_processes = state['outstanding_processes']
+        self.retain_completed = state['retain_completed']
+        self._finished_in_list = state['finished_in_list']
+        self.completed_processes = [saved[i] for i in state['completed']]
+        self.current_process = None if state['current'] is None else saved[state['current']]
+        self.arrival_queue = [(arrival, order, saved[i])
+                              for arrival, order, i in state['arrival_queue']]
+        heapq.heapify(self.arrival_queue)
+        self._io_started = state['io_started']
+        self.io_completions = [(end, order, saved[i], saved[i].io_operations[op])
+                               for end, order, i, op in state['io_completions']]
+        heapq.heapify(self.io_completions)
+
+        # Heap keys may depend on scheduler state (e.g. EDF deadlines)
+        self.load_queue_state(state['scheduler'], saved)
+        if state['ready_heap'] is not None and self.ready_heap is not None:
+            heap = self.ready_heap
+            heap._registered = state['ready_heap']['registered']
+            for i, order in state['ready_heap']['order']:
+                heap._order[id(saved[i])] = order
+            for i in state['ready_heap']['queued']:
+                heap.push(saved[i])
+
+        self.arrival_source = None
+        self.arrivals_consumed = state['arrivals_consumed']
+        pending = state['pending_arrival']
+        self.pending_arrival = None if pending is None else saved[pending]
+        self.trace = None if state['trace'] is None else TraceRecorder.from_state_dict(state['trace'])
+        self.metrics = (None if state['metrics'] is None
+                        else MetricTotals.from_state_dict(state['metrics']))
+
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """
+        Scheduler specific part of state_dict()
+
+        Args:
+            ref: Maps a process to the index it is saved under
+        """
+        return {}
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        """Restore what queue_state() saved, given the saved processes by index"""
+        pass
+
+    def stop_reason(self, process: Process) -> int:
+        """Trace reason for a process leaving RUNNING without finishing"""
+        if process.state == ProcessState.WAITING:
+            return REASON_BLOCKED
+        if process is self.current_process:
+            quantum = self.quantum_remaining()
+            if quantum is not None and quantum <= 0:
+                return REASON_QUANTUM
+        return REASON_PREEMPTED
+
+    def update_process_states(self) -> None:
+        """Update states of processes whose arrival or I/O time has passed"""
+        self.handle_io(self.current_time)
+        self.admit_arrivals(self.current_time)
+
+    def pending_io(self, process: Process) -> Optional[Dict[str, Any]]:
+        """Earliest I/O operation of a process that has not started yet"""
+        pending = [
+            io_op for io_op in getattr(process, 'io_operations', ())
+            if not io_op['completed'] and 'started_at' not in io_op
+        ]
+        return min(pending, key=lambda io_op: io_op['start_time']) if pending else None
+
+    def track_io(self, process: Process) -> None:
+        """Schedule the completion of the I/O a WAITING process is blocked on"""
+        for io_op in getattr(process, 'io_operations', ()):
+            if not io_op['completed'] and 'started_at' in io_op:
+                heapq.heappush(
+                    self.io_completions,
+                    (io_op['started_at'] + io_op['duration'], self._io_started, process, io_op)
+                )
+                self._io_started += 1
+
+    def start_io(self, process: Process, io_op: Dict[str, Any]) -> None:
+        """Block the running process on an I/O operation"""
+        io_op['started_at'] = self.current_time
+        process.update_state(ProcessState.WAITING)
+        if process is self.current_process:
+            self.current_process = None
+        heapq.heappush(
+            self.io_completions,
+            (self.current_time + io_op['duration'], self._io_started, process, io_op)
+        )
+        self._io_started += 1
+        if self.io_listener is not None:
+            self.io_listener(process, True)
+
+    def handle_io(self, time: int) -> None:
+        """
+        Complete I/O operations due by `time` and start the one the
+        running process has reached
+
+        An I/O operation starts at the first step boundary at or after its
+        start_time at which its process is running, and lasts its duration
+        from there. Only due completions are popped, so the cost does not
+        depend on the number of blocked processes.
+        """
+        queue = self.io_completions
+        while queue and queue[0][0] <= time:
+            _, _, process, io_op = heapq.heappop(queue)
+            if io_op['completed']:
+                continue
+            io_op['completed'] = True
+            if process.state == ProcessState.WAITING:
+                process.update_state(ProcessState.READY)
+                if self.io_listener is not None:
+                    self.io_listener(process, False)
+
+        process = self.current_process
+        if process is not None and process.state == ProcessState.RUNNING:
+            io_op = self.pending_io(process)
+            if io_op is not None and io_op['start_time'] <= time:
+                self.start_io(process, io_op)
+
+    def admit_arrivals(self, time: int) -> List[Process]:
+        """
+        Move NEW processes that have arrived by `time` to READY
+
+        Only processes popped from the arrival queue are touched, so the
+        cost depends on the number of arrivals, not on the workload size.
+
+        Returns:
+            List of processes that became ready
+        """
+        if self.pending_arrival is not None:
+            self.pull_arrivals(time)
+        arrived = []
+        queue = self.arrival_queue
+        while queue and queue[0][0] <= time:
+            process = heapq.heappop(queue)[2]
+            if process.state == ProcessState.NEW:
+                process.update_state(ProcessState.READY)
+                # Arrivals inside an event-driven step wait from their arrival
+                process.ready_since = (
+                    max(process.arrival_time, self.current_time) - self.stalled_time
+                )
+                self.stamp_transition(process, max(process.arrival_time, self.current_time))
+                arrived.append(process)
+        return arrived
+
     def update_waiting_times(self) -> None:
-        """Update waiting time for all ready processes"""
+        """
+        Bring waiting_time of READY processes up to the current time
+
+        Waiting time is accounted when a process leaves READY, so this only
+        needs to be called before reading metrics in the middle of a run.
+        """
+        now = self.wait_clock()
         for process in self.processes:
-            if process.state == ProcessState.READY:
-                process.waiting_time += 1
-    
+            if process.state == ProcessState.READY and process.ready_since is not None:
+                process.waiting_time += now - process.ready_since
+                process.ready_since = now
+
+    def finish_process(self, process: Process, completion_time: int) -> None:
+        """Record completion of a terminated process"""
+        process.completion_time = completion_time
+        process.turnaround_time = completion_time - process.arrival_time
+        if self.metrics is not None:
+            self.metrics.complete(process)
+        if self.completion_listener is not None:
+            self.completion_listener(process)
+        if self.retain_completed:
+            self.completed_processes.append(process)
+        else:
+            # Amortized O(1): compact once finished processes dominate
+            self._finished_in_list += 1
+            if self._finished_in_list > len(self.processes) // 2:
+                self.prune_completed()
+
+    def advance_clock(self, ticks: int = 1) -> None:
+        """
+        Move the clock forward by `ticks` time units
+
+        Processes arriving strictly inside the interval are admitted with
+        their arrival time, so they wait exactly as they would tick by tick.
+        """
+        if ticks > 1:
+            self.admit_arrivals(self.current_time + ticks - 1)
+        self.current_time += ticks
+
+    def stall(self, ticks: int) -> None:
+        """Move the clock forward without ready processes accruing waiting time"""
+        self.current_time += ticks
+        self.stalled_time += ticks
+        # Arrivals during the stall are ready when it ends, in either engine
+        self.admit_arrivals(self.current_time)
+
+    def wait_clock(self) -> int:
+        """Clock that waiting time is measured against (excludes stalls)"""
+        return self.current_time - self.stalled_time
+
+    def next_arrival_time(self) -> Optional[int]:
+        """Get arrival time of the earliest process that has not arrived yet"""
+        queue = self.arrival_queue
+        # Drop processes that left NEW without passing through admission
+        while queue and queue[0][2].state != ProcessState.NEW:
+            heapq.heappop(queue)
+        times = []
+        if queue:
+            times.append(queue[0][0])
+        if self.pending_arrival is not None:
+            times.append(self.pending_arrival.arrival_time)
+        return min(times) if times else None
+
+    def next_io_event_time(self) -> Optional[int]:
+        """Get the next I/O start or completion the simulation must stop at"""
+        queue = self.io_completions
+        # Drop operations completed without passing through handle_io
+        while queue and queue[0][3]['completed']:
+            heapq.heappop(queue)
+        times = []
+        if queue:
+            times.append(queue[0][0])
+        if self.current_process is not None:
+            io_op = self.pending_io(self.current_process)
+            if io_op is not None:
+                # Already due: blocks at the next step boundary
+                times.append(max(io_op['start_time'], self.current_time + 1))
+        return min(times) if times else None
+
+    def quantum_remaining(self) -> Optional[int]:
+        """Time units left in the current quantum, None if not time-sliced"""
+        return None
+
+    def time_to_next_event(self) -> int:
+        """
+        Time units until the next arrival, completion, quantum expiry or
+        I/O event that can change a scheduling decision
+        """
+        bounds = []
+        if self.current_process is not None:
+            bounds.append(self.current_process.remaining_time)
+            quantum = self.quantum_remaining()
+            if quantum is not None:
+                bounds.append(quantum)
+        if self.current_process is None or self.preempts_on_arrival:
+            arrival = self.next_arrival_time()
+            if arrival is not None:
+                bounds.append(arrival - self.current_time)
+        io_time = self.next_io_event_time()
+        if io_time is not None:
+            bounds.append(io_time - self.current_time)
+        return max(1, min(bounds)) if bounds else 1
+
+    def next_event_delta(self) -> int:
+        """Time units to simulate in this step: 1 in tick mode"""
+        if not self.event_driven:
+            return 1
+        return self.time_to_next_event()
+
+    def run(self) -> None:
+        """Run the simulation until all processes complete"""
+        while not self.is_all_completed():
+            self.run_step()
+
     def is_all_completed(self) -> bool:
         """Check if all processes have completed execution"""
-        return all(p.is_completed() for p in self.processes)
\ No newline at end of file
+        return self.outstanding_processes == 0 and self.pending_arrival is None
@@ -0,0 +1,169 @@
+# src/schedulers/batch.py
+import heapq
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+BATCH_POLICIES = ('fcfs', 'sjf', 'priority')
+
+
+def _fcfs_end_times(arrival: np.ndarray, burst: np.ndarray) -> np.ndarray:
+    """
+    End times of jobs served back to back in the given order
+
+    C[i] = max(arrival[i], C[i-1]) + burst[i], unrolled with cumulative sums:
+    C[i] = S[i] + max(arrival[j] - S[j-1] for j <= i), S being the prefix sum.
+    """
+    total = np.cumsum(burst)
+    previous = total - burst
+    return total + np.maximum.accumulate(arrival - previous)
+
+
+def _heap_end_times(arrival: np.ndarray, burst: np.ndarray,
+                    rank: np.ndarray) -> np.ndarray:
+    """
+    Non-preemptive schedule picking the best ranked job among arrived ones
+
+    `rank` orders the jobs from best (lowest) to worst; ranks are distinct.
+    The heap holds plain integer ranks, which keeps the single sequential
+    pass cheap.
+    """
+    n = len(arrival)
+    selection = np.argsort(rank, kind='stable')
+    dense = np.empty(n, dtype=np.int64)
+    dense[selection] = np.arange(n)
+    by_arrival = np.argsort(arrival, kind='stable')
+    arrival_list = arrival[by_arrival].tolist()
+    rank_list = dense[by_arrival].tolist()
+    job_of_rank = selection.tolist()
+    burst_list = burst.tolist()
+    end = [0] * n
+    heap = []
+    push, pop = heapq.heappush, heapq.heappop
+    clock = 0
+    cursor = 0
+    for _ in range(n):
+        if not heap and arrival_list[cursor] > clock:
+            clock = arrival_list[cursor]
+        while cursor < n and arrival_list[cursor] <= clock:
+            push(heap, rank_list[cursor])
+            cursor += 1
+        job = job_of_rank[pop(heap)]
+        clock += burst_list[job]
+        end[job] = clock
+    return np.array(end, dtype=np.int64)
+
+
+def _ranked_end_times(arrival: np.ndarray, burst: np.ndarray,
+                      rank: np.ndarray) -> np.ndarray:
+    """
+    Non-preemptive schedule picking the best ranked job, busy period by busy period
+
+    Every work-conserving schedule keeps the CPU busy over the same periods
+    as FCFS, so those are found with _fcfs_end_times. A period whose jobs
+    have all arrived by the time its first job finishes then runs in rank
+    order: one sort and a cumulative sum for all such periods together.
+    Only the other periods, where arrivals keep changing the choice, take
+    the sequential heap pass.
+
+    Arguments are in arrival order.
+    """
+    n = len(arrival)
+    fcfs_end = _fcfs_end_times(arrival, burst)
+    opens = np.ones(n, dtype=bool)
+    opens[1:] = arrival[1:] >= fcfs_end[:-1]
+    period_start = np.flatnonzero(opens)
+    period = np.cumsum(opens) - 1
+    period_end = np.append(period_start[1:], n)
+
+    # The first job of a period is the best one arriving when it opens
+    opening = arrival[period_start][period]
+    candidate = np.where(arrival == opening, rank, np.iinfo(np.int64).max)
+    first_rank = np.minimum.reduceat(candidate, period_start)
+    first = np.flatnonzero(rank == first_rank[period])
+    first_end = arrival[first] + burst[first]
+
+    end = np.empty(n, dtype=np.int64)
+    end[first] = first_end
+    settled = arrival[period_end - 1] <= first_end
+    rest = np.flatnonzero(settled[period])
+    rest = rest[rank[rest] != first_rank[period[rest]]]
+    if len(rest):
+        rest = rest[np.lexsort((rank[rest], period[rest]))]
+        total = np.cumsum(burst[rest])
+        # Subtract the work done in earlier periods from the running total
+        begins = np.flatnonzero(np.diff(period[rest], prepend=-1))
+        before = np.repeat(total[begins] - burst[rest][begins],
+                           np.diff(np.append(begins, len(rest))))
+        end[rest] = first_end[period[rest]] + total - before
+
+    busy = np.flatnonzero(~settled[period])
+    if len(busy):
+        end[busy] = _heap_end_times(arrival[busy], burst[busy], rank[busy])
+    return end
+
+
+def solve_batch(policy: str,
+                arrival_time: Sequence[int],
+                burst_time: Sequence[int],
+                priority: Optional[Sequence[int]] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute a non-preemptive schedule without simulating ticks
+
+    Results are identical to running FCFSScheduler, SJFScheduler or
+    PriorityScheduler(preemptive=False) with processes added in input order,
+    including SJFScheduler.run recording completion at the last executed tick.
+
+    Args:
+        policy: 'fcfs', 'sjf' or 'priority'
+        arrival_time: Arrival time of each job
+        burst_time: CPU burst of each job
+        priority: Priority of each job (lower runs first), required for 'priority'
+
+    Returns:
+        Dict of start_time, completion_time, waiting_time and turnaround_time
+        arrays, in input order
+    """
+    if policy not in BATCH_POLICIES:
+        raise ValueError(f"Unsupported batch policy: {policy}")
+    if policy == 'priority' and priority is None:
+        raise ValueError("Priority policy requires priorities")
+
+    arrival = np.asarray(arrival_time, dtype=np.int64)
+    burst = np.asarray(burst_time, dtype=np.int64)
+    if len(arrival) != len(burst):
+        raise ValueError("arrival_time and burst_time must have the same length")
+    n = len(arrival)
+    if n == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {name: empty.copy() for name in
+                ('start_time', 'completion_time', 'waiting_time', 'turnaround_time')}
+
+    # A zero-length burst still occupies the time unit it is dispatched in
+    used = np.maximum(burst, 1)
+
+    if policy == 'fcfs':
+        order = np.argsort(arrival, kind='stable')
+        end = np.empty(n, dtype=np.int64)
+        end[order] = _fcfs_end_times(arrival[order], used[order])
+    else:
+        # Selection order of the scheduler's min(); ties go to input order
+        if policy == 'sjf':
+            selection = np.argsort(burst, kind='stable')
+        else:
+            prio = np.asarray(priority, dtype=np.int64)
+            selection = np.lexsort((np.arange(n), arrival, prio))
+        rank = np.empty(n, dtype=np.int64)
+        rank[selection] = np.arange(n)
+        order = np.argsort(arrival, kind='stable')
+        end = np.empty(n, dtype=np.int64)
+        end[order] = _ranked_end_times(arrival[order], used[order], rank[order])
+
+    start = end - used
+    completion = end - 1 if policy == 'sjf' else end
+
+    return {
+        'start_time': start,
+        'completion_time': completion,
+        'waiting_time': start - arrival,
+        'turnaround_time': completion - arrival,
+    }
@@ -0,0 +1,155 @@
+# src/schedulers/factory.py
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from .base_scheduler import BaseScheduler
+from .fcfs import FCFSScheduler
+from .sjf import SJFScheduler
+from .round_robin import RoundRobinScheduler
+from .priority import PriorityScheduler
+from .mlfq import MLFQScheduler
+from .realtime.rate_monotonic import RateMonotonicScheduler
+from .realtime.earliest_deadline import EarliestDeadlineFirstScheduler
+from ..process.process import Process
+
+# Scheduler names as shown in the GUI, in comparison order
+SCHEDULER_TYPES: List[str] = [
+    'FCFS', 'SJF', 'Round Robin', 'Priority (Non-preemptive)',
+    'Priority (Preemptive)', 'Multi-Level Queue', 'Rate Monotonic',
+    'Earliest Deadline First'
+]
+
+# Scheduler classes by class name, for restoring checkpoints
+SCHEDULER_CLASSES: Dict[str, type] = {
+    cls.__name__: cls for cls in (
+        FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler,
+        MLFQScheduler, RateMonotonicScheduler, EarliestDeadlineFirstScheduler,
+    )
+}
+
+# Short names accepted on the command line
+SCHEDULER_ALIASES: Dict[str, str] = {
+    'fcfs': 'FCFS',
+    'sjf': 'SJF',
+    'rr': 'Round Robin',
+    'priority': 'Priority (Non-preemptive)',
+    'priority-preemptive': 'Priority (Preemptive)',
+    'mlfq': 'Multi-Level Queue',
+    'rms': 'Rate Monotonic',
+    'edf': 'Earliest Deadline First',
+}
+
+# Default real-time parameters used when processes carry none
+DEFAULT_PERIOD = 10
+DEFAULT_DEADLINE = 8
+
+
+def resolve_scheduler_type(name: str) -> str:
+    """Map a short alias or a full scheduler name to the full name"""
+    if name in SCHEDULER_TYPES:
+        return name
+    try:
+        return SCHEDULER_ALIASES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown scheduler type: {name}")
+
+
+# Attributes that configure a scheduler, where the scheduler has them
+SETTING_ATTRIBUTES = (
+    'time_quantum', 'base_quantum', 'num_queues', 'boost_interval',
+    'context_switch_penalty', 'context_switch_overhead', 'preemptive',
+)
+
+
+def scheduler_settings(scheduler: BaseScheduler) -> Dict[str, Any]:
+    """Values of the SETTING_ATTRIBUTES a scheduler has"""
+    return {
+        attr: getattr(scheduler, attr)
+        for attr in SETTING_ATTRIBUTES
+        if hasattr(scheduler, attr)
+    }
+
+
+def create_scheduler(scheduler_type: str,
+                     quantum: int = 2,
+                     context_switch: int = 0,
+                     num_queues: int = 3,
+                     boost_interval: Optional[int] = None) -> BaseScheduler:
+    """
+    Create a scheduler by name
+
+    Args:
+        scheduler_type: One of SCHEDULER_TYPES
+        quantum: Time quantum for Round Robin and base quantum for MLFQ
+        context_switch: Context switch overhead for schedulers that model it
+        num_queues: Number of MLFQ levels
+        boost_interval: MLFQ priority boost period (None disables it)
+
+    Returns:
+        New scheduler instance
+    """
+    if quantum <= 0:
+        raise ValueError("Quantum must be greater than 0")
+    if context_switch < 0:
+        raise ValueError("Context switch overhead cannot be negative")
+
+    if scheduler_type == 'FCFS':
+        scheduler = FCFSScheduler()
+    elif scheduler_type == 'SJF':
+        scheduler = SJFScheduler()
+    elif scheduler_type == 'Round Robin':
+        scheduler = RoundRobinScheduler(time_quantum=quantum)
+    elif scheduler_type == 'Priority (Non-preemptive)':
+        scheduler = PriorityScheduler(preemptive=False)
+    elif scheduler_type == 'Priority (Preemptive)':
+        scheduler = PriorityScheduler(preemptive=True)
+    elif scheduler_type == 'Multi-Level Queue':
+        scheduler = MLFQScheduler(num_queues=num_queues, base_quantum=quantum,
+                                  boost_interval=boost_interval)
+    elif scheduler_type == 'Rate Monotonic':
+        scheduler = RateMonotonicScheduler()
+    elif scheduler_type == 'Earliest Deadline First':
+        scheduler = EarliestDeadlineFirstScheduler()
+    else:
+        raise ValueError(f"Unknown scheduler type: {scheduler_type}")
+
+    for attr in ['context_switch_penalty', 'context_switch_overhead']:
+        if hasattr(scheduler, attr):
+            setattr(scheduler, attr, context_switch)
+    return scheduler
+
+
+def scheduler_type_of(scheduler: BaseScheduler) -> str:
+    """Name in SCHEDULER_TYPES of an existing scheduler"""
+    if isinstance(scheduler, PriorityScheduler):
+        return 'Priority (Preemptive)' if scheduler.preemptive else 'Priority (Non-preemptive)'
+    for scheduler_type in SCHEDULER_TYPES:
+        if type(create_scheduler(scheduler_type)) is type(scheduler):
+            return scheduler_type
+    raise ValueError(f"Unknown scheduler class: {type(scheduler).__name__}")
+
+
+def process_adder(scheduler: BaseScheduler) -> Callable[[Process], None]:
+    """
+    Get a one-argument callable adding a process to a scheduler
+
+    Real-time schedulers get the default period and deadline.
+    """
+    if isinstance(scheduler, RateMonotonicScheduler):
+        return lambda process: scheduler.add_process(process, DEFAULT_PERIOD)
+    if isinstance(scheduler, EarliestDeadlineFirstScheduler):
+        return lambda process: scheduler.add_process(
+            process, deadline=DEFAULT_DEADLINE, period=DEFAULT_PERIOD
+        )
+    return scheduler.add_process
+
+
+def add_processes(scheduler: BaseScheduler, processes: Iterable[Process]) -> None:
+    """
+    Add processes to a scheduler, supplying real-time parameters if needed
+
+    Args:
+        scheduler: Scheduler created by create_scheduler
+        processes: Processes to add, in order
+    """
+    add = process_adder(scheduler)
+    for process in processes:
+        add(process)
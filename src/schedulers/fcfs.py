@@ -3,24 +3,29 @@ from typing import Optional, List
 from .base_scheduler import BaseScheduler
 from ..process.process import Process
 from ..process.process_state import ProcessState
+from .ready_queue import ReadyQueue
 
 class FCFSScheduler(BaseScheduler):
     """
     First Come First Served (FCFS) Scheduler Implementation
     """
     
+    def __init__(self):
+        super().__init__()
+        # Stable by registration order, same as the arrival-sorted list
+        self.ready_heap = ReadyQueue(key=lambda p: p.arrival_time)
+    
     def add_process(self, process: Process) -> None:
         """Add a new process to the scheduler"""
-        self.processes.append(process)
-        # Sort processes by arrival time
-        self.processes.sort(key=lambda p: p.arrival_time)
+        self.register_process(process)
+        # Keep processes sorted by arrival time; traces that are already
+        # in arrival order need no re-sort
+        if len(self.processes) > 1 and self.processes[-2].arrival_time > process.arrival_time:
+            self.processes.sort(key=lambda p: p.arrival_time)
     
     def get_next_process(self) -> Optional[Process]:
-        """Get the next ready process"""
-        for process in self.processes:
-            if process.state == ProcessState.READY:
-                return process
-        return None
+        """Get the next ready process (earliest arrival first)"""
+        return self.ready_heap.peek()
     
     def run(self) -> None:
         """Run the FCFS scheduling simulation"""
@@ -37,21 +42,16 @@ class FCFSScheduler(BaseScheduler):
                     if self.current_process.start_time is None:
                         self.current_process.start_time = self.current_time
             
-            # Execute current process
+            # Execute current process until the next event (one unit in tick mode)
+            ticks = self.next_event_delta()
             if self.current_process:
-                # Execute for one time unit
-                self.current_process.execute(1)
+                self.execute_current(ticks)
                 
                 # Check if process completed
                 if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time + 1  # Add 1 because we just used this time unit
-                    # Calculate turnaround time: completion time - arrival time
-                    self.current_process.turnaround_time = (
-                        self.current_process.completion_time - 
-                        self.current_process.arrival_time
-                    )
+                    # Completion is at the end of the last time unit used
+                    self.finish_process(self.current_process, self.current_time + ticks)
                     self.current_process = None
             
             # Update waiting times and advance clock
-            self.update_waiting_times()
-            self.current_time += 1
\ No newline at end of file
+            self.advance_clock(ticks)
\ No newline at end of file
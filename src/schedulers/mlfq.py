@@ -1,5 +1,5 @@
 # src/schedulers/mlfq.py
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict
 from collections import deque
 from .base_scheduler import BaseScheduler
 from ..process.process import Process
@@ -9,30 +9,131 @@ class MLFQScheduler(BaseScheduler):
     """
     Multi-Level Feedback Queue Scheduler
     Implements multiple priority queues with feedback mechanism
+
+    Each level is a deque. The level of every queued process is kept in a
+    dict and the non-empty levels in a bitmask, so enqueue, dequeue and
+    picking the highest non-empty level are O(1) whatever the queue sizes.
     """
-    
-    def __init__(self, num_queues: int = 3, base_quantum: int = 2):
+
+    def __init__(self, num_queues: int = 3, base_quantum: int = 2,
+                 boost_interval: Optional[int] = None):
+        """
+        Args:
+            num_queues: Number of priority levels
+            base_quantum: Quantum of the top level, doubled at every level
+            boost_interval: Every this many time units all processes move
+                back to the top level so long jobs are not starved
+                (None disables the boost)
+        """
         super().__init__()
         self.num_queues = num_queues
         self.base_quantum = base_quantum
         self.queues: List[deque] = [deque() for _ in range(num_queues)]
         self.process_queue_map: Dict[int, int] = {}  # pid -> queue_level
+        self.queued: Dict[int, int] = {}  # pid -> level of the deque holding it
+        self.nonempty_levels: int = 0  # bit i set while queues[i] is not empty
         self.current_quantum_used: int = 0
         self.context_switch_penalty: int = 1  # Thêm penalty khi switch context
-        
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("boost_interval must be positive")
+        self.boost_interval = boost_interval
+        self.next_boost: Optional[int] = boost_interval
+
     def get_quantum(self, queue_level: int) -> int:
         """Get time quantum for given queue level"""
         return self.base_quantum * (2 ** queue_level)
-    
+
+    def enqueue(self, process: Process, level: int) -> bool:
+        """
+        Append a process to a level unless it is already queued there
+
+        Returns:
+            True if the process was appended
+        """
+        if self.queued.get(process.pid) == level:
+            return False
+        self.queues[level].append(process)
+        self.queued[process.pid] = level
+        self.nonempty_levels |= 1 << level
+        return True
+
+    def dequeue(self, level: int) -> Process:
+        """Remove and return the first process of a level"""
+        queue = self.queues[level]
+        process = queue.popleft()
+        if self.queued.get(process.pid) == level:
+            del self.queued[process.pid]
+        if not queue:
+            self.nonempty_levels &= ~(1 << level)
+        return process
+
     def add_process(self, process: Process) -> None:
-        """Add new process to highest priority queue"""
-        self.processes.append(process)
-        if process.state == ProcessState.NEW:
-            process.update_state(ProcessState.READY)
+        """
+        Add new process to highest priority queue
+
+        A process that has not arrived yet is queued by on_state_change
+        when it is admitted, so it never runs before its arrival time.
+        """
         self.process_queue_map[process.pid] = 0
-        if process not in self.queues[0]:
-            self.queues[0].append(process)
-    
+        self.register_process(process)
+        if process.state == ProcessState.READY:
+            self.enqueue(process, 0)
+
+    def on_state_change(self, process: Process, old_state: ProcessState) -> None:
+        """Queue processes returning to READY (e.g. from I/O) at their level"""
+        super().on_state_change(process, old_state)
+        # The running process is requeued by run_step when its quantum expires
+        if (process.state == ProcessState.READY and process is not self.current_process
+                and process.pid in self.process_queue_map and process.pid not in self.queued):
+            self.enqueue(process, self.process_queue_map[process.pid])
+
+    def release_process(self, process: Process) -> None:
+        """Forget the queue level of a dropped finished process"""
+        super().release_process(process)
+        self.process_queue_map.pop(process.pid, None)
+
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """Levels, queues and boost schedule"""
+        return {
+            'num_queues': self.num_queues,
+            'base_quantum': self.base_quantum,
+            'boost_interval': self.boost_interval,
+            'next_boost': self.next_boost,
+            'context_switch_penalty': self.context_switch_penalty,
+            'current_quantum_used': self.current_quantum_used,
+            'queues': [[ref(p) for p in queue] for queue in self.queues],
+            'process_queue_map': list(self.process_queue_map.items()),
+        }
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        self.num_queues = state['num_queues']
+        self.base_quantum = state['base_quantum']
+        self.boost_interval = state['boost_interval']
+        self.next_boost = state['next_boost']
+        self.context_switch_penalty = state['context_switch_penalty']
+        self.current_quantum_used = state['current_quantum_used']
+        self.process_queue_map = dict(state['process_queue_map'])
+        self.queues = [deque() for _ in range(self.num_queues)]
+        self.queued = {}
+        self.nonempty_levels = 0
+        for level, queue in enumerate(state['queues']):
+            for i in queue:
+                self.enqueue(processes[i], level)
+
+    def quantum_remaining(self) -> Optional[int]:
+        """Time units left in the running process's quantum"""
+        level = self.process_queue_map.get(self.current_process.pid)
+        if level is None:
+            return None
+        return self.get_quantum(level) - self.current_quantum_used
+
+    def time_to_next_event(self) -> int:
+        """Also stop at the next priority boost"""
+        delta = super().time_to_next_event()
+        if self.next_boost is not None:
+            delta = max(1, min(delta, self.next_boost - self.current_time))
+        return delta
+
     def demote_process(self, process: Process) -> None:
         """
         Demote process to lower priority queue
@@ -42,65 +143,89 @@ class MLFQScheduler(BaseScheduler):
         if current_level < self.num_queues - 1:
             next_level = current_level + 1
             self.process_queue_map[process.pid] = next_level
-            if process not in self.queues[next_level]:
-                self.queues[next_level].append(process)
+            if self.enqueue(process, next_level):
                 # Add waiting time for context switch
                 process.waiting_time += self.context_switch_penalty
         else:
-            if process not in self.queues[current_level]:
-                self.queues[current_level].append(process)
+            if self.enqueue(process, current_level):
                 process.waiting_time += self.context_switch_penalty
-    
+
+    def boost(self) -> None:
+        """Move every process back to the top level, keeping queue order"""
+        for level in range(1, self.num_queues):
+            while self.queues[level]:
+                process = self.dequeue(level)
+                self.process_queue_map[process.pid] = 0
+                self.enqueue(process, 0)
+        if self.current_process is not None and self.current_process.pid in self.process_queue_map:
+            self.process_queue_map[self.current_process.pid] = 0
+
     def get_next_process(self) -> Optional[Process]:
         """Get next process from highest non-empty queue"""
-        for level, queue in enumerate(self.queues):
-            while queue:
-                process = queue[0]
-                if not process.is_completed():
-                    return process
-                queue.popleft()
+        while self.nonempty_levels:
+            # Lowest set bit is the highest priority non-empty level
+            level = (self.nonempty_levels & -self.nonempty_levels).bit_length() - 1
+            process = self.queues[level][0]
+            if not process.is_completed():
+                return process
+            self.dequeue(level)
         return None
-        
+
+    def run_step(self) -> bool:
+        """
+        Execute one step of MLFQ scheduling
+        Returns: True if simulation should continue, False if completed
+        """
+        self.update_process_states()
+
+        if self.next_boost is not None and self.current_time >= self.next_boost:
+            self.boost()
+            while self.next_boost <= self.current_time:
+                self.next_boost += self.boost_interval
+
+        if self.current_process is None:
+            self.current_process = self.get_next_process()
+            if self.current_process:
+                current_level = self.process_queue_map[self.current_process.pid]
+                self.dequeue(current_level)
+                self.current_process.update_state(ProcessState.RUNNING)
+                if self.current_process.start_time is None:
+                    self.current_process.start_time = self.current_time
+                self.current_quantum_used = 0
+                # Add context switch overhead
+                self.stall(self.context_switch_penalty)
+
+        ticks = self.next_event_delta()
+        if self.current_process:
+            current_level = self.process_queue_map[self.current_process.pid]
+            quantum = self.get_quantum(current_level)
+
+            # Execute until the next event (one time unit in tick mode)
+            time_used = self.execute_current(ticks)
+            self.current_quantum_used += ticks
+
+            if self.current_process.is_completed():
+                self.finish_process(self.current_process, self.current_time + ticks)
+                if self.current_process.pid in self.process_queue_map:
+                    del self.process_queue_map[self.current_process.pid]
+                self.current_process = None
+            elif self.current_quantum_used >= quantum:
+                # The process keeps the CPU until the last time unit of
+                # the slice, which is when the quantum expires
+                self.advance_clock(ticks - 1)
+                self.update_process_states()
+                ticks = 1
+                # Process used its quantum, demote it
+                self.current_process.update_state(ProcessState.READY)
+                self.demote_process(self.current_process)
+                self.current_process = None
+                self.current_quantum_used = 0
+
+        self.advance_clock(ticks)
+
+        return not self.is_all_completed()
+
     def run(self) -> None:
         """Run MLFQ scheduling simulation"""
         while not self.is_all_completed():
-            self.update_process_states()
-            
-            if self.current_process is None:
-                self.current_process = self.get_next_process()
-                if self.current_process:
-                    current_level = self.process_queue_map[self.current_process.pid]
-                    self.queues[current_level].popleft()
-                    self.current_process.update_state(ProcessState.RUNNING)
-                    if self.current_process.start_time is None:
-                        self.current_process.start_time = self.current_time
-                    self.current_quantum_used = 0
-                    # Add context switch overhead
-                    self.current_time += self.context_switch_penalty
-            
-            if self.current_process:
-                current_level = self.process_queue_map[self.current_process.pid]
-                quantum = self.get_quantum(current_level)
-                
-                # Execute for one time unit
-                time_used = self.current_process.execute(1)
-                self.current_quantum_used += 1
-                
-                if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time + 1
-                    self.current_process.turnaround_time = (
-                        self.current_process.completion_time - 
-                        self.current_process.arrival_time
-                    )
-                    if self.current_process.pid in self.process_queue_map:
-                        del self.process_queue_map[self.current_process.pid]
-                    self.current_process = None
-                elif self.current_quantum_used >= quantum:
-                    # Process used its quantum, demote it
-                    self.current_process.update_state(ProcessState.READY)
-                    self.demote_process(self.current_process)
-                    self.current_process = None
-                    self.current_quantum_used = 0
-            
-            self.update_waiting_times()
-            self.current_time += 1
\ No newline at end of file
+            self.run_step()
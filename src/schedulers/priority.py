@@ -1,8 +1,9 @@
 # src/schedulers/priority.py
-from typing import Optional, List
+from typing import Any, Callable, Dict, List, Optional
 from .base_scheduler import BaseScheduler
 from ..process.process import Process
 from ..process.process_state import ProcessState
+from .ready_queue import ReadyQueue
 
 class PriorityScheduler(BaseScheduler):
     """
@@ -19,10 +20,11 @@ class PriorityScheduler(BaseScheduler):
         """
         super().__init__()
         self.preemptive = preemptive
+        self.ready_heap = ReadyQueue(key=lambda p: (p.priority, p.arrival_time))
     
     def add_process(self, process: Process) -> None:
         """Add new process to scheduler"""
-        self.processes.append(process)
+        self.register_process(process)
     
     def get_next_process(self) -> Optional[Process]:
         """
@@ -31,48 +33,62 @@ class PriorityScheduler(BaseScheduler):
         Returns:
             Process with highest priority (lowest priority number)
         """
-        ready_processes = [p for p in self.processes if p.state == ProcessState.READY]
-        if not ready_processes:
-            return None
-        return min(ready_processes, key=lambda p: (p.priority, p.arrival_time))
+        return self.ready_heap.peek()
     
+    @property
+    def preempts_on_arrival(self) -> bool:
+        """Arrivals can preempt only in preemptive mode"""
+        return self.preemptive
+    
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """Preemption mode (the ready heap is saved by the base class)"""
+        return {'preemptive': self.preemptive}
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        self.preemptive = state['preemptive']
+
     def should_preempt(self, running_process: Process, ready_process: Process) -> bool:
         """Check if ready process should preempt running process"""
         return (self.preemptive and 
                 ready_process.priority < running_process.priority)
     
+    def run_step(self) -> bool:
+        """
+        Execute one step of priority scheduling
+        Returns: True if simulation should continue, False if completed
+        """
+        self.update_process_states()
+        
+        # Check for preemption
+        if self.current_process and self.preemptive:
+            next_process = self.get_next_process()
+            if (next_process and 
+                self.should_preempt(self.current_process, next_process)):
+                self.current_process.update_state(ProcessState.READY)
+                self.current_process = None
+        
+        # Get next process if none running
+        if self.current_process is None:
+            self.current_process = self.get_next_process()
+            if self.current_process:
+                self.current_process.update_state(ProcessState.RUNNING)
+                if self.current_process.start_time is None:
+                    self.current_process.start_time = self.current_time
+        
+        # Execute current process
+        ticks = self.next_event_delta()
+        if self.current_process:
+            time_used = self.execute_current(ticks)
+            
+            if self.current_process.is_completed():
+                self.finish_process(self.current_process, self.current_time + ticks)
+                self.current_process = None
+        
+        self.advance_clock(ticks)
+
+        return not self.is_all_completed()
+
     def run(self) -> None:
         """Run priority scheduling simulation"""
         while not self.is_all_completed():
-            self.update_process_states()
-            
-            # Check for preemption
-            if self.current_process and self.preemptive:
-                next_process = self.get_next_process()
-                if (next_process and 
-                    self.should_preempt(self.current_process, next_process)):
-                    self.current_process.update_state(ProcessState.READY)
-                    self.current_process = None
-            
-            # Get next process if none running
-            if self.current_process is None:
-                self.current_process = self.get_next_process()
-                if self.current_process:
-                    self.current_process.update_state(ProcessState.RUNNING)
-                    if self.current_process.start_time is None:
-                        self.current_process.start_time = self.current_time
-            
-            # Execute current process
-            if self.current_process:
-                time_used = self.current_process.execute(1)
-                
-                if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time + 1
-                    self.current_process.turnaround_time = (
-                        self.current_process.completion_time - 
-                        self.current_process.arrival_time
-                    )
-                    self.current_process = None
-            
-            self.update_waiting_times()
-            self.current_time += 1
\ No newline at end of file
+            self.run_step()
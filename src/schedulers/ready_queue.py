@@ -0,0 +1,79 @@
+# src/schedulers/ready_queue.py
+import heapq
+from typing import Any, Callable, Dict, List, Optional
+from ..process.process import Process
+
+class ReadyQueue:
+    """
+    Binary heap of ready processes with lazy deletion
+
+    Processes are ordered by `key`, ties are broken by the order in which they
+    were registered with the scheduler, so selection matches calling min() on
+    the scheduler's process list. Push, discard and pop are O(log n), peek is
+    amortized O(1).
+    """
+
+    def __init__(self, key: Callable[[Process], Any]):
+        self.key = key
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}  # id(process) -> heap entry
+        self._order: Dict[int, int] = {}     # id(process) -> registration order
+        self._registered = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, process: Process) -> bool:
+        return id(process) in self._entries
+
+    def track(self, process: Process) -> None:
+        """Remember registration order of a process for tie breaking"""
+        if id(process) not in self._order:
+            self._order[id(process)] = self._registered
+            self._registered += 1
+
+    def forget(self, process: Process) -> None:
+        """Drop a process and its registration order entirely"""
+        self.discard(process)
+        self._order.pop(id(process), None)
+
+    def push(self, process: Process) -> None:
+        """Add a ready process, replacing any existing entry"""
+        self.discard(process)
+        self.track(process)
+        entry = [self.key(process), self._order[id(process)], process, True]
+        self._entries[id(process)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, process: Process) -> None:
+        """Remove a process if present (marked invalid, dropped lazily)"""
+        entry = self._entries.pop(id(process), None)
+        if entry is not None:
+            entry[-1] = False
+            if len(self._heap) > 2 * len(self._entries) + 32:
+                self._compact()
+
+    def rekey(self, process: Process) -> None:
+        """Reposition a queued process after its key changed"""
+        if process in self:
+            self.push(process)
+
+    def peek(self) -> Optional[Process]:
+        """Get the first process without removing it"""
+        heap = self._heap
+        while heap and not heap[0][-1]:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def pop(self) -> Optional[Process]:
+        """Remove and return the first process"""
+        process = self.peek()
+        if process is not None:
+            heapq.heappop(self._heap)
+            del self._entries[id(process)]
+        return process
+
+    def _compact(self) -> None:
+        """Drop invalidated entries once they dominate the heap"""
+        self._heap = [entry for entry in self._heap if entry[-1]]
+        heapq.heapify(self._heap)
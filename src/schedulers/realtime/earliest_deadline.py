@@ -1,8 +1,8 @@
 # src/schedulers/realtime/earliest_deadline.py
-from typing import Optional, Dict
+from typing import Any, Callable, Dict, List, Optional
 from ..base_scheduler import BaseScheduler
 from ...process.process import Process
-from ...process.process_state import ProcessState
+from ..ready_queue import ReadyQueue
 
 class EarliestDeadlineFirstScheduler(BaseScheduler):
     """
@@ -13,6 +13,7 @@ class EarliestDeadlineFirstScheduler(BaseScheduler):
         super().__init__()
         self.deadlines: Dict[int, int] = {}  # pid -> absolute deadline
         self.periods: Dict[int, int] = {}    # pid -> period
+        self.ready_heap = ReadyQueue(key=lambda p: self.deadlines[p.pid])
         
     def add_process(self, process: Process, deadline: int, period: int):
         """
@@ -23,27 +24,36 @@ class EarliestDeadlineFirstScheduler(BaseScheduler):
             deadline: Relative deadline
             period: Process period
         """
-        self.processes.append(process)
         self.deadlines[process.pid] = process.arrival_time + deadline
         self.periods[process.pid] = period
+        self.register_process(process)
     
+    def release_process(self, process: Process) -> None:
+        """Forget deadline and period of a dropped finished process"""
+        super().release_process(process)
+        self.deadlines.pop(process.pid, None)
+        self.periods.pop(process.pid, None)
+    
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """Absolute deadlines and periods by pid"""
+        return {'deadlines': list(self.deadlines.items()),
+                'periods': list(self.periods.items())}
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        self.deadlines = dict(state['deadlines'])
+        self.periods = dict(state['periods'])
+
     def update_deadlines(self, pid: int):
         """Update deadline after process completion"""
         if pid in self.deadlines and pid in self.periods:
             self.deadlines[pid] += self.periods[pid]
+            for process in self.processes:
+                if process.pid == pid:
+                    self.ready_heap.rekey(process)
     
     def get_next_process(self) -> Optional[Process]:
         """Get process with earliest deadline"""
-        ready_processes = [
-            p for p in self.processes 
-            if p.state == ProcessState.READY
-        ]
-        if not ready_processes:
-            return None
-        return min(
-            ready_processes,
-            key=lambda p: self.deadlines[p.pid]
-        )
+        return self.ready_heap.peek()
         
     def check_schedulability(self) -> bool:
         """
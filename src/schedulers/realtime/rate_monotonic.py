@@ -1,8 +1,9 @@
 # src/schedulers/realtime/rate_monotonic.py
-from typing import Optional, List
+from typing import Any, Callable, Dict, List, Optional
 from ..base_scheduler import BaseScheduler
 from ...process.process import Process
 from ...process.process_state import ProcessState
+from ..ready_queue import ReadyQueue
 
 class RateMonotonicScheduler(BaseScheduler):
     """
@@ -10,9 +11,12 @@ class RateMonotonicScheduler(BaseScheduler):
     Assigns priorities based on process periods (shorter period = higher priority)
     """
     
+    preempts_on_arrival = True
+    
     def __init__(self):
         super().__init__()
         self.process_periods: dict = {}  # pid -> period
+        self.ready_heap = ReadyQueue(key=lambda p: self.process_periods[p.pid])
     
     def add_process(self, process: Process, period: int) -> None:
         """
@@ -22,49 +26,75 @@ class RateMonotonicScheduler(BaseScheduler):
             process: Process to be scheduled
             period: Time period for process execution
         """
-        self.processes.append(process)
         self.process_periods[process.pid] = period
+        self.register_process(process)
         # Assign priority based on period (shorter period = higher priority)
         process.priority = period
     
+    def release_process(self, process: Process) -> None:
+        """Forget the period of a dropped finished process"""
+        super().release_process(process)
+        self.process_periods.pop(process.pid, None)
+    
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """Periods by pid"""
+        return {'process_periods': list(self.process_periods.items())}
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        self.process_periods = dict(state['process_periods'])
+
     def get_next_process(self) -> Optional[Process]:
         """Get highest priority (shortest period) ready process"""
-        ready_processes = [p for p in self.processes if p.state == ProcessState.READY]
-        if not ready_processes:
-            return None
-        return min(ready_processes, key=lambda p: self.process_periods[p.pid])
+        return self.ready_heap.peek()
     
-    def run(self) -> None:
-        """Run Rate Monotonic scheduling simulation"""
-        while not self.is_all_completed():
-            self.update_process_states()
-            
-            # Preemption check
-            if self.current_process:
-                next_process = self.get_next_process()
-                if (next_process and 
-                    self.process_periods[next_process.pid] < 
-                    self.process_periods[self.current_process.pid]):
-                    self.current_process.update_state(ProcessState.READY)
-                    self.current_process = None
-            
-            if self.current_process is None:
-                self.current_process = self.get_next_process()
-                if self.current_process:
-                    self.current_process.update_state(ProcessState.RUNNING)
-                    if self.current_process.start_time is None:
-                        self.current_process.start_time = self.current_time
-            
+    def check_schedulability(self) -> bool:
+        """
+        Check if task set is schedulable using Rate Monotonic
+        Using the Liu-Layland utilization bound n(2^(1/n) - 1), a
+        sufficient test: task sets above it may still be schedulable
+        """
+        if not self.processes:
+            return True
+        
+        n = len(self.processes)
+        utilization = sum(
+            p.burst_time / self.process_periods[p.pid]
+            for p in self.processes
+        )
+        
+        return utilization <= n * (2 ** (1 / n) - 1)
+    
+    def run_step(self) -> bool:
+        """
+        Execute one step of Rate Monotonic scheduling
+        Returns: True if simulation should continue, False if completed
+        """
+        self.update_process_states()
+        
+        # Preemption check
+        if self.current_process:
+            next_process = self.get_next_process()
+            if (next_process and 
+                self.process_periods[next_process.pid] < 
+                self.process_periods[self.current_process.pid]):
+                self.current_process.update_state(ProcessState.READY)
+                self.current_process = None
+        
+        if self.current_process is None:
+            self.current_process = self.get_next_process()
             if self.current_process:
-                time_used = self.current_process.execute(1)
-                
-                if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time + 1
-                    self.current_process.turnaround_time = (
-                        self.current_process.completion_time - 
-                        self.current_process.arrival_time
-                    )
-                    self.current_process = None
+                self.current_process.update_state(ProcessState.RUNNING)
+                if self.current_process.start_time is None:
+                    self.current_process.start_time = self.current_time
+        
+        ticks = self.next_event_delta()
+        if self.current_process:
+            time_used = self.execute_current(ticks)
             
-            self.update_waiting_times()
-            self.current_time += 1
\ No newline at end of file
+            if self.current_process.is_completed():
+                self.finish_process(self.current_process, self.current_time + ticks)
+                self.current_process = None
+        
+        self.advance_clock(ticks)
+
+        return not self.is_all_completed()
@@ -1,43 +1,73 @@
-from typing import Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
 from .base_scheduler import BaseScheduler
 from ..process.process import Process
 from ..process.process_state import ProcessState
 
 class RoundRobinScheduler(BaseScheduler):
+    """
+    Round Robin Scheduler
+
+    Processes join the back of a FIFO ready queue whenever they become
+    READY: on arrival (in arrival order), when their quantum expires and
+    when they return from I/O. Arrivals at the time a quantum expires are
+    queued ahead of the preempted process.
+    """
+
     def __init__(self, time_quantum: int = 2):
         super().__init__()
         self.time_quantum = time_quantum
         self.current_quantum_used = 0
-        self.ready_queue = []
+        self.ready_queue: Deque[Process] = deque()
         
     def add_process(self, process: Process) -> None:
-        self.processes.append(process)
+        self.register_process(process)
+        if process.state == ProcessState.READY:
+            self.ready_queue.append(process)
+
+    def on_state_change(self, process: Process, old_state: ProcessState) -> None:
+        """Queue processes as they become READY"""
+        super().on_state_change(process, old_state)
         if process.state == ProcessState.READY:
             self.ready_queue.append(process)
             
     def get_next_process(self) -> Optional[Process]:
-        # If ready queue is empty, check for new processes
-        if not self.ready_queue:
-            for process in self.processes:
-                if process.state == ProcessState.READY:
-                    self.ready_queue.append(process)
-                    
-        # Return first process in ready queue
-        return self.ready_queue.pop(0) if self.ready_queue else None
+        """Pop the first process of the ready queue"""
+        queue = self.ready_queue
+        while queue:
+            process = queue.popleft()
+            # Skip entries whose process has left READY since being queued
+            if process.state == ProcessState.READY:
+                return process
+        return None
+        
+    def queue_state(self, ref: Callable[[Process], int]) -> Dict[str, Any]:
+        """Quantum and ready queue (stale entries dropped)"""
+        return {
+            'time_quantum': self.time_quantum,
+            'current_quantum_used': self.current_quantum_used,
+            'ready_queue': [ref(p) for p in self.ready_queue if p.state == ProcessState.READY],
+        }
+
+    def load_queue_state(self, state: Dict[str, Any], processes: List[Process]) -> None:
+        self.time_quantum = state['time_quantum']
+        self.current_quantum_used = state['current_quantum_used']
+        self.ready_queue = deque(processes[i] for i in state['ready_queue'])
+
+    def quantum_remaining(self) -> Optional[int]:
+        """Time units left in the running process's quantum"""
+        return self.time_quantum - self.current_quantum_used
         
     def run_step(self) -> bool:
         # Update process states based on arrival time
         self.update_process_states()
         
-        # If current process exists, increment quantum used
+        # If current process exists, check if quantum expired
         if self.current_process:
-            self.current_quantum_used += 1
-            
-            # Check if quantum expired
             if self.current_quantum_used >= self.time_quantum:
                 if not self.current_process.is_completed():
+                    # Back of the queue, behind processes that arrived meanwhile
                     self.current_process.update_state(ProcessState.READY)
-                    self.ready_queue.append(self.current_process)
                 self.current_process = None
                 self.current_quantum_used = 0
         
@@ -50,25 +80,20 @@ class RoundRobinScheduler(BaseScheduler):
                 self.current_process.update_state(ProcessState.RUNNING)
                 self.current_quantum_used = 0
                 
-        # Execute current process
+        # Execute current process until the next event (one unit in tick mode)
+        ticks = self.next_event_delta()
         if self.current_process:
-            # Execute for one time unit
-            self.current_process.execute(1)
+            self.execute_current(ticks)
+            self.current_quantum_used += ticks
             
             # Check if process completed
             if self.current_process.is_completed():
-                self.current_process.completion_time = self.current_time + 1
-                self.current_process.turnaround_time = (
-                    self.current_process.completion_time - 
-                    self.current_process.arrival_time
-                )
-                self.completed_processes.append(self.current_process)
+                self.finish_process(self.current_process, self.current_time + ticks)
                 self.current_process = None
                 self.current_quantum_used = 0
                 
         # Update waiting times and current time
-        self.update_waiting_times()
-        self.current_time += 1
+        self.advance_clock(ticks)
         
         # Return True if simulation should continue
         return not self.is_all_completed()
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import Optional
 from .base_scheduler import BaseScheduler
 from ..process.process import Process
 from ..process.process_state import ProcessState
+from .ready_queue import ReadyQueue
 
 class SJFScheduler(BaseScheduler):
     """
@@ -11,9 +12,13 @@ class SJFScheduler(BaseScheduler):
     Non-preemptive scheduler that selects the process with shortest burst time
     """
     
+    def __init__(self):
+        super().__init__()
+        self.ready_heap = ReadyQueue(key=lambda p: p.burst_time)
+    
     def add_process(self, process: Process) -> None:
         """Add a new process to the scheduler"""
-        self.processes.append(process)
+        self.register_process(process)
     
     def get_next_process(self) -> Optional[Process]:
         """
@@ -22,12 +27,8 @@ class SJFScheduler(BaseScheduler):
         Returns:
             Process: Ready process with shortest burst time, or None if no process is ready
         """
-        ready_processes = [p for p in self.processes if p.state == ProcessState.READY]
-        if not ready_processes:
-            return None
-            
-        # Select process with shortest remaining time
-        return min(ready_processes, key=lambda p: p.burst_time)
+        # Ready heap is keyed by burst time
+        return self.ready_heap.peek()
     
     def run(self) -> None:
         """Run the SJF scheduling simulation"""
@@ -42,15 +43,12 @@ class SJFScheduler(BaseScheduler):
                     if self.current_process.start_time is None:
                         self.current_process.start_time = self.current_time
             
+            ticks = self.next_event_delta()
             if self.current_process:
-                time_used = self.current_process.execute(1)
+                time_used = self.execute_current(ticks)
                 
                 if self.current_process.is_completed():
-                    self.current_process.completion_time = self.current_time
-                    self.current_process.turnaround_time = (
-                        self.current_time - self.current_process.arrival_time
-                    )
+                    self.finish_process(self.current_process, self.current_time + ticks - 1)
                     self.current_process = None
             
-            self.update_waiting_times()
-            self.current_time += 1
\ No newline at end of file
+            self.advance_clock(ticks)
\ No newline at end of file
@@ -0,0 +1,244 @@
+# src/simulation/benchmark.py
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from ..schedulers.factory import SCHEDULER_TYPES, create_scheduler
+from ..workload.generator import generate_workload
+from .comparison import simulate
+
+try:
+    import resource
+except ImportError:  # Windows: peak memory is not reported
+    resource = None
+
+# Bump when the report layout changes
+BENCHMARK_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_BURST_SCALES = (1, 10)
+# Mean burst time at burst scale 1; arrivals keep the CPU this busy
+BASE_BURST = 5.0
+LOAD = 0.9
+# Larger sizes of a scheduler are skipped once a case takes this long
+DEFAULT_TIME_LIMIT = 120.0
+# A case regresses when it is this much slower (or bigger) than the
+# baseline, by more than the absolute margins below, which absorb noise
+DEFAULT_TOLERANCE = 0.25
+MIN_TIME_DELTA = 0.05
+MIN_MEMORY_DELTA = 4.0
+# A log-log slope this much steeper than the baseline means the scheduler
+# scales worse (1 is linear, 2 quadratic)
+DEFAULT_SLOPE_TOLERANCE = 0.2
+
+# Columns of a case result, in output order
+RESULT_FIELDS = ('scheduler', 'processes', 'burst_scale', 'ticks', 'wall_time',
+                 'ticks_per_second', 'processes_per_second', 'peak_memory_mb')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """High-water mark of this process's resident memory in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_case(scheduler_type: str, processes: int, burst_scale: float,
+             seed: int = 0, event_driven: bool = True) -> Dict[str, Any]:
+    """
+    Worker entry point: simulate one generated workload and measure it
+
+    The workload has exponential bursts of mean BASE_BURST * burst_scale and
+    Poisson arrivals at LOAD utilization. Only the simulation is timed.
+    Peak memory is the growth of the resident high-water mark, so it is
+    only meaningful in a fresh process (see run_benchmark).
+
+    Returns:
+        Dict with the RESULT_FIELDS
+    """
+    start_rss = peak_rss_mb()
+    mean_burst = BASE_BURST * burst_scale
+    workload = generate_workload(processes, seed=seed, bursts='exponential',
+                                 mean_burst=mean_burst, arrival_rate=LOAD / mean_burst)
+    scheduler = create_scheduler(scheduler_type)
+
+    started = time.perf_counter()
+    simulate(scheduler, workload.table().views(), event_driven)
+    wall_time = time.perf_counter() - started
+
+    peak = peak_rss_mb()
+    return {
+        'scheduler': scheduler_type,
+        'processes': processes,
+        'burst_scale': burst_scale,
+        'ticks': scheduler.current_time,
+        'wall_time': wall_time,
+        'ticks_per_second': scheduler.current_time / wall_time if wall_time else 0.0,
+        'processes_per_second': processes / wall_time if wall_time else 0.0,
+        'peak_memory_mb': None if peak is None else peak - start_rss,
+    }
+
+
+def run_benchmark(scheduler_types: Sequence[str] = SCHEDULER_TYPES,
+                  sizes: Sequence[int] = DEFAULT_SIZES,
+                  burst_scales: Sequence[float] = DEFAULT_BURST_SCALES,
+                  seed: int = 0,
+                  event_driven: bool = True,
+                  time_limit: Optional[float] = DEFAULT_TIME_LIMIT) -> Iterator[Dict[str, Any]]:
+    """
+    Run every scheduler over growing generated workloads
+
+    Cases run one at a time, each in a fresh worker process, so timings do
+    not compete for the CPU and peak memory is measured per case.
+
+    Args:
+        scheduler_types: Schedulers to measure
+        sizes: Process counts, run in increasing order
+        burst_scales: Multipliers of the mean burst time
+        seed: Workload seed (the same workloads for every scheduler)
+        event_driven: Advance the clock from event to event
+        time_limit: Seconds after which larger sizes of a scheduler and
+            burst scale are skipped (None runs everything)
+
+    Yields:
+        Case results (see run_case) as they finish
+    """
+    for scheduler_type in scheduler_types:
+        for burst_scale in burst_scales:
+            for size in sorted(sizes):
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    result = executor.submit(run_case, scheduler_type, size, burst_scale,
+                                             seed, event_driven).result()
+                yield result
+                if time_limit is not None and result['wall_time'] > time_limit:
+                    break
+
+
+def scaling_slopes(results: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Asymptotic slope of each scheduler and burst scale
+
+    The slope is the least-squares fit of log(wall time) against
+    log(process count): about 1 for linear scaling, 2 for quadratic.
+    Series with fewer than two sizes have no slope.
+    """
+    series: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+    for result in results:
+        key = (result['scheduler'], result['burst_scale'])
+        series.setdefault(key, []).append((result['processes'], result['wall_time']))
+    slopes = []
+    for (scheduler_type, burst_scale), points in series.items():
+        points = [(size, wall) for size, wall in points if size > 0 and wall > 0]
+        if len({size for size, _ in points}) < 2:
+            continue
+        sizes, walls = zip(*points)
+        slope = np.polyfit(np.log(sizes), np.log(walls), 1)[0]
+        slopes.append({'scheduler': scheduler_type, 'burst_scale': burst_scale,
+                       'slope': float(slope)})
+    return slopes
+
+
+def machine_info() -> Dict[str, str]:
+    """Description of the machine and interpreter a report comes from"""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': str(os.cpu_count()),
+    }
+
+
+def benchmark_report(results: Sequence[Mapping[str, Any]],
+                     settings: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Report holding results and slopes, as saved in a baseline file"""
+    return {
+        'version': BENCHMARK_VERSION,
+        'machine': machine_info(),
+        'settings': dict(settings or {}),
+        'results': [dict(result) for result in results],
+        'slopes': scaling_slopes(results),
+    }
+
+
+def save_baseline(report: Mapping[str, Any], path: str) -> None:
+    """Write a report as a JSON baseline, atomically"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as stream:
+            json.dump(report, stream, indent=2)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """Read a baseline written by save_baseline"""
+    with open(path) as stream:
+        report = json.load(stream)
+    if not isinstance(report, dict) or report.get('version') != BENCHMARK_VERSION:
+        raise ValueError(f"Not a benchmark baseline (version {BENCHMARK_VERSION}): {path}")
+    return report
+
+
+def find_regressions(report: Mapping[str, Any],
+                     baseline: Mapping[str, Any],
+                     tolerance: float = DEFAULT_TOLERANCE,
+                     slope_tolerance: float = DEFAULT_SLOPE_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Compare a report against a baseline
+
+    Cases are matched by scheduler, process count and burst scale; cases
+    missing from either side are ignored.
+
+    Args:
+        report: Current benchmark_report()
+        baseline: Stored report
+        tolerance: Relative increase of wall time or peak memory flagged
+        slope_tolerance: Increase of the log-log slope flagged
+
+    Returns:
+        One dict per regression: scheduler, burst_scale, processes (None
+        for slopes), metric, baseline and current values
+    """
+    def case_key(result):
+        return result['scheduler'], result['processes'], result['burst_scale']
+
+    regressions = []
+    previous = {case_key(result): result for result in baseline['results']}
+    for result in report['results']:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        for metric, margin in (('wall_time', MIN_TIME_DELTA),
+                               ('peak_memory_mb', MIN_MEMORY_DELTA)):
+            before, after = old.get(metric), result.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > margin:
+                regressions.append({
+                    'scheduler': result['scheduler'], 'burst_scale': result['burst_scale'],
+                    'processes': result['processes'], 'metric': metric,
+                    'baseline': before, 'current': after,
+                })
+
+    previous_slopes = {(s['scheduler'], s['burst_scale']): s['slope'] for s in baseline['slopes']}
+    for slope in report['slopes']:
+        before = previous_slopes.get((slope['scheduler'], slope['burst_scale']))
+        if before is not None and slope['slope'] > before + slope_tolerance:
+            regressions.append({
+                'scheduler': slope['scheduler'], 'burst_scale': slope['burst_scale'],
+                'processes': None, 'metric': 'slope',
+                'baseline': before, 'current': slope['slope'],
+            })
+    return regressions
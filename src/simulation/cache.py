@@ -0,0 +1,230 @@
+# src/simulation/cache.py
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+import numpy as np
+from ..schedulers.base_scheduler import BaseScheduler
+from ..schedulers.factory import scheduler_settings
+
+# Bump when simulation results change, so stale entries are never read
+CACHE_VERSION = 3
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Workload files are hashed in chunks of this size
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def default_cache_dir() -> str:
+    """Per-user cache directory (honours XDG_CACHE_HOME)"""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'cpu-scheduler')
+
+
+def workload_digest(workload) -> str:
+    """
+    Content hash of a workload spec
+
+    Args:
+        workload: Workload spec records (see comparison.WorkloadSpec), or
+            the path of a workload file (hashed by content, not by name)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    if isinstance(workload, str):
+        digest.update(os.path.splitext(workload)[1].lower().encode())
+        with open(workload, 'rb') as stream:
+            for chunk in iter(lambda: stream.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+    else:
+        digest.update(json.dumps([
+            list(map(int, record[:4])) + [[list(map(int, io_op)) for io_op in record[4]]]
+            if len(record) > 4 else list(map(int, record))
+            for record in workload
+        ]).encode())
+    return digest.hexdigest()
+
+
+class CachedResult(NamedTuple):
+    """Metrics of a finished run and, if it was stored, its execution trace"""
+    metrics: Dict[str, float]
+    trace: Optional[Dict[str, np.ndarray]]
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of simulation results
+
+    Entries are keyed by a hash of the workload, the scheduler class, its
+    settings and how the run is stepped and fed, so identical runs are
+    looked up instead of simulated.
+    Every file is written to a temporary name and renamed into place, so
+    concurrent processes sharing the directory never read a partial entry.
+    Reads refresh the modification time and the least recently used
+    entries are evicted once the cache grows beyond max_bytes.
+    """
+
+    def __init__(self, directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, traces: bool = False):
+        """
+        Args:
+            directory: Cache directory, created on first write
+                (default: default_cache_dir())
+            max_bytes: Size the cache is trimmed to after writes
+            traces: Also record and store execution traces
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache size must be greater than 0")
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.traces = traces
+        # Estimate of the cache size, refreshed from disk when it overflows
+        self._size: Optional[int] = None
+
+    def __getstate__(self):
+        # Worker processes measure the shared directory themselves
+        state = self.__dict__.copy()
+        state['_size'] = None
+        return state
+
+    def key(self, workload, scheduler: BaseScheduler, digest: Optional[str] = None,
+            event_driven: bool = True, streamed: bool = False) -> str:
+        """
+        Cache key of running a configured scheduler over a workload
+
+        Args:
+            workload: Workload spec, see workload_digest
+            scheduler: Fresh scheduler with its parameters set
+            digest: Precomputed workload_digest(workload)
+            event_driven: Whether the clock jumps from event to event
+            streamed: Whether processes are admitted lazily from a stream
+                (run_stream) rather than all registered up front
+        """
+        description = {
+            'version': CACHE_VERSION,
+            'workload': digest or workload_digest(workload),
+            'scheduler': type(scheduler).__name__,
+            'settings': scheduler_settings(scheduler),
+            'event_driven': event_driven,
+            'admission': 'stream' if streamed else 'eager',
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key: str, suffix: str = '.json') -> str:
+        """File of an entry (a trace is stored next to it as .npz)"""
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """
+        Look up an entry and mark it as recently used
+
+        Returns:
+            The cached result, or None on a miss (including unreadable
+            entries and, when storing traces, entries without one)
+        """
+        path = self.path(key)
+        try:
+            with open(path) as stream:
+                metrics = json.load(stream)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not self.traces:
+            return CachedResult(metrics, None)
+        trace_path = self.path(key, '.npz')
+        try:
+            with np.load(trace_path) as arrays:
+                trace = {name: arrays[name] for name in arrays.files}
+            os.utime(trace_path)
+        except (OSError, ValueError):
+            return None
+        return CachedResult(metrics, trace)
+
+    def put(self, key: str, metrics: Mapping[str, float],
+            trace: Optional[Mapping[str, np.ndarray]] = None) -> None:
+        """
+        Store an entry atomically, then evict old entries if needed
+
+        Write errors (read-only or full disk) are ignored, the result is
+        simply not cached.
+        """
+        written = 0
+        try:
+            if trace is not None:
+                written += self._write(self.path(key, '.npz'),
+                                       lambda stream: np.savez(stream, **trace))
+            # The metrics file goes last: once it exists the entry is complete
+            written += self._write(self.path(key),
+                                   lambda stream: stream.write(json.dumps(metrics).encode()))
+        except OSError:
+            return
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += written
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _write(self, path: str, write) -> int:
+        """Write a file through a temporary file renamed into place"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as stream:
+                write(stream)
+            os.replace(temporary, path)
+        except BaseException:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            raise
+        return os.path.getsize(path)
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every cache file"""
+        files = []
+        if not os.path.isdir(self.directory):
+            return files
+        for folder in os.scandir(self.directory):
+            if not folder.is_dir():
+                continue
+            for entry in os.scandir(folder.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def size(self) -> int:
+        """Bytes used by the cache on disk"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> None:
+        """Remove least recently used files until the cache fits in max_bytes"""
+        files = sorted(self.entries())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._size = 0
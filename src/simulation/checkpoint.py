@@ -0,0 +1,82 @@
+# src/simulation/checkpoint.py
+import gzip
+import json
+import os
+import tempfile
+from typing import Callable, Iterable, Optional
+from ..process.process import Process
+from ..schedulers.base_scheduler import BaseScheduler
+from ..schedulers.factory import SCHEDULER_CLASSES, process_adder
+
+# Bump when the saved state layout changes
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(scheduler: BaseScheduler, path: str) -> None:
+    """
+    Save the state of a (paused) simulation to a gzip-compressed JSON file
+
+    The file is written under a temporary name and renamed into place, so
+    an interrupted save never leaves a truncated checkpoint behind.
+
+    Args:
+        scheduler: Scheduler to save, not stepping while this runs
+        path: Checkpoint file to write
+    """
+    document = {
+        'version': CHECKPOINT_VERSION,
+        'scheduler': type(scheduler).__name__,
+        'state': scheduler.state_dict(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, \
+                gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as stream:
+            stream.write(json.dumps(document, separators=(',', ':')).encode())
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def load_checkpoint(path: str,
+                    source: Optional[Iterable[Process]] = None,
+                    add: Optional[Callable[[Process], None]] = None) -> BaseScheduler:
+    """
+    Restore a simulation saved with save_checkpoint
+
+    Args:
+        path: Checkpoint file
+        source: For streamed simulations, the arrival source from its
+            beginning (see BaseScheduler.resume_arrivals)
+        add: Callable registering one streamed process, defaults to
+            process_adder(scheduler) so real-time schedulers get their
+            default period and deadline
+
+    Returns:
+        New scheduler that continues where the saved one stopped
+
+    Raises:
+        ValueError: The file is not a checkpoint this version can read
+    """
+    try:
+        with gzip.open(path, 'rb') as stream:
+            document = json.loads(stream.read())
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        raise ValueError(f"Not a checkpoint file: {path} ({e})")
+    if not isinstance(document, dict) or document.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    try:
+        scheduler_class = SCHEDULER_CLASSES[document['scheduler']]
+    except KeyError:
+        raise ValueError(f"Unknown scheduler in checkpoint: {document['scheduler']}")
+
+    scheduler = scheduler_class()
+    scheduler.load_state_dict(document['state'])
+    if source is not None:
+        scheduler.resume_arrivals(source, add or process_adder(scheduler))
+    return scheduler
@@ -0,0 +1,236 @@
+# src/simulation/comparison.py
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from ..process.process import Process
+from ..schedulers.base_scheduler import BaseScheduler
+from ..schedulers.factory import SCHEDULER_TYPES, create_scheduler, add_processes, process_adder
+from ..workload.loader import load_workload
+from .cache import ResultCache, workload_digest
+
+# Picklable description of a workload: (pid, arrival_time, burst_time, priority)
+# tuples, followed by ((io_start, io_duration), ...) for processes with I/O,
+# or the path of a workload file. Workers open binary (.npy) files
+# memory-mapped, so they share one copy through the page cache.
+WorkloadSpec = Union[List[Tuple], str]
+
+
+def workload_spec(processes: Iterable[Process]) -> WorkloadSpec:
+    """Describe processes by their static attributes only"""
+    spec = []
+    for p in processes:
+        record = (p.pid, p.arrival_time, p.burst_time, p.priority)
+        io_operations = getattr(p, 'io_operations', None)
+        if io_operations:
+            record += (tuple((io_op['start_time'], io_op['duration'])
+                             for io_op in io_operations),)
+        spec.append(record)
+    return spec
+
+
+def build_processes(workload: WorkloadSpec) -> List[Process]:
+    """Create fresh processes from a workload spec"""
+    if isinstance(workload, str):
+        return load_workload(workload)
+    processes = []
+    for record in workload:
+        pid, arrival, burst, priority = record[:4]
+        process = Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+        if len(record) > 4:
+            process.io_operations = [
+                {'start_time': start, 'duration': duration, 'completed': False}
+                for start, duration in record[4]
+            ]
+        processes.append(process)
+    return processes
+
+
+def simulate(scheduler: BaseScheduler,
+             processes: Iterable[Process],
+             event_driven: bool = True) -> Dict[str, float]:
+    """
+    Run a configured scheduler over processes to completion
+
+    Args:
+        scheduler: Fresh scheduler, parameters already set
+        processes: Fresh processes to simulate (they are modified)
+        event_driven: Advance the clock from event to event
+
+    Returns:
+        Metrics as produced by MetricTotals.detailed_metrics
+    """
+    scheduler.event_driven = event_driven
+    totals = scheduler.enable_metrics()
+    add_processes(scheduler, processes)
+
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+
+    return totals.detailed_metrics(scheduler.current_time)
+
+
+def run_processes(scheduler_type: str,
+                  processes: List[Process],
+                  quantum: int = 2,
+                  context_switch: int = 0,
+                  event_driven: bool = True) -> Dict[str, float]:
+    """
+    Run one scheduler over processes to completion and return its metrics
+
+    Event-driven stepping gives the same results as ticking, only faster.
+
+    Args:
+        scheduler_type: One of SCHEDULER_TYPES
+        processes: Fresh processes to simulate (they are modified)
+        quantum: Time quantum (Round Robin, MLFQ)
+        context_switch: Context switch overhead
+        event_driven: Advance the clock from event to event
+
+    Returns:
+        Metrics as produced by SchedulingMetrics.calculate_detailed_metrics
+    """
+    scheduler = create_scheduler(scheduler_type, quantum, context_switch)
+    return simulate(scheduler, processes, event_driven)
+
+
+def run_stream(scheduler_type: str,
+               source: Iterable[Process],
+               quantum: int = 2,
+               context_switch: int = 0,
+               event_driven: bool = True) -> Dict[str, float]:
+    """
+    Run one scheduler over an arrival-ordered process stream
+
+    Processes are pulled as simulated time reaches them and dropped once
+    finished, so memory is bounded by the live processes. Arguments are the
+    same as for run_processes, with `source` e.g. from stream_workload.
+    """
+    scheduler = create_scheduler(scheduler_type, quantum, context_switch)
+    scheduler.event_driven = event_driven
+    totals = scheduler.enable_metrics()
+    scheduler.attach_arrivals(source, add=process_adder(scheduler))
+
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+
+    return totals.detailed_metrics(scheduler.current_time)
+
+
+def simulate_spec(scheduler: BaseScheduler,
+                  workload: WorkloadSpec,
+                  event_driven: bool = True,
+                  cache: Optional[ResultCache] = None,
+                  key: Optional[str] = None) -> Dict[str, float]:
+    """
+    Run a configured scheduler over a workload spec, reusing cached results
+
+    Args:
+        scheduler: Fresh scheduler, parameters already set
+        workload: Workload spec to simulate
+        event_driven: Advance the clock from event to event
+        cache: Result cache to look up and fill
+        key: Cache key, if already computed
+
+    Returns:
+        Metrics as produced by MetricTotals.detailed_metrics
+    """
+    if cache is not None:
+        key = key or cache.key(workload, scheduler, event_driven=event_driven)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit.metrics
+        if cache.traces:
+            scheduler.enable_trace()
+    metrics = simulate(scheduler, build_processes(workload), event_driven)
+    if cache is not None:
+        trace = scheduler.trace.arrays() if scheduler.trace is not None else None
+        cache.put(key, metrics, trace)
+    return metrics
+
+
+def cached_future(cache: Optional[ResultCache], key: Optional[str]) -> Optional[Future]:
+    """Already resolved future holding cached metrics, None on a miss"""
+    if cache is None:
+        return None
+    hit = cache.get(key)
+    if hit is None:
+        return None
+    future = Future()
+    future.set_result(hit.metrics)
+    return future
+
+
+def run_scheduler(scheduler_type: str,
+                  workload: WorkloadSpec,
+                  quantum: int = 2,
+                  context_switch: int = 0,
+                  event_driven: bool = True,
+                  cache: Optional[ResultCache] = None,
+                  key: Optional[str] = None) -> Dict[str, float]:
+    """
+    Worker entry point: run one scheduler over a workload spec
+
+    Takes and returns plain data only, so it can run in a process pool.
+    Arguments are the same as for run_processes, plus the result cache
+    and key of simulate_spec.
+    """
+    scheduler = create_scheduler(scheduler_type, quantum, context_switch)
+    return simulate_spec(scheduler, workload, event_driven, cache, key)
+
+
+def submit_comparison(executor: Executor,
+                      workload: WorkloadSpec,
+                      scheduler_types: Sequence[str] = SCHEDULER_TYPES,
+                      quantum: int = 2,
+                      context_switch: int = 0,
+                      cache: Optional[ResultCache] = None) -> Dict[str, Future]:
+    """
+    Submit one run per scheduler without waiting for results
+
+    With a cache, hits are returned as resolved futures without touching
+    the executor, and workers store the results of misses.
+
+    Returns:
+        Futures keyed by scheduler type, in the order given
+    """
+    digest = workload_digest(workload) if cache is not None else None
+    futures = {}
+    for scheduler_type in scheduler_types:
+        key = None
+        if cache is not None:
+            scheduler = create_scheduler(scheduler_type, quantum, context_switch)
+            key = cache.key(workload, scheduler, digest)
+        futures[scheduler_type] = cached_future(cache, key) or executor.submit(
+            run_scheduler, scheduler_type, workload, quantum, context_switch,
+            True, cache, key
+        )
+    return futures
+
+
+def compare_schedulers(workload: WorkloadSpec,
+                       scheduler_types: Sequence[str] = SCHEDULER_TYPES,
+                       quantum: int = 2,
+                       context_switch: int = 0,
+                       max_workers: Optional[int] = None,
+                       cache: Optional[ResultCache] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Run several schedulers on the same workload in parallel processes
+
+    Args:
+        workload: Workload spec to simulate
+        scheduler_types: Schedulers to compare
+        quantum: Time quantum (Round Robin, MLFQ)
+        context_switch: Context switch overhead
+        max_workers: Worker processes (defaults to one per scheduler, at
+            most one per CPU)
+        cache: Result cache; runs found there are not simulated again
+
+    Returns:
+        Detailed metrics keyed by scheduler type, in the order given
+    """
+    if max_workers is None:
+        max_workers = max(1, min(len(scheduler_types), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = submit_comparison(executor, workload, scheduler_types,
+                                    quantum, context_switch, cache)
+        return {name: future.result() for name, future in futures.items()}
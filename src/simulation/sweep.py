@@ -0,0 +1,198 @@
+# src/simulation/sweep.py
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from ..schedulers.base_scheduler import BaseScheduler
+from ..schedulers.factory import SCHEDULER_TYPES, create_scheduler, scheduler_type_of
+from .cache import ResultCache, workload_digest
+from .comparison import WorkloadSpec, cached_future, simulate_spec
+
+# Sweepable parameters and the scheduler attributes showing they apply
+SWEEP_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+    'time_quantum': ('time_quantum',),
+    'base_quantum': ('base_quantum',),
+    'num_queues': ('num_queues',),
+    'boost_interval': ('boost_interval',),
+    'context_switch_penalty': ('context_switch_penalty', 'context_switch_overhead'),
+    'preemptive': ('preemptive',),
+}
+
+# A grid maps parameter names to candidate values (all combinations are
+# run); a list of dicts gives the combinations explicitly
+ParameterGrid = Union[Mapping[str, Sequence[Any]], Sequence[Mapping[str, Any]]]
+
+
+def check_parameters(names) -> None:
+    """Raise ValueError for names that are not SWEEP_PARAMETERS"""
+    unknown = [name for name in names if name not in SWEEP_PARAMETERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown sweep parameter(s): {', '.join(unknown)} "
+            f"(expected {', '.join(SWEEP_PARAMETERS)})"
+        )
+
+
+def expand_grid(grid: ParameterGrid) -> List[Dict[str, Any]]:
+    """
+    List the parameter combinations of a grid
+
+    Args:
+        grid: Dict of candidate values per parameter, or a list of dicts
+
+    Returns:
+        One dict per combination, in grid order (last parameter varies fastest)
+    """
+    if isinstance(grid, Mapping):
+        check_parameters(grid)
+        names = list(grid)
+        return [dict(zip(names, values))
+                for values in itertools.product(*(grid[name] for name in names))]
+    combinations = [dict(params) for params in grid]
+    for params in combinations:
+        check_parameters(params)
+    return combinations
+
+
+def scheduler_parameters(scheduler_type: str) -> Tuple[str, ...]:
+    """Sweep parameters that affect a scheduler type"""
+    scheduler = create_scheduler(scheduler_type)
+    return tuple(
+        name for name, attrs in SWEEP_PARAMETERS.items()
+        if any(hasattr(scheduler, attr) for attr in attrs)
+    )
+
+
+def configure_scheduler(scheduler_type: str, params: Mapping[str, Any]) -> BaseScheduler:
+    """
+    Create a scheduler with sweep parameters applied
+
+    Parameters that do not apply to the scheduler type are ignored.
+
+    Args:
+        scheduler_type: One of SCHEDULER_TYPES
+        params: Values of SWEEP_PARAMETERS
+
+    Returns:
+        New scheduler instance
+    """
+    check_parameters(params)
+    quantum = params.get('time_quantum' if scheduler_type == 'Round Robin' else 'base_quantum', 2)
+    scheduler = create_scheduler(
+        scheduler_type,
+        quantum=quantum,
+        context_switch=params.get('context_switch_penalty', 0),
+        num_queues=params.get('num_queues', 3),
+        boost_interval=params.get('boost_interval'),
+    )
+    if 'preemptive' in params and hasattr(scheduler, 'preemptive'):
+        scheduler.preemptive = bool(params['preemptive'])
+    return scheduler
+
+
+def sweep_configurations(scheduler_types: Sequence[str],
+                         grid: ParameterGrid) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    List the distinct (scheduler type, parameters) runs of a sweep
+
+    Each combination keeps only the parameters its scheduler uses, and
+    combinations that are then identical run once: sweeping the quantum
+    does not rerun FCFS for every value. Runs are named after the
+    scheduler they configure, so sweeping `preemptive` over both Priority
+    types yields one preemptive and one non-preemptive run, each labelled
+    as such.
+    """
+    combinations = expand_grid(grid)
+    configurations = []
+    seen = set()
+    for scheduler_type in scheduler_types:
+        used = scheduler_parameters(scheduler_type)
+        for params in combinations:
+            relevant = {name: value for name, value in params.items() if name in used}
+            name = scheduler_type_of(configure_scheduler(scheduler_type, relevant))
+            key = (name, tuple(sorted(relevant.items())))
+            if key not in seen:
+                seen.add(key)
+                configurations.append((name, relevant))
+    return configurations
+
+
+def run_configuration(scheduler_type: str,
+                      workload: WorkloadSpec,
+                      params: Mapping[str, Any],
+                      event_driven: bool = True,
+                      cache: Optional[ResultCache] = None,
+                      key: Optional[str] = None) -> Dict[str, float]:
+    """
+    Worker entry point: run one sweep configuration over a workload spec
+
+    Takes and returns plain data only, so it can run in a process pool.
+    """
+    scheduler = configure_scheduler(scheduler_type, params)
+    return simulate_spec(scheduler, workload, event_driven, cache, key)
+
+
+def sweep(workload: WorkloadSpec,
+          grid: ParameterGrid,
+          scheduler_types: Sequence[str] = SCHEDULER_TYPES,
+          event_driven: bool = True,
+          max_workers: Optional[int] = None,
+          cache: Optional[ResultCache] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Run every scheduler over every parameter combination in parallel
+
+    Rows are yielded as soon as they and all earlier rows are done, in
+    configuration order. Only a few runs per worker are submitted ahead,
+    so large grids do not queue up thousands of pending results.
+
+    Args:
+        workload: Workload spec to simulate (a file path is loaded by
+            each worker)
+        grid: Parameter grid, see expand_grid
+        scheduler_types: Schedulers to sweep
+        event_driven: Advance the clock from event to event
+        max_workers: Worker processes (defaults to one per CPU)
+        cache: Result cache; configurations found there are not run again
+
+    Yields:
+        Dicts with the scheduler, one column per swept parameter (None
+        where it does not apply) and the detailed metrics
+    """
+    configurations = sweep_configurations(scheduler_types, grid)
+    columns = []
+    for params in expand_grid(grid):
+        columns.extend(name for name in params if name not in columns)
+    if not configurations:
+        return
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(configurations)))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        digest = workload_digest(workload) if cache is not None else None
+        for scheduler_type, params in configurations:
+            key = None
+            if cache is not None:
+                key = cache.key(workload, configure_scheduler(scheduler_type, params), digest,
+                                event_driven=event_driven)
+            future = cached_future(cache, key) or executor.submit(
+                run_configuration, scheduler_type, workload, params, event_driven,
+                cache, key
+            )
+            pending.append((scheduler_type, params, future))
+            if len(pending) < 2 * max_workers:
+                continue
+            yield sweep_row(columns, *pending.popleft())
+        while pending:
+            yield sweep_row(columns, *pending.popleft())
+
+
+def sweep_row(columns: Sequence[str], scheduler_type: str,
+              params: Mapping[str, Any], future) -> Dict[str, Any]:
+    """Result row of a finished sweep run"""
+    row = {'scheduler': scheduler_type}
+    row.update((name, params.get(name)) for name in columns)
+    row.update(future.result())
+    return row
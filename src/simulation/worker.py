@@ -0,0 +1,405 @@
+# src/simulation/worker.py
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple
+import numpy as np
+from ..process.process import Process
+from ..process.process_state import ProcessState
+from ..schedulers.base_scheduler import BaseScheduler
+from ..utils.metrics import MetricTotals
+
+# Default pace of the simulation, in scheduler steps per second
+DEFAULT_STEPS_PER_SECOND = 1.0
+# Speed slider positions are log10 of steps per second, from one step per
+# second up to the right end of the slider, which runs unthrottled
+SPEED_SLIDER_MIN = 0.0
+SPEED_SLIDER_MAX = 4.0
+# Snapshots are published at most this often while running
+DEFAULT_FRAME_INTERVAL = 1 / 30
+# Children per node of a SharedVector
+SHARED_BITS = 5
+SHARED_FANOUT = 1 << SHARED_BITS
+SHARED_MASK = SHARED_FANOUT - 1
+
+
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """Read-only copy of the displayed attributes of a process"""
+    pid: int
+    arrival_time: int
+    burst_time: int
+    priority: int
+    state: ProcessState
+    remaining_time: int
+    waiting_time: int
+    turnaround_time: int
+    context_switches: int
+    start_time: Optional[int]
+    completion_time: Optional[int]
+    io_operations: Tuple[Mapping, ...] = ()
+    # Wait clock the waiting time of a READY process is accounted up to
+    ready_since: Optional[int] = None
+
+    @classmethod
+    def of(cls, process: Process) -> 'ProcessSnapshot':
+        """Copy the current values of a process"""
+        return cls(
+            pid=process.pid,
+            arrival_time=process.arrival_time,
+            burst_time=process.burst_time,
+            priority=process.priority,
+            state=process.state,
+            remaining_time=process.remaining_time,
+            waiting_time=process.waiting_time,
+            turnaround_time=process.turnaround_time,
+            context_switches=process.context_switches,
+            start_time=process.start_time,
+            completion_time=process.completion_time,
+            io_operations=tuple(
+                MappingProxyType(dict(io_op))
+                for io_op in getattr(process, 'io_operations', ())
+            ),
+            ready_since=process.ready_since,
+        )
+
+    def waited_until(self, wait_clock: int) -> 'ProcessSnapshot':
+        """The snapshot with waiting time accounted up to `wait_clock`"""
+        if self.state != ProcessState.READY or self.ready_since is None:
+            return self
+        return replace(self, waiting_time=self.waiting_time + wait_clock - self.ready_since,
+                       ready_since=wait_clock)
+
+    def is_completed(self) -> bool:
+        """Check if process had completed when the snapshot was taken"""
+        return self.state == ProcessState.TERMINATED
+
+
+class SharedVector(Sequence):
+    """
+    Immutable sequence that shares unchanged parts with its predecessors
+
+    Items are stored in a tree of tuples with SHARED_FANOUT children per
+    node. updated() copies only the nodes on the paths to changed items, so
+    replacing k items costs O(k log n) and the rest of the tree is shared.
+    """
+
+    def __init__(self, root: tuple, size: int, depth: int):
+        self._root = root
+        self._size = size
+        self._depth = depth
+
+    @classmethod
+    def of(cls, items: Iterable) -> 'SharedVector':
+        """Build a vector holding `items`"""
+        nodes = tuple(items)
+        size = len(nodes)
+        depth = 0
+        nodes = [nodes[i:i + SHARED_FANOUT] for i in range(0, size, SHARED_FANOUT)] or [()]
+        while len(nodes) > 1:
+            nodes = [tuple(nodes[i:i + SHARED_FANOUT])
+                     for i in range(0, len(nodes), SHARED_FANOUT)]
+            depth += 1
+        return cls(nodes[0], size, depth)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._size)))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SharedVector index out of range")
+        node = self._root
+        for level in range(self._depth, 0, -1):
+            node = node[(index >> (level * SHARED_BITS)) & SHARED_MASK]
+        return node[index & SHARED_MASK]
+
+    def updated(self, changes: Mapping[int, object]) -> 'SharedVector':
+        """New vector with the items at the given indices replaced"""
+        if not changes:
+            return self
+        root = list(self._root)
+        # Nodes already copied, by (level, index prefix)
+        copies = {}
+        for index, value in changes.items():
+            node = root
+            for level in range(self._depth, 0, -1):
+                slot = (index >> (level * SHARED_BITS)) & SHARED_MASK
+                key = (level - 1, index >> (level * SHARED_BITS))
+                child = copies.get(key)
+                if child is None:
+                    child = copies[key] = list(node[slot])
+                    node[slot] = child
+                node = child
+            node[index & SHARED_MASK] = value
+        return SharedVector(_freeze(root), self._size, self._depth)
+
+
+def _freeze(node: list) -> tuple:
+    """Turn the copied (list) nodes of a tree back into tuples"""
+    return tuple(_freeze(child) if isinstance(child, list) else child for child in node)
+
+
+class ProcessSnapshots(Sequence):
+    """
+    Process snapshots of one frame, in display order
+
+    Unchanged processes are shared with earlier frames, so waiting time of
+    READY processes is brought up to the frame's wait clock when an item is
+    read instead of when the frame is taken.
+    """
+
+    def __init__(self, items: SharedVector, wait_clock: int):
+        self.items = items
+        self.wait_clock = wait_clock
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        return self.items[index].waited_until(self.wait_clock)
+
+
+class TraceSnapshot:
+    """Frozen copy of a TraceRecorder, usable wherever `trace.arrays()` is read"""
+
+    def __init__(self, columns: Dict[str, np.ndarray],
+                 open_segment: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Args:
+            columns: Read-only pid, start, end and reason columns, shared
+                with the recorder (see TraceRecorder.shared)
+            open_segment: (pid, start, end, reason) still being recorded
+        """
+        self._closed = columns
+        self._open_segment = open_segment
+        self._columns: Optional[Mapping[str, np.ndarray]] = None
+
+    def arrays(self) -> Mapping[str, np.ndarray]:
+        """Get the (read-only) pid, start, end and reason columns"""
+        if self._columns is None:
+            # Joined on first read, so unread frames cost nothing
+            columns = dict(self._closed)
+            if self._open_segment is not None:
+                for name, value in zip(('pid', 'start', 'end', 'reason'), self._open_segment):
+                    columns[name] = np.append(columns[name], value).astype(columns[name].dtype)
+            for column in columns.values():
+                column.flags.writeable = False
+            self._columns = MappingProxyType(columns)
+        return self._columns
+
+
+@dataclass(frozen=True)
+class SimulationSnapshot:
+    """State of a simulation at one point in time"""
+    time: int
+    processes: Sequence[ProcessSnapshot]
+    trace: Optional[TraceSnapshot]
+    finished: bool
+    # Private copy of the scheduler's online metrics, if enabled
+    metrics: Optional[MetricTotals] = None
+
+
+class SnapshotTaker:
+    """
+    Takes successive snapshots of a scheduler, copying only what changed
+
+    Processes are recopied when the scheduler reports a state change for
+    them and while they hold the CPU, the only times their displayed values
+    change; the trace is shared rather than copied. The cost of a snapshot
+    depends on what happened since the previous one, not on the size of
+    the workload.
+    """
+
+    def __init__(self, scheduler: BaseScheduler, processes):
+        """
+        Args:
+            scheduler: Scheduler being simulated; its state_change_listener
+                is taken over
+            processes: Processes to include, in display order
+        """
+        processes = list(processes)
+        self.scheduler = scheduler
+        self.processes = processes
+        self.index = {id(p): i for i, p in enumerate(processes)}
+        self.items = SharedVector.of(ProcessSnapshot.of(p) for p in processes)
+        self.changed: Set[int] = set()
+        self.last_running: Optional[Process] = None
+        scheduler.state_change_listener = self.on_state_change
+
+    def on_state_change(self, process: Process, old_state: ProcessState) -> None:
+        """Mark a process to be recopied by the next snapshot"""
+        index = self.index.get(id(process))
+        if index is not None:
+            self.changed.add(index)
+
+    def take(self, finished: bool = False) -> SimulationSnapshot:
+        """Snapshot the scheduler, sharing everything unchanged since the last one"""
+        scheduler = self.scheduler
+        changed = self.changed
+        for running in (self.last_running, scheduler.current_process):
+            index = self.index.get(id(running)) if running is not None else None
+            if index is not None:
+                changed.add(index)
+        self.last_running = scheduler.current_process
+        self.items = self.items.updated(
+            {i: ProcessSnapshot.of(self.processes[i]) for i in changed}
+        )
+        changed.clear()
+
+        trace = scheduler.trace
+        return SimulationSnapshot(
+            time=scheduler.current_time,
+            processes=ProcessSnapshots(self.items, scheduler.wait_clock()),
+            trace=TraceSnapshot(*trace.shared()) if trace is not None else None,
+            finished=finished,
+            metrics=scheduler.metrics.copy() if scheduler.metrics is not None else None,
+        )
+
+
+def take_snapshot(scheduler: BaseScheduler, processes, finished: bool = False) -> SimulationSnapshot:
+    """
+    Copy the state of a running scheduler once
+
+    Copies every process; use a SnapshotTaker to snapshot repeatedly.
+
+    Args:
+        scheduler: Scheduler being simulated
+        processes: Processes to include, in display order
+        finished: Whether the simulation has completed
+
+    Returns:
+        SimulationSnapshot sharing no mutable state with the scheduler
+    """
+    processes = list(processes)
+    trace = scheduler.trace
+    return SimulationSnapshot(
+        time=scheduler.current_time,
+        processes=ProcessSnapshots(SharedVector.of(ProcessSnapshot.of(p) for p in processes),
+                                   scheduler.wait_clock()),
+        trace=TraceSnapshot(trace.arrays()) if trace is not None else None,
+        finished=finished,
+        metrics=scheduler.metrics.copy() if scheduler.metrics is not None else None,
+    )
+
+
+def steps_per_second_at(position: float) -> Optional[float]:
+    """Pace selected by a speed slider position, None for unthrottled"""
+    if position >= SPEED_SLIDER_MAX:
+        return None
+    return 10 ** max(position, SPEED_SLIDER_MIN)
+
+
+def describe_speed(steps_per_second: Optional[float]) -> str:
+    """Label for a pace returned by steps_per_second_at"""
+    if steps_per_second is None:
+        return "max"
+    if steps_per_second < 10:
+        return f"{steps_per_second:.1f} steps/s"
+    return f"{steps_per_second:,.0f} steps/s"
+
+
+class SimulationWorker(threading.Thread):
+    """
+    Runs a scheduler on a background thread
+
+    The worker owns the scheduler and its processes while running. Readers
+    only look at `latest`, an immutable SimulationSnapshot replaced (never
+    modified) at most once per frame interval and once more on completion,
+    so the cost of copying state does not grow with the simulation speed,
+    and only what changed since the previous snapshot is copied.
+    """
+
+    def __init__(self,
+                 scheduler: BaseScheduler,
+                 processes,
+                 steps_per_second: Callable[[], float] = lambda: DEFAULT_STEPS_PER_SECOND,
+                 step_hook: Optional[Callable[[BaseScheduler], None]] = None,
+                 frame_interval: float = DEFAULT_FRAME_INTERVAL):
+        """
+        Args:
+            scheduler: Scheduler with its processes already added
+            processes: Processes to snapshot, in display order
+            steps_per_second: Returns the current pace, read before every
+                step; None or a value <= 0 runs unthrottled
+            step_hook: Called with the scheduler after every step
+            frame_interval: Minimum seconds between published snapshots
+        """
+        super().__init__(daemon=True)
+        self.scheduler = scheduler
+        self.processes = list(processes)
+        self.steps_per_second = steps_per_second
+        self.step_hook = step_hook
+        self.frame_interval = frame_interval
+        self.snapshots = SnapshotTaker(scheduler, self.processes)
+        self.latest: Optional[SimulationSnapshot] = None
+        self.events: Deque[str] = deque()
+        self.error: Optional[BaseException] = None
+        self._stop_event = threading.Event()
+
+    def post_event(self, message: str) -> None:
+        """Queue a log message for the UI thread (see drain_events)"""
+        self.events.append(message)
+
+    def drain_events(self):
+        """Yield queued log messages in order"""
+        events = self.events
+        while events:
+            yield events.popleft()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask the worker to stop after the current step and wait for it"""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the simulation ran to completion"""
+        latest = self.latest
+        return latest is not None and latest.finished
+
+    def publish(self, finished: bool = False) -> None:
+        """Replace the latest snapshot"""
+        self.latest = self.snapshots.take(finished)
+
+    def run(self) -> None:
+        scheduler = self.scheduler
+        stop = self._stop_event
+        next_step = time.monotonic()
+        last_publish = float('-inf')
+        try:
+            while not stop.is_set():
+                rate = self.steps_per_second()
+                now = time.monotonic()
+                if rate and rate > 0:
+                    if next_step > now:
+                        # Sleep in short slices so speed changes apply quickly
+                        stop.wait(min(next_step - now, self.frame_interval))
+                        continue
+                    # Do not make up for time spent paused or behind schedule
+                    next_step = max(next_step, now - self.frame_interval) + 1 / rate
+
+                running = scheduler.run_step()
+                if self.step_hook is not None:
+                    self.step_hook(scheduler)
+                if not running:
+                    self.publish(finished=True)
+                    return
+
+                now = time.monotonic()
+                if now - last_publish >= self.frame_interval:
+                    self.publish()
+                    last_publish = now
+            # Stopped: leave the final state of the run visible
+            self.publish()
+        except Exception as e:
+            self.error = e
+            self.publish(finished=True)
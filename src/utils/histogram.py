@@ -0,0 +1,136 @@
+# src/utils/histogram.py
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+# Sub-buckets per power of two are 2**SIGNIFICANT_BITS, bounding the
+# relative error of reported values by 2**-(SIGNIFICANT_BITS + 1)
+SIGNIFICANT_BITS = 7
+
+
+class LatencyHistogram:
+    """
+    Log-linear (HDR style) histogram of non-negative integer durations
+
+    Values below 2 * 2**bits are counted exactly; above that every power of
+    two is split into 2**bits buckets of equal width, so percentiles carry a
+    small bounded relative error while memory stays bounded (a few thousand
+    counters for any 64-bit value). Recording is O(1), histograms with the
+    same precision merge by adding counts, and percentile queries do not
+    depend on how many values were recorded.
+    """
+
+    def __init__(self, bits: int = SIGNIFICANT_BITS):
+        self.bits = bits
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def bucket(self, value: int) -> int:
+        """Index of the bucket holding `value`"""
+        shift = value.bit_length() - self.bits - 1
+        if shift <= 0:
+            return value
+        return (shift << self.bits) + (value >> shift)
+
+    def bucket_range(self, index: int) -> range:
+        """Values counted in bucket `index`"""
+        shift = (index >> self.bits) - 1
+        if shift <= 0:
+            return range(index, index + 1)
+        low = (index - (shift << self.bits)) << shift
+        return range(low, low + (1 << shift))
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Count a value
+
+        Args:
+            value: Duration to record, negative values are recorded as 0
+            count: Number of occurrences
+        """
+        value = max(0, int(value))
+        index = self.bucket(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the counts of another histogram with the same precision"""
+        if other.bits != self.bits:
+            raise ValueError("Cannot merge histograms of different precision")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def copy(self) -> 'LatencyHistogram':
+        """Independent copy of the histogram"""
+        histogram = LatencyHistogram(self.bits)
+        histogram.merge(self)
+        return histogram
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the histogram"""
+        return {'bits': self.bits, 'counts': list(self.counts), 'count': self.count,
+                'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_state_dict(cls, state: Dict[str, Any]) -> 'LatencyHistogram':
+        """Rebuild a histogram saved with state_dict()"""
+        histogram = cls(state['bits'])
+        histogram.counts = list(state['counts'])
+        histogram.count = state['count']
+        histogram.total = state['total']
+        histogram.min = state['min']
+        histogram.max = state['max']
+        return histogram
+
+    def mean(self) -> float:
+        """Exact mean of the recorded values (0 when empty)"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Value below which q percent of the recorded values fall
+
+        Uses the nearest-rank definition; the result is the middle of the
+        matching bucket, clamped to the recorded minimum and maximum.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            The percentile (0 when empty)
+        """
+        return self.percentiles((q,))[q]
+
+    def percentiles(self, qs: Sequence[float]) -> Dict[float, float]:
+        """Several percentiles with one pass over the buckets"""
+        if not self.count:
+            return {q: 0.0 for q in qs}
+        cumulative = np.cumsum(self.counts)
+        result = {}
+        for q in qs:
+            if not 0 <= q <= 100:
+                raise ValueError(f"Percentile must be between 0 and 100: {q}")
+            rank = max(1, int(np.ceil(q / 100 * self.count)))
+            index = int(np.searchsorted(cumulative, rank))
+            values = self.bucket_range(index)
+            middle = (values.start + values.stop - 1) / 2
+            result[q] = float(min(max(middle, self.min), self.max))
+        return result
@@ -1,15 +1,137 @@
 # src/utils/metrics.py
-from typing import List, Dict
+from typing import Any, List, Dict, Sequence, Union
 from ..process.process import Process
+from ..process.process_table import ProcessTable
+from .histogram import LatencyHistogram
+
+# Percentiles reported next to the averages
+PERCENTILES = (50, 95, 99)
+
+# Running sums and histograms of MetricTotals
+TOTAL_FIELDS = ('count', 'waiting', 'turnaround', 'response', 'burst',
+                'io_time', 'context_switches')
+HISTOGRAM_FIELDS = ('waiting_histogram', 'turnaround_histogram', 'response_histogram')
+
+
+class MetricTotals:
+    """
+    Running sums and latency histograms behind the detailed metrics
+
+    Processes are added one at a time as they start and finish, so metrics
+    of a streamed simulation need no list of all processes. Waiting,
+    turnaround and response times also go into LatencyHistograms, which
+    give their percentiles in time independent of the process count.
+    Schedulers keep one up to date after enable_metrics().
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.waiting = 0
+        self.turnaround = 0
+        self.response = 0
+        self.burst = 0
+        self.io_time = 0
+        self.context_switches = 0
+        self.waiting_histogram = LatencyHistogram()
+        self.turnaround_histogram = LatencyHistogram()
+        self.response_histogram = LatencyHistogram()
+
+    def dispatch(self, p: Process, start_time: int) -> None:
+        """Account the first dispatch of a process at `start_time`"""
+        response = start_time - p.arrival_time
+        self.response += response
+        self.response_histogram.record(response)
+
+    def complete(self, p: Process) -> None:
+        """Account a finished process (its response is added by dispatch)"""
+        self.count += 1
+        self.waiting += p.waiting_time
+        self.turnaround += p.turnaround_time
+        self.burst += p.burst_time
+        self.io_time += sum(io['duration'] for io in getattr(p, 'io_operations', []))
+        self.context_switches += p.context_switches
+        self.waiting_histogram.record(p.waiting_time)
+        self.turnaround_histogram.record(p.turnaround_time)
+
+    def add(self, p: Process) -> None:
+        """Account one finished process, including its response time"""
+        self.complete(p)
+        if p.start_time is not None:
+            self.dispatch(p, p.start_time)
+
+    def merge(self, other: 'MetricTotals') -> None:
+        """Add the totals of another run or shard"""
+        for name in TOTAL_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in HISTOGRAM_FIELDS:
+            getattr(self, name).merge(getattr(other, name))
+
+    def copy(self) -> 'MetricTotals':
+        """Independent copy of the totals"""
+        totals = MetricTotals()
+        totals.merge(self)
+        return totals
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the totals"""
+        state = {name: getattr(self, name) for name in TOTAL_FIELDS}
+        for name in HISTOGRAM_FIELDS:
+            state[name] = getattr(self, name).state_dict()
+        return state
+
+    @classmethod
+    def from_state_dict(cls, state: Dict[str, Any]) -> 'MetricTotals':
+        """Rebuild totals saved with state_dict()"""
+        totals = cls()
+        for name in TOTAL_FIELDS:
+            setattr(totals, name, state[name])
+        for name in HISTOGRAM_FIELDS:
+            setattr(totals, name, LatencyHistogram.from_state_dict(state[name]))
+        return totals
+
+    def percentiles(self, qs: Sequence[float] = PERCENTILES) -> Dict[str, float]:
+        """
+        Tail latencies of waiting, turnaround and response time
+
+        Returns:
+            Dict with keys such as 'p95_waiting_time'
+        """
+        result = {}
+        for name, histogram in (('waiting_time', self.waiting_histogram),
+                                ('turnaround_time', self.turnaround_histogram),
+                                ('response_time', self.response_histogram)):
+            for q, value in histogram.percentiles(qs).items():
+                result[f"p{q:g}_{name}"] = value
+        return result
+
+    def detailed_metrics(self, total_time: int) -> Dict[str, float]:
+        """Same dictionary as SchedulingMetrics.calculate_detailed_metrics"""
+        count = max(1, self.count)  # Empty workloads average to 0
+        metrics = {
+            'avg_waiting_time': self.waiting / count,
+            'avg_turnaround_time': self.turnaround / count,
+            'avg_response_time': self.response / count,
+            'cpu_utilization': (self.burst / total_time * 100) if total_time > 0 else 0,
+            'throughput': self.count / total_time if total_time > 0 else 0,
+            'context_switches': self.context_switches,
+            'io_utilization': (self.io_time / total_time * 100) if total_time > 0 else 0
+        }
+        metrics.update(self.percentiles())
+        return metrics
+
 
 class SchedulingMetrics:
     """
     Enhanced metrics calculation for scheduler performance
     """
     @staticmethod
-    def calculate_metrics(processes: List[Process], total_time: int) -> Dict[str, float]:
+    def calculate_metrics(processes: Union[List[Process], ProcessTable], total_time: int) -> Dict[str, float]:
         """Tính toán các số liệu hiệu năng với xử lý lỗi"""
         try:
+            # Columnar tables are summed with vectorized operations
+            if isinstance(processes, ProcessTable):
+                return processes.metrics(total_time)
+
             if not processes:
                 return {}
 
@@ -55,9 +177,32 @@ class SchedulingMetrics:
 
 
     @staticmethod
-    def generate_report(processes: List[Process], total_time: int) -> str:
+    def calculate_detailed_metrics(processes: List[Process], total_time: int) -> Dict[str, float]:
+        """
+        Comprehensive (unrounded) metrics used for scheduler comparison
+
+        Args:
+            processes: Processes of a finished simulation
+            total_time: Simulation end time
+
+        Returns:
+            Averages, utilizations, throughput, context switch count and
+            p50/p95/p99 of waiting, turnaround and response time
+        """
+        totals = MetricTotals()
+        for p in processes:
+            totals.add(p)
+        return totals.detailed_metrics(total_time)
+
+    @staticmethod
+    def generate_report(processes: Union[List[Process], ProcessTable], total_time: int) -> str:
         """Tạo báo cáo chi tiết về hiệu năng"""
         metrics = SchedulingMetrics.calculate_metrics(processes, total_time)
+        # Tail latencies, SLOs are usually stated on these rather than means
+        totals = MetricTotals()
+        for p in processes:
+            totals.add(p)
+        tails = totals.percentiles()
 
         report = [
             "\nScheduling Performance Report",
@@ -70,6 +215,12 @@ class SchedulingMetrics:
             f"CPU Utilization: {metrics['cpu_utilization']:.2f}%",
             f"Throughput: {metrics['throughput']:.2f} processes/unit time",
             f"Total Context Switches: {metrics['context_switches']}",
+        ]
+        for name in ('waiting_time', 'turnaround_time', 'response_time'):
+            label = name.replace('_', ' ').title()
+            values = " / ".join(f"{tails[f'p{q}_{name}']:.2f}" for q in PERCENTILES)
+            report.append(f"P{'/P'.join(str(q) for q in PERCENTILES)} {label}: {values}")
+        report += [
             "\nPer-Process Details:",
             "-------------------"
         ]
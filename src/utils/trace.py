@@ -0,0 +1,172 @@
+# src/utils/trace.py
+import csv
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+# Why an execution segment ended
+REASON_RUNNING = 0     # Still running when the trace was exported
+REASON_COMPLETED = 1   # Process finished
+REASON_PREEMPTED = 2   # Another process took the CPU
+REASON_QUANTUM = 3     # Time quantum expired
+REASON_BLOCKED = 4     # Process started I/O
+REASON_NAMES = ['running', 'completed', 'preempted', 'quantum', 'blocked']
+
+
+class TraceRecorder:
+    """
+    Run-length-encoded record of what ran on the CPU and when
+
+    Execution is recorded as (pid, start, end, reason) segments. Consecutive
+    slices of the same process are merged into the open segment, so the
+    arrays only grow on context switches, not with the number of ticks.
+    Storage is preallocated and doubled when full.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self.pid = np.empty(capacity, dtype=np.int64)
+        self.start = np.empty(capacity, dtype=np.int64)
+        self.end = np.empty(capacity, dtype=np.int64)
+        self.reason = np.empty(capacity, dtype=np.int8)
+        self.size = 0
+        # Open segment, kept in scalars until the CPU switches
+        self._open_pid: Optional[int] = None
+        self._open_start = 0
+        self._open_end = 0
+        self._open_reason = REASON_RUNNING
+
+    def __len__(self) -> int:
+        return self.size + (self._open_pid is not None)
+
+    def extend(self, pid: int, start: int, end: int) -> None:
+        """
+        Record that `pid` ran during [start, end)
+
+        Extends the open segment when the same process continues without a
+        gap, otherwise closes it and opens a new one.
+        """
+        if self._open_pid == pid and self._open_end == start:
+            self._open_end = end
+            self._open_reason = REASON_RUNNING
+            return
+        self._flush()
+        self._open_pid = pid
+        self._open_start = start
+        self._open_end = end
+        self._open_reason = REASON_RUNNING
+
+    def end_segment(self, reason: int) -> None:
+        """Set why the open segment stopped"""
+        if self._open_pid is not None:
+            self._open_reason = reason
+
+    def _flush(self) -> None:
+        """Append the open segment to the arrays"""
+        if self._open_pid is None:
+            return
+        if self.size == len(self.pid):
+            self._grow()
+        i = self.size
+        self.pid[i] = self._open_pid
+        self.start[i] = self._open_start
+        self.end[i] = self._open_end
+        self.reason[i] = self._open_reason
+        self.size += 1
+        self._open_pid = None
+
+    def _grow(self) -> None:
+        """Double the capacity of every column"""
+        capacity = 2 * len(self.pid)
+        for name in ('pid', 'start', 'end', 'reason'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Export the trace as columns
+
+        Returns:
+            Copies of the pid, start, end and reason columns, including the
+            open segment
+        """
+        n = self.size
+        columns = {
+            'pid': self.pid[:n].copy(),
+            'start': self.start[:n].copy(),
+            'end': self.end[:n].copy(),
+            'reason': self.reason[:n].copy(),
+        }
+        if self._open_pid is not None:
+            for name, value in (('pid', self._open_pid), ('start', self._open_start),
+                                ('end', self._open_end), ('reason', self._open_reason)):
+                columns[name] = np.append(columns[name], value).astype(columns[name].dtype)
+        return columns
+
+    def shared(self) -> Tuple[Dict[str, np.ndarray], Optional[Tuple[int, int, int, int]]]:
+        """
+        Export the trace without copying it
+
+        Closed segments are only ever appended to, and growing moves the
+        columns to new arrays, so views of them stay valid while recording
+        continues. Cost does not depend on the length of the trace.
+
+        Returns:
+            Read-only views of the closed pid, start, end and reason columns,
+            and the open (pid, start, end, reason) segment or None
+        """
+        n = self.size
+        columns = {}
+        for name in ('pid', 'start', 'end', 'reason'):
+            view = getattr(self, name)[:n]
+            view.flags.writeable = False
+            columns[name] = view
+        open_segment = None
+        if self._open_pid is not None:
+            open_segment = (self._open_pid, self._open_start,
+                            self._open_end, self._open_reason)
+        return columns, open_segment
+
+    def state_dict(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the recorder, open segment included"""
+        n = self.size
+        return {
+            'pid': self.pid[:n].tolist(),
+            'start': self.start[:n].tolist(),
+            'end': self.end[:n].tolist(),
+            'reason': self.reason[:n].tolist(),
+            'open': (None if self._open_pid is None else
+                     [self._open_pid, self._open_start, self._open_end, self._open_reason]),
+        }
+
+    @classmethod
+    def from_state_dict(cls, state: Dict[str, Any]) -> 'TraceRecorder':
+        """Rebuild a recorder saved with state_dict(), ready to extend"""
+        n = len(state['pid'])
+        recorder = cls(max(1024, 2 * n))
+        for name in ('pid', 'start', 'end', 'reason'):
+            getattr(recorder, name)[:n] = state[name]
+        recorder.size = n
+        if state['open'] is not None:
+            (recorder._open_pid, recorder._open_start,
+             recorder._open_end, recorder._open_reason) = state['open']
+        return recorder
+
+    def segments(self) -> List[Tuple[int, int, int, str]]:
+        """Export the trace as (pid, start, end, reason name) tuples"""
+        columns = self.arrays()
+        return [
+            (pid, start, end, REASON_NAMES[reason])
+            for pid, start, end, reason in zip(
+                columns['pid'].tolist(), columns['start'].tolist(),
+                columns['end'].tolist(), columns['reason'].tolist()
+            )
+        ]
+
+    def to_csv(self, filename: str) -> None:
+        """Write the trace to a CSV file with a pid,start,end,reason header"""
+        with open(filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['pid', 'start', 'end', 'reason'])
+            writer.writerows(self.segments())
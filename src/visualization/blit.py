@@ -0,0 +1,74 @@
+# src/visualization/blit.py
+from typing import List, Optional
+from matplotlib.artist import Artist
+
+
+class BlitManager:
+    """
+    Redraws a few animated artists over a cached background
+
+    Static artists (axes, labels, legend) are rendered once by a full
+    canvas draw and kept as a bitmap. A frame then only restores that bitmap,
+    draws the animated artists and blits the result. Any full draw, e.g.
+    after a resize, refreshes the cached background automatically.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.artists: List[Artist] = []
+        self.background = None
+        self.full_draws = 0
+        self._draw_id = canvas.mpl_connect('draw_event', self.on_draw)
+
+    def add(self, artist: Optional[Artist]) -> Optional[Artist]:
+        """Register an artist that is redrawn every frame"""
+        if artist is not None:
+            artist.set_animated(True)
+            self.artists.append(artist)
+        return artist
+
+    def clear(self) -> None:
+        """Forget all animated artists and the cached background"""
+        self.artists = []
+        self.background = None
+
+    def on_draw(self, event) -> None:
+        """Cache the freshly drawn static content, then draw animated artists"""
+        canvas = self.canvas
+        self.full_draws += 1
+        self.background = canvas.copy_from_bbox(canvas.figure.bbox)
+        self._draw_animated()
+
+    def draw(self) -> None:
+        """Full redraw: render everything, recapturing the background"""
+        self.canvas.draw()
+
+    def paint_background(self, artist: Artist) -> None:
+        """
+        Permanently add an artist's pixels to the cached background
+
+        Used for content that will not change any more, so later frames
+        do not pay for drawing it again.
+        """
+        if self.background is None:
+            self.draw()
+            return
+        canvas = self.canvas
+        canvas.restore_region(self.background)
+        canvas.figure.draw_artist(artist)
+        self.background = canvas.copy_from_bbox(canvas.figure.bbox)
+
+    def update(self) -> None:
+        """Blit a frame: cached background plus the animated artists"""
+        canvas = self.canvas
+        if self.background is None or not canvas.supports_blit:
+            self.draw()
+            return
+        canvas.restore_region(self.background)
+        self._draw_animated()
+        canvas.blit(canvas.figure.bbox)
+
+    def _draw_animated(self) -> None:
+        figure = self.canvas.figure
+        for artist in self.artists:
+            figure.draw_artist(artist)
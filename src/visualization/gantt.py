@@ -1,16 +1,185 @@
 # src/visualization/gantt.py
 import matplotlib.pyplot as plt
-from typing import List, Dict
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Patch
+import numpy as np
+from typing import List, Dict, Optional, Sequence, Tuple
 from ..process.process import Process
 from ..process.process_state import ProcessState
+from ..utils.trace import TraceRecorder
+from .blit import BlitManager
+
+# Above this many segments the chart switches to a utilization heatmap
+LOD_SEGMENT_THRESHOLD = 20000
+# Segment collections larger than this are rasterized in vector output
+RASTERIZE_THRESHOLD = 2000
+# Process labels are only drawn for charts with at most this many rows
+MAX_LABELED_ROWS = 60
+# Heatmap resolution (process buckets x time buckets)
+HEATMAP_ROWS = 400
+HEATMAP_BINS = 800
+# Figure height cap in inches, tall figures stop being readable
+MAX_FIGURE_HEIGHT = 12
+
+
+def segment_polygons(rows: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                     height: float = 0.8) -> np.ndarray:
+    """
+    Rectangle vertices of horizontal bars, built without a Python loop
+
+    Returns:
+        Array of shape (n, 4, 2) for a PolyCollection
+    """
+    rows = np.asarray(rows, dtype=float)
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    low = rows - height / 2
+    high = rows + height / 2
+    verts = np.empty((len(rows), 4, 2))
+    verts[:, 0, 0] = starts
+    verts[:, 0, 1] = low
+    verts[:, 1, 0] = starts
+    verts[:, 1, 1] = high
+    verts[:, 2, 0] = ends
+    verts[:, 2, 1] = high
+    verts[:, 3, 0] = ends
+    verts[:, 3, 1] = low
+    return verts
+
+
+def busy_heatmap(rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, n_rows: int,
+                 row_buckets: int = HEATMAP_ROWS,
+                 time_bins: int = HEATMAP_BINS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate segments into a (process bucket x time bucket) CPU share grid
+
+    Each segment contributes its exact overlap with every time bucket, so a
+    cell holds the fraction of that time bucket the CPU spent on processes
+    of that bucket (between 0 and 1 for non-overlapping segments).
+
+    Returns:
+        (grid, row_edges, time_edges)
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    row_buckets = max(1, min(row_buckets, n_rows))
+    t0 = float(starts.min()) if len(starts) else 0.0
+    t1 = float(ends.max()) if len(ends) else 1.0
+    if t1 <= t0:
+        t1 = t0 + 1
+    time_bins = max(1, min(time_bins, int(np.ceil(t1 - t0))))
+    width = (t1 - t0) / time_bins
+    time_edges = t0 + width * np.arange(time_bins + 1)
+    row_edges = np.linspace(0, n_rows, row_buckets + 1)
+
+    bucket = np.minimum(rows * row_buckets // max(n_rows, 1), row_buckets - 1)
+    first = np.clip(((starts - t0) // width).astype(np.int64), 0, time_bins - 1)
+    last = np.clip(((ends - t0) // width).astype(np.int64), 0, time_bins - 1)
+    # A segment ending exactly on an edge does not touch the next bucket
+    last = np.maximum(first, np.where(time_edges[last] >= ends, last - 1, last))
+
+    busy = np.zeros((row_buckets, time_bins + 1))
+    single = first == last
+    np.add.at(busy, (bucket[single], first[single]), ends[single] - starts[single])
+    multi = ~single
+    b, f, l = bucket[multi], first[multi], last[multi]
+    np.add.at(busy, (b, f), time_edges[f + 1] - starts[multi])
+    np.add.at(busy, (b, l), ends[multi] - time_edges[l])
+    # Buckets strictly between first and last are fully covered
+    full = np.zeros_like(busy)
+    np.add.at(full, (b, f + 1), width)
+    np.add.at(full, (b, l), -width)
+    busy += np.cumsum(full, axis=1)
+    return busy[:, :time_bins] / width, row_edges, time_edges
+
+
+def draw_segments(ax, rows: Sequence[int], starts: Sequence[int], ends: Sequence[int],
+                  colors, n_rows: Optional[int] = None,
+                  lod_threshold: int = LOD_SEGMENT_THRESHOLD,
+                  alpha: float = 0.8):
+    """
+    Draw horizontal bars for many segments with a single artist
+
+    Up to `lod_threshold` segments are drawn as one PolyCollection
+    (rasterized when large); above it they are aggregated into a CPU share
+    heatmap, so drawing cost no longer depends on the segment count.
+
+    Args:
+        ax: Matplotlib axis
+        rows: Row (y position) of each segment
+        starts: Segment start times
+        ends: Segment end times
+        colors: One color name for all segments or a list with one per segment
+        n_rows: Number of rows, defaults to max(rows) + 1
+        lod_threshold: Segment count above which the heatmap is used
+        alpha: Bar transparency
+
+    Returns:
+        The PolyCollection or AxesImage added to the axis (None if empty)
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = np.asarray(starts)
+    ends = np.asarray(ends)
+    if len(rows) == 0:
+        return None
+    if n_rows is None:
+        n_rows = int(rows.max()) + 1
+
+    if len(rows) > lod_threshold:
+        grid, row_edges, time_edges = busy_heatmap(rows, starts, ends, n_rows)
+        image = ax.imshow(
+            grid, aspect='auto', origin='lower', interpolation='nearest',
+            extent=(time_edges[0], time_edges[-1], row_edges[0] - 0.5, row_edges[-1] - 0.5),
+            cmap='Greens', vmin=0, vmax=max(float(grid.max()), 1e-9)
+        )
+        return image
+
+    if isinstance(colors, str):
+        facecolors = [to_rgba(colors, alpha)]
+    else:
+        facecolors = [to_rgba(c, alpha) for c in colors]
+    collection = PolyCollection(
+        segment_polygons(rows, starts, ends),
+        facecolors=facecolors,
+        edgecolors='none',
+        rasterized=len(rows) > RASTERIZE_THRESHOLD
+    )
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+
+
+def trace_rows(trace: TraceRecorder, processes: Sequence[Process]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map trace segments to chart rows (the position of each pid in processes)
+
+    Segments of processes that are not listed are dropped.
+
+    Returns:
+        (rows, starts, ends) arrays
+    """
+    columns = trace.arrays()
+    pids = np.array([p.pid for p in processes], dtype=np.int64)
+    order = np.argsort(pids, kind='stable')
+    position = np.searchsorted(pids[order], columns['pid'])
+    position = np.minimum(position, len(pids) - 1)
+    known = pids[order][position] == columns['pid'] if len(pids) else np.zeros(0, dtype=bool)
+    return order[position][known], columns['start'][known], columns['end'][known]
+
 
 class GanttChart:
     """
     Gantt Chart visualization for CPU scheduling
     """
-    def __init__(self, processes: List[Process], title: str = "CPU Scheduling Gantt Chart"):
+    def __init__(self, processes: List[Process], title: str = "CPU Scheduling Gantt Chart",
+                 trace: Optional[TraceRecorder] = None,
+                 lod_threshold: int = LOD_SEGMENT_THRESHOLD):
         self.processes = processes
         self.title = title
+        self.trace = trace
+        self.lod_threshold = lod_threshold
         self.colors: Dict[ProcessState, str] = {
             ProcessState.RUNNING: "#2ecc71",    # Green
             ProcessState.READY: "#3498db",      # Blue
@@ -18,34 +187,51 @@ class GanttChart:
             ProcessState.TERMINATED: "#95a5a6",  # Gray
         }
 
-    def _plot_process_timeline(self, ax, process: Process, y_position: int) -> None:
+    def _segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
         """
-        Plot timeline for a single process
-        
-        Args:
-            ax: Matplotlib axis
-            process: Process to plot
-            y_position: Vertical position in chart
+        Rows, starts, ends and colors of everything to draw
+
+        With a trace the real execution segments are used, otherwise each
+        process gets a waiting bar (arrival to start) and a running bar
+        (start to completion).
         """
-        # Plot running time
-        if process.start_time is not None and process.completion_time is not None:
-            ax.barh(
-                y_position,
-                process.completion_time - process.start_time,
-                left=process.start_time,
-                color=self.colors[ProcessState.RUNNING],
-                alpha=0.5
-            )
+        running = self.colors[ProcessState.RUNNING]
+        if self.trace is not None:
+            rows, starts, ends = trace_rows(self.trace, self.processes)
+            return rows, starts, ends, [running]
 
-        # Plot waiting time
-        if process.start_time > process.arrival_time:
-            ax.barh(
-                y_position,
-                process.start_time - process.arrival_time,
-                left=process.arrival_time,
-                color=self.colors[ProcessState.READY],
-                alpha=0.5
-            )
+        rows, starts, ends, colors = [], [], [], []
+        for i, process in enumerate(self.processes):
+            if process.start_time is None:
+                continue
+            if process.completion_time is not None:
+                rows.append(i)
+                starts.append(process.start_time)
+                ends.append(process.completion_time)
+                colors.append(running)
+            if process.start_time > process.arrival_time:
+                rows.append(i)
+                starts.append(process.arrival_time)
+                ends.append(process.start_time)
+                colors.append(self.colors[ProcessState.READY])
+        return np.array(rows, dtype=np.int64), np.array(starts), np.array(ends), colors
+
+    def draw(self, ax) -> None:
+        """Draw the chart on an existing axis"""
+        rows, starts, ends, colors = self._segments()
+        if len(colors) == 1:
+            colors = colors[0]
+        draw_segments(ax, rows, starts, ends, colors,
+                      n_rows=max(1, len(self.processes)),
+                      lod_threshold=self.lod_threshold, alpha=0.5)
+
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Process ID")
+        if len(self.processes) <= MAX_LABELED_ROWS:
+            ax.set_yticks(range(len(self.processes)))
+            ax.set_yticklabels([f"P{p.pid}" for p in self.processes])
+        ax.set_title(self.title)
+        ax.grid(True)
 
     def create_chart(self, save_path: str = None) -> None:
         """
@@ -54,23 +240,224 @@ class GanttChart:
         Args:
             save_path: Optional path to save the chart image
         """
-        fig, ax = plt.subplots(figsize=(12, len(self.processes) * 0.5 + 2))
-        
-        # Plot each process timeline
-        for i, process in enumerate(self.processes):
-            self._plot_process_timeline(ax, process, i)
-        
-        # Customize chart appearance
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Process ID")
-        ax.set_yticks(range(len(self.processes)))
-        ax.set_yticklabels([f"P{p.pid}" for p in self.processes])
-        ax.set_title(self.title)
-        ax.grid(True)
+        height = min(len(self.processes) * 0.5 + 2, MAX_FIGURE_HEIGHT)
+        fig, ax = plt.subplots(figsize=(12, height))
+        self.draw(ax)
         
         # Save or show
         if save_path:
             plt.savefig(save_path)
             plt.close()
         else:
-            plt.show()
\ No newline at end of file
+            plt.show()
+
+
+def time_limit(start: float, end: float) -> float:
+    """Right axis limit leaving room to grow, so limits change rarely"""
+    return end + max(10.0, 0.25 * (end - start))
+
+
+def layout_time_axes(ax, processes: Sequence[Process], start: float, end: float,
+                     title: str) -> float:
+    """
+    Set the time limits, row labels and titles of a live chart
+
+    Returns:
+        Right time limit, see time_limit
+    """
+    # Leave room on the right so limits survive many frames
+    xmax = time_limit(start, end)
+    ax.set_xlim(start - 0.05 * (xmax - start), xmax)
+    # Labels only stay readable for small charts
+    if len(processes) <= MAX_LABELED_ROWS:
+        ax.set_yticks(range(len(processes)))
+        ax.set_yticklabels([f'P{p.pid}' for p in processes])
+    ax.set_xlabel('Time')
+    ax.set_title(title)
+    return xmax
+
+
+class LiveGanttChart:
+    """
+    Gantt chart of a running simulation, updated incrementally
+
+    Artists persist between frames and are redrawn with blitting. Segments
+    of terminated processes never change again, so they are painted into
+    the cached background once; each frame only redraws the segments of
+    live processes. Layout (ticks, labels, legend, tight_layout) is redone
+    only when the rows, the legend entries or the axis limits change.
+    """
+
+    def __init__(self, figure, canvas, colors: Dict[ProcessState, str],
+                 title: str = "CPU Scheduling Gantt Chart",
+                 lod_threshold: int = LOD_SEGMENT_THRESHOLD,
+                 alpha: float = 0.8):
+        """
+        Args:
+            figure: Matplotlib figure owned by the chart
+            canvas: Canvas of the figure
+            colors: Bar color of each process state
+            title: Chart title
+            lod_threshold: Segment count above which a heatmap is drawn
+            alpha: Bar transparency
+        """
+        self.figure = figure
+        self.colors = colors
+        self.title = title
+        self.lod_threshold = lod_threshold
+        self.blit = BlitManager(canvas)
+        self.states = list(colors)
+        self.rgba = np.array([to_rgba(colors[state], alpha) for state in self.states])
+        self.layouts = 0
+        self._layout_key = None
+        self._xmax = 0.0
+        self._settled = np.zeros(0, dtype=bool)
+        self.ax = None
+        self.live = None
+        self.settled = None
+        self.batch = None
+        self.heatmap = None
+
+    def update(self, processes: Sequence[Process],
+               trace: Optional[TraceRecorder] = None) -> None:
+        """
+        Show the current state of the processes
+
+        Args:
+            processes: Processes, one chart row each
+            trace: Execution trace; without one each process gets a single
+                bar of its executed time
+        """
+        rows, starts, ends = self._segments(processes, trace)
+        state_codes = np.array(
+            [self.states.index(p.state) for p in processes], dtype=np.int64
+        )
+        terminated = state_codes == self.states.index(ProcessState.TERMINATED)
+        lod = len(rows) > self.lod_threshold
+        pids = tuple(p.pid for p in processes)
+        shown = frozenset(p.state for p in processes if p.start_time is not None)
+        # The legend keeps every state seen so far instead of flickering
+        if self._layout_key is not None and self._layout_key[0] == pids:
+            shown |= self._layout_key[2]
+        layout_key = (pids, lod, shown)
+
+        xmax = float(ends.max()) if len(ends) else 0.0
+        if (layout_key != self._layout_key or xmax > self._xmax
+                or (self._settled & ~terminated).any()):
+            self._layout(processes, rows, starts, ends, state_codes, terminated,
+                         lod, shown, layout_key)
+            return
+
+        if lod:
+            self._update_heatmap(rows, starts, ends, len(processes))
+        else:
+            newly = terminated & ~self._settled
+            if newly.any():
+                batch = newly[rows]
+                self.batch.set_verts(segment_polygons(rows[batch], starts[batch], ends[batch]))
+                self.settled.get_paths().extend(self.batch.get_paths())
+                self.blit.paint_background(self.batch)
+                self._settled = terminated
+            self._update_live(rows, starts, ends, state_codes)
+        self.blit.update()
+
+    def _segments(self, processes, trace) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rows, starts and ends of the execution bars"""
+        if trace is not None:
+            return trace_rows(trace, processes)
+        rows, starts, ends = [], [], []
+        for i, process in enumerate(processes):
+            if process.start_time is None:
+                continue
+            executed_time = process.burst_time - process.remaining_time
+            if executed_time > 0:
+                rows.append(i)
+                starts.append(process.start_time)
+                ends.append(process.start_time + executed_time)
+        return (np.array(rows, dtype=np.int64), np.array(starts, dtype=np.int64),
+                np.array(ends, dtype=np.int64))
+
+    def _update_live(self, rows, starts, ends, state_codes) -> None:
+        """Bars of processes that have not terminated, colored by state"""
+        live = ~self._settled[rows]
+        self.live.set_verts(segment_polygons(rows[live], starts[live], ends[live]))
+        self.live.set_facecolor(self.rgba[state_codes[rows[live]]])
+
+    def _update_heatmap(self, rows, starts, ends, n_rows) -> None:
+        grid, row_edges, time_edges = busy_heatmap(rows, starts, ends, n_rows)
+        self.heatmap.set_data(grid)
+        self.heatmap.set_extent((time_edges[0], time_edges[-1],
+                                 row_edges[0] - 0.5, row_edges[-1] - 0.5))
+        self.heatmap.set_clim(0, max(float(grid.max()), 1e-9))
+
+    def _layout(self, processes, rows, starts, ends, state_codes, terminated,
+                lod, shown, layout_key) -> None:
+        """Rebuild axes and artists from scratch and do a full draw"""
+        self.layouts += 1
+        self._layout_key = layout_key
+        self.figure.clear()
+        self.blit.clear()
+        ax = self.ax = self.figure.add_subplot(111)
+        ax.set_axisbelow(True)
+        n_rows = len(processes)
+        if not n_rows:
+            self._settled = np.zeros(0, dtype=bool)
+            self._xmax = 0.0
+            self.blit.draw()
+            return
+
+        # I/O operations are fixed per process, they belong to the background
+        io_rows, io_starts, io_ends = [], [], []
+        for i, process in enumerate(processes):
+            for io_op in getattr(process, 'io_operations', None) or ():
+                io_rows.append(i)
+                start = io_op.get('started_at', io_op['start_time'])
+                io_starts.append(start)
+                io_ends.append(start + io_op['duration'])
+        io_layer = draw_segments(ax, io_rows, io_starts, io_ends, 'red',
+                                 n_rows=n_rows, alpha=0.3)
+        if io_layer is not None and hasattr(io_layer, 'set_hatch'):
+            io_layer.set_hatch('//')
+
+        if lod:
+            self._settled = np.zeros(n_rows, dtype=bool)
+            self.heatmap = self.blit.add(
+                draw_segments(ax, rows, starts, ends, 'green', n_rows=n_rows, lod_threshold=0)
+            )
+        else:
+            self._settled = terminated.copy()
+            done = terminated[rows]
+            self.settled = PolyCollection(
+                segment_polygons(rows[done], starts[done], ends[done]),
+                facecolors=self.rgba[state_codes[rows[done]]],
+                edgecolors='none', rasterized=bool(done.sum() > RASTERIZE_THRESHOLD)
+            )
+            ax.add_collection(self.settled)
+            self.batch = PolyCollection(
+                [], facecolors=[self.rgba[self.states.index(ProcessState.TERMINATED)]],
+                edgecolors='none', animated=True
+            )
+            ax.add_collection(self.batch)
+            self.live = PolyCollection([], edgecolors='none')
+            ax.add_collection(self.live)
+            self.blit.add(self.live)
+            self._update_live(rows, starts, ends, state_codes)
+
+        times = np.concatenate([starts, ends, io_starts, io_ends]).astype(float)
+        start = float(times.min()) if len(times) else 0.0
+        end = float(times.max()) if len(times) else 0.0
+        self._xmax = layout_time_axes(ax, processes, start, end, self.title)
+        ax.set_ylim(-0.5 - 0.05 * n_rows, n_rows - 0.5 + 0.05 * n_rows)
+        ax.set_ylabel('Process')
+        ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+
+        # Legend with one entry per state shown
+        handles = [Patch(color=self.colors[state], label=state.name.title())
+                   for state in self.colors if state in shown]
+        if io_rows:
+            handles.append(Patch(facecolor='red', alpha=0.3, hatch='//', label='I/O'))
+        if handles:
+            ax.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.15, 1))
+
+        self.figure.tight_layout()
+        self.blit.draw()
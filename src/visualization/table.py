@@ -0,0 +1,114 @@
+# src/visualization/table.py
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Fallback Treeview row height in pixels
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTable:
+    """
+    Treeview kept in sync with a list of rows, touching only what changed
+
+    Only the rows inside the visible window have Treeview items. Scrolling
+    rebinds those items to other rows instead of creating new ones, and a
+    refresh only sends values to Tk for items whose text changed, so the
+    per-frame cost depends on the window height, not the number of rows.
+
+    Works with any object offering the Treeview insert/item/delete calls.
+    """
+
+    def __init__(self, tree, row_values: Callable[[Any], Sequence],
+                 key: Optional[Callable[[Any], Any]] = None,
+                 scrollbar=None, window: int = 10):
+        """
+        Args:
+            tree: ttk.Treeview (or compatible object)
+            row_values: Returns the cell values of a row
+            key: Returns the identity of a row (e.g. its pid), defaults to
+                the row position
+            scrollbar: Optional scrollbar to keep in sync (anything with set)
+            window: Number of visible rows
+        """
+        self.tree = tree
+        self.row_values = row_values
+        self.key = key
+        self.scrollbar = scrollbar
+        self.window = max(1, window)
+        self.rows: Sequence = []
+        self.offset = 0
+        self._slots: List[str] = []                # Treeview item per visible row
+        self._shown: List[Optional[tuple]] = []    # Values currently displayed
+        self.items: Dict[Any, str] = {}            # Row key -> item, visible rows only
+
+    def set_rows(self, rows: Sequence) -> None:
+        """Show a new row sequence (kept by reference) and refresh"""
+        self.rows = rows
+        self.refresh()
+
+    def clear(self) -> None:
+        """Remove all rows"""
+        self.set_rows([])
+
+    def resize(self, window: int) -> None:
+        """Change the number of visible rows"""
+        window = max(1, window)
+        if window != self.window:
+            self.window = window
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Bring the visible items up to date with the rows"""
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.window))
+        count = min(self.window, total - self.offset)
+
+        # Items are only created or deleted when the window size changes
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert("", "end", values=()))
+            self._shown.append(None)
+        while len(self._slots) > count:
+            self.tree.delete(self._slots.pop())
+            self._shown.pop()
+
+        items = {}
+        for slot, item in enumerate(self._slots):
+            index = self.offset + slot
+            row = self.rows[index]
+            values = tuple(self.row_values(row))
+            if values != self._shown[slot]:
+                self.tree.item(item, values=values)
+                self._shown[slot] = values
+            items[self.key(row) if self.key else index] = item
+        self.items = items
+
+        if self.scrollbar is not None:
+            if total:
+                self.scrollbar.set(self.offset / total, (self.offset + count) / total)
+            else:
+                self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset: int) -> None:
+        """Make `offset` the first visible row"""
+        offset = max(0, min(offset, len(self.rows) - self.window))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def yview(self, *args) -> None:
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == 'scroll':
+            step = self.window if args[2] == 'pages' else 1
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_mousewheel(self, event) -> str:
+        """Scroll by wheel events (delta on Windows/macOS, buttons 4/5 on X11)"""
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        # Stop the Treeview from scrolling its (few) items itself
+        return "break"
@@ -0,0 +1,92 @@
+# src/visualization/timeline.py
+from typing import Dict, Sequence
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+import numpy as np
+from ..process.process import Process
+from ..process.process_state import ProcessState
+from .blit import BlitManager
+from .gantt import layout_time_axes, segment_polygons
+
+
+class LiveTimeline:
+    """
+    Process state timeline of a running simulation
+
+    Each process is one bar from its arrival to the current time, colored
+    by its state. All bars live in a single animated collection whose
+    vertices and colors are updated in place and blitted; labels, grid and
+    limits are laid out again only when the processes or limits change.
+    """
+
+    def __init__(self, figure, canvas, colors: Dict[ProcessState, str],
+                 title: str = "Process State Timeline", alpha: float = 0.5):
+        """
+        Args:
+            figure: Matplotlib figure owned by the timeline
+            canvas: Canvas of the figure
+            colors: Bar color of each process state
+            title: Chart title
+            alpha: Bar transparency
+        """
+        self.figure = figure
+        self.title = title
+        self.blit = BlitManager(canvas)
+        self.states = list(colors)
+        self.rgba = np.array([to_rgba(colors[state], alpha) for state in self.states])
+        self.layouts = 0
+        self._layout_key = None
+        self._xlim = (0.0, 0.0)
+        self._arrival = np.zeros(0, dtype=np.int64)
+        self.ax = None
+        self.bars = None
+
+    def update(self, processes: Sequence[Process], current_time: int) -> None:
+        """
+        Show the processes as of `current_time`
+
+        Args:
+            processes: Processes, one row each
+            current_time: Simulation time the bars extend to
+        """
+        layout_key = tuple(p.pid for p in processes)
+        if layout_key != self._layout_key:
+            self._arrival = np.array([p.arrival_time for p in processes], dtype=np.int64)
+        arrival = self._arrival
+        state_codes = np.array(
+            [self.states.index(p.state) for p in processes], dtype=np.int64
+        )
+        low = min(float(arrival.min()), current_time) if len(arrival) else 0.0
+        high = max(float(arrival.max()), current_time) if len(arrival) else 0.0
+        if layout_key != self._layout_key or low < self._xlim[0] or high > self._xlim[1]:
+            self._layout(processes, low, high, layout_key)
+
+        if self.bars is not None:
+            rows = np.arange(len(processes))
+            self.bars.set_verts(segment_polygons(rows, arrival, np.full(len(rows), current_time)))
+            self.bars.set_facecolor(self.rgba[state_codes])
+        self.blit.update()
+
+    def _layout(self, processes, low, high, layout_key) -> None:
+        """Start a new figure with an empty bar collection spanning low..high"""
+        self.layouts += 1
+        self._layout_key = layout_key
+        self.figure.clear()
+        self.blit.clear()
+        ax = self.ax = self.figure.add_subplot(111)
+        self.bars = None
+        n_rows = len(processes)
+        if not n_rows:
+            self._xlim = (0.0, 0.0)
+            self.blit.draw()
+            return
+
+        self.bars = self.blit.add(PolyCollection([], edgecolors='none'))
+        ax.add_collection(self.bars)
+        self._xlim = (low, layout_time_axes(ax, processes, low, high, self.title))
+        ax.set_ylim(-0.5, n_rows - 0.5)
+        ax.set_axisbelow(True)
+        ax.grid(True)
+
+        self.figure.tight_layout()
+        self.blit.draw()
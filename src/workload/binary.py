@@ -0,0 +1,246 @@
+# src/workload/binary.py
+import os
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from ..process.process import Process
+from ..process.process_table import MISSING, ProcessTable
+from .stream import iter_csv_records, iter_json_records, iter_ndjson_records, NDJSON_EXTENSIONS
+
+# Fixed-width record of the binary workload format (44 bytes, no padding).
+# A process without an I/O operation has MISSING in both I/O fields.
+WORKLOAD_DTYPE = np.dtype([
+    ('pid', '<i8'),
+    ('arrival_time', '<i8'),
+    ('burst_time', '<i8'),
+    ('priority', '<i4'),
+    ('io_start', '<i8'),
+    ('io_duration', '<i8'),
+])
+
+# Records written before the I/O fields existed; read as having no I/O
+LEGACY_WORKLOAD_DTYPE = np.dtype([
+    ('pid', '<i8'),
+    ('arrival_time', '<i8'),
+    ('burst_time', '<i8'),
+    ('priority', '<i4'),
+])
+
+BINARY_EXTENSION = '.npy'
+
+# Records converted per batch when building a binary file
+BATCH_SIZE = 1 << 16
+
+
+def record_batches(processes: Iterable[Process]) -> Iterator[np.ndarray]:
+    """
+    Pack processes into structured arrays of at most BATCH_SIZE
+    WORKLOAD_DTYPE records
+
+    Raises:
+        ValueError: If a process has more than one I/O operation, which
+            the record format cannot hold
+    """
+    batch = np.empty(BATCH_SIZE, dtype=WORKLOAD_DTYPE)
+    filled = 0
+    for process in processes:
+        io_start, io_duration = io_fields(process)
+        batch[filled] = (process.pid, process.arrival_time,
+                         process.burst_time, process.priority,
+                         io_start, io_duration)
+        filled += 1
+        if filled == BATCH_SIZE:
+            yield batch
+            batch = np.empty(BATCH_SIZE, dtype=WORKLOAD_DTYPE)
+            filled = 0
+    if filled:
+        yield batch[:filled]
+
+
+def io_fields(process: Process) -> Tuple[int, int]:
+    """I/O start and duration of a process, MISSING for both without I/O"""
+    io_operations = getattr(process, 'io_operations', None) or []
+    if len(io_operations) > 1:
+        raise ValueError(
+            f"Process {process.pid} has {len(io_operations)} I/O operations, "
+            "binary workloads hold at most one per process"
+        )
+    if not io_operations:
+        return MISSING, MISSING
+    return io_operations[0]['start_time'], io_operations[0]['duration']
+
+
+def io_columns(records: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """io_start and io_duration columns of records, None for legacy files"""
+    if 'io_start' not in records.dtype.names:
+        return None
+    return records['io_start'], records['io_duration']
+
+
+def attach_io(process: Process, io_start: int, io_duration: int) -> None:
+    """Give a process the I/O operation stored in its record, if any"""
+    if io_start != MISSING:
+        process.io_operations = [
+            {'start_time': io_start, 'duration': io_duration, 'completed': False}
+        ]
+
+
+def write_binary_processes(filename: str, processes: Iterable[Process]) -> int:
+    """
+    Write processes as an arrival-ordered .npy file, one batch at a time
+
+    Batches are staged in a temporary raw file next to the destination and
+    then copied into place, so the records are never all in memory. Input
+    that is not in arrival order is sorted through its arrival column,
+    the only part of the workload held in memory.
+
+    Returns:
+        Number of records written
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    count = 0
+    ordered = True
+    last_arrival = None
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            for batch in record_batches(processes):
+                arrivals = batch['arrival_time']
+                if ((last_arrival is not None and arrivals[0] < last_arrival)
+                        or np.any(arrivals[1:] < arrivals[:-1])):
+                    ordered = False
+                last_arrival = arrivals[-1]
+                batch.tofile(raw)
+                count += len(batch)
+
+        if count == 0:
+            np.save(filename, np.empty(0, dtype=WORKLOAD_DTYPE), allow_pickle=False)
+            return 0
+        staged = np.memmap(temporary, dtype=WORKLOAD_DTYPE, mode='r', shape=(count,))
+        order = None if ordered else np.argsort(staged['arrival_time'], kind='stable')
+        records = np.lib.format.open_memmap(filename, mode='w+', dtype=WORKLOAD_DTYPE,
+                                            shape=(count,))
+        for begin in range(0, count, BATCH_SIZE):
+            rows = slice(begin, begin + BATCH_SIZE)
+            records[rows] = staged[rows] if order is None else staged[order[rows]]
+        records.flush()
+        del records, staged
+        return count
+    finally:
+        os.unlink(temporary)
+
+
+def save_binary(filename: str, records: np.ndarray) -> None:
+    """
+    Write records as an arrival-ordered .npy file
+
+    Args:
+        filename: Destination path
+        records: Structured array with WORKLOAD_DTYPE fields
+    """
+    records = np.asarray(records).astype(WORKLOAD_DTYPE, copy=False)
+    order = np.argsort(records['arrival_time'], kind='stable')
+    if np.any(order != np.arange(len(order))):
+        records = records[order]
+    np.save(filename, records, allow_pickle=False)
+
+
+def load_binary(filename: str, mmap: bool = True) -> np.ndarray:
+    """
+    Open a binary workload file
+
+    With mmap=True the file is memory-mapped copy-on-write: nothing is read
+    until columns are used, processes on one machine share the pages
+    through the page cache, and writes stay private to the process.
+
+    Returns:
+        Structured array of WORKLOAD_DTYPE records in arrival order
+    """
+    records = np.load(filename, mmap_mode='c' if mmap else None, allow_pickle=False)
+    if records.dtype not in (WORKLOAD_DTYPE, LEGACY_WORKLOAD_DTYPE):
+        raise ValueError(f"Not a workload file (record type {records.dtype})")
+    return records
+
+
+def iter_binary_processes(filename: str, chunk_size: int = BATCH_SIZE) -> Iterator[Process]:
+    """
+    Yield fresh processes from a memory-mapped binary workload
+
+    Records are converted one chunk at a time straight from the mapped
+    file, so no per-process columns are allocated for the whole workload
+    and memory stays bounded by the processes the consumer keeps.
+    """
+    records = load_binary(filename)
+    has_io = io_columns(records) is not None
+    for begin in range(0, len(records), chunk_size):
+        chunk = records[begin:begin + chunk_size]
+        if has_io:
+            io_start, io_duration = chunk['io_start'].tolist(), chunk['io_duration'].tolist()
+        else:
+            io_start = io_duration = [MISSING] * len(chunk)
+        for pid, arrival, burst, priority, start, duration in zip(
+                chunk['pid'].tolist(), chunk['arrival_time'].tolist(),
+                chunk['burst_time'].tolist(), chunk['priority'].tolist(),
+                io_start, io_duration):
+            process = Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+            attach_io(process, start, duration)
+            yield process
+
+
+def load_table(filename: str, mmap: bool = True) -> ProcessTable:
+    """
+    Open a binary workload as a ProcessTable
+
+    The pid, arrival, burst and priority columns of the table are views of
+    the mapped file, not copies.
+    """
+    return table_of(load_binary(filename, mmap))
+
+
+def table_of(records: np.ndarray) -> ProcessTable:
+    """ProcessTable whose static columns are views of binary records"""
+    return ProcessTable(
+        pid=records['pid'],
+        arrival_time=records['arrival_time'],
+        burst_time=records['burst_time'],
+        priority=records['priority'],
+    )
+
+
+def load_binary_processes(filename: str) -> List[Process]:
+    """Process views over a memory-mapped binary workload, with their I/O"""
+    records = load_binary(filename)
+    views = table_of(records).views()
+    columns = io_columns(records)
+    if columns is not None:
+        io_start, io_duration = columns
+        # Only processes with I/O get an operation list
+        with_io = np.flatnonzero(io_start != MISSING)
+        for i, start, duration in zip(with_io.tolist(), io_start[with_io].tolist(),
+                                      io_duration[with_io].tolist()):
+            attach_io(views[i], start, duration)
+    return views
+
+
+def convert_workload(source: str, destination: str) -> int:
+    """
+    Convert a CSV, JSON or NDJSON workload to the binary format
+
+    Records are parsed with the same validation as the text loaders, and
+    keep their I/O operation (at most one per process).
+
+    Returns:
+        Number of records written
+    """
+    extension = os.path.splitext(source)[1].lower()
+    if extension == '.csv':
+        reader = iter_csv_records
+    elif extension == '.json':
+        reader = iter_json_records
+    elif extension in NDJSON_EXTENSIONS:
+        reader = iter_ndjson_records
+    else:
+        raise ValueError(f"Unsupported workload format: {extension or source}")
+
+    with open(source, 'r', newline='') as file:
+        return write_binary_processes(destination, reader(file))
@@ -0,0 +1,251 @@
+# src/workload/generator.py
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from ..process.process import Process
+from ..process.process_table import MISSING, ProcessTable
+from .binary import WORKLOAD_DTYPE
+
+ARRIVAL_PROCESSES = ('poisson', 'mmpp', 'uniform')
+BURST_DISTRIBUTIONS = ('exponential', 'lognormal', 'pareto', 'uniform')
+
+# Two-state MMPP defaults: a quiet and a bursty state, with arrival rates
+# as multiples of arrival_rate and mean times spent in each state
+MMPP_RATES = (0.25, 4.0)
+MMPP_DWELL = (100.0, 20.0)
+
+
+@dataclass
+class GeneratedWorkload:
+    """
+    Columns of a generated workload, one row per process in arrival order
+
+    A process with no I/O operation has MISSING in both I/O columns.
+    """
+    pid: np.ndarray
+    arrival_time: np.ndarray
+    burst_time: np.ndarray
+    priority: np.ndarray
+    io_start: np.ndarray
+    io_duration: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def records(self) -> np.ndarray:
+        """Structured array of WORKLOAD_DTYPE records, I/O columns included"""
+        records = np.empty(len(self), dtype=WORKLOAD_DTYPE)
+        for name in WORKLOAD_DTYPE.names:
+            records[name] = getattr(self, name)
+        return records
+
+    def table(self) -> ProcessTable:
+        """ProcessTable over the generated columns"""
+        return ProcessTable(self.pid, self.arrival_time, self.burst_time, self.priority)
+
+    def processes(self) -> List[Process]:
+        """Process objects, with their I/O operation if they have one"""
+        processes = [
+            Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+            for pid, arrival, burst, priority in zip(
+                self.pid.tolist(), self.arrival_time.tolist(),
+                self.burst_time.tolist(), self.priority.tolist())
+        ]
+        with_io = np.flatnonzero(self.io_start != MISSING)
+        for i, start, duration in zip(with_io.tolist(), self.io_start[with_io].tolist(),
+                                      self.io_duration[with_io].tolist()):
+            processes[i].io_operations = [
+                {'start_time': start, 'duration': duration, 'completed': False}
+            ]
+        return processes
+
+
+def poisson_arrivals(rng: np.random.Generator, count: int, rate: float) -> np.ndarray:
+    """Arrival times of a Poisson process (exponential gaps of mean 1 / rate)"""
+    return np.cumsum(rng.exponential(1 / rate, count))
+
+
+def mmpp_arrivals(rng: np.random.Generator, count: int,
+                  rates: Sequence[float], dwell: Sequence[float]) -> np.ndarray:
+    """
+    Arrival times of a two-state Markov-modulated Poisson process
+
+    The state alternates after exponentially distributed sojourns; within a
+    sojourn arrivals form a Poisson process at the rate of its state. The
+    number of arrivals of each sojourn is drawn first, then their sorted
+    positions from exponential spacings, so no step loops over arrivals.
+
+    Args:
+        rng: Random generator
+        count: Number of arrivals
+        rates: Arrival rate of each state
+        dwell: Mean sojourn time of each state
+
+    Returns:
+        Sorted arrival times
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    dwell = np.asarray(dwell, dtype=np.float64)
+    per_cycle = float(rates @ dwell)
+    if per_cycle <= 0:
+        raise ValueError("MMPP rates and dwell times must give a positive arrival rate")
+    if count == 0:
+        return np.empty(0)
+
+    durations, counts = [], []
+    drawn = 0
+    while drawn < count:
+        # Enough quiet/bursty cycles for the remaining arrivals, plus a margin
+        cycles = int((count - drawn) / per_cycle * 1.1) + 1
+        states = np.tile([0, 1], cycles)
+        duration = rng.exponential(dwell[states])
+        arrivals = rng.poisson(rates[states] * duration)
+        durations.append(duration)
+        counts.append(arrivals)
+        drawn += int(arrivals.sum())
+    durations = np.concatenate(durations)
+    counts = np.concatenate(counts)
+    starts = np.cumsum(durations) - durations
+
+    # k sorted uniforms are the first k partial sums of k + 1 exponentials
+    # divided by their total: one extra exponential closes each sojourn
+    slots = counts + 1
+    spacing = np.cumsum(rng.standard_exponential(int(slots.sum())))
+    ends = np.cumsum(slots) - 1
+    base = np.concatenate(([0.0], spacing[ends[:-1]]))
+    total = spacing[ends] - base
+    points = np.ones(len(spacing), dtype=bool)
+    points[ends] = False
+    sojourn = np.repeat(np.arange(len(counts)), counts)[:count]
+    fraction = (spacing[points][:count] - base[sojourn]) / total[sojourn]
+    return starts[sojourn] + fraction * durations[sojourn]
+
+
+def burst_times(rng: np.random.Generator, count: int, distribution: str,
+                mean: float, sigma: float, shape: float,
+                max_burst: Optional[int]) -> np.ndarray:
+    """
+    Integer burst times of at least 1
+
+    Args:
+        rng: Random generator
+        count: Number of bursts
+        distribution: One of BURST_DISTRIBUTIONS
+        mean: Mean burst (before rounding)
+        sigma: Shape of the lognormal (standard deviation of its log)
+        shape: Tail index of the Pareto, greater than 1 (smaller is heavier)
+        max_burst: Upper bound; for 'uniform' bursts are drawn from 1..max_burst
+    """
+    if distribution == 'uniform':
+        high = max_burst if max_burst is not None else max(1, int(round(2 * mean)) - 1)
+        return rng.integers(1, high + 1, count, dtype=np.int64)
+    if distribution == 'exponential':
+        bursts = rng.exponential(mean, count)
+    elif distribution == 'lognormal':
+        bursts = rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, count)
+    elif distribution == 'pareto':
+        if shape <= 1:
+            raise ValueError("Pareto shape must be greater than 1 for a finite mean")
+        # Inverse transform: scale * U**(-1 / shape) = scale * exp(E / shape)
+        bursts = rng.standard_exponential(count)
+        bursts /= shape
+        np.exp(bursts, out=bursts)
+        bursts *= mean * (shape - 1) / shape
+    else:
+        raise ValueError(f"Unknown burst distribution: {distribution} "
+                         f"(expected {', '.join(BURST_DISTRIBUTIONS)})")
+    np.rint(bursts, out=bursts)
+    np.clip(bursts, 1, max_burst, out=bursts)
+    return bursts.astype(np.int64)
+
+
+def generate_workload(count: int,
+                      seed: Optional[int] = None,
+                      arrivals: str = 'poisson',
+                      arrival_rate: float = 1.0,
+                      max_arrival: Optional[int] = None,
+                      mmpp_rates: Tuple[float, float] = MMPP_RATES,
+                      mmpp_dwell: Tuple[float, float] = MMPP_DWELL,
+                      bursts: str = 'lognormal',
+                      mean_burst: float = 5.0,
+                      burst_sigma: float = 1.0,
+                      pareto_shape: float = 1.5,
+                      max_burst: Optional[int] = None,
+                      max_priority: int = 5,
+                      io_probability: float = 0.0,
+                      io_mean: float = 5.0) -> GeneratedWorkload:
+    """
+    Draw a random workload with vectorized NumPy sampling
+
+    Every column is drawn from one Generator in a fixed order, so the same
+    seed and parameters always give the same workload.
+
+    Args:
+        count: Number of processes
+        seed: Seed of the random generator (None for a fresh one)
+        arrivals: One of ARRIVAL_PROCESSES; 'uniform' draws integer times
+            in 0..max_arrival
+        arrival_rate: Mean arrivals per time unit ('poisson'), or the unit
+            of mmpp_rates ('mmpp')
+        max_arrival: Latest arrival for 'uniform' (default: count / arrival_rate)
+        mmpp_rates: Quiet and bursty state rates, as multiples of arrival_rate
+        mmpp_dwell: Mean time spent in the quiet and bursty states
+        bursts: One of BURST_DISTRIBUTIONS
+        mean_burst: Mean burst time
+        burst_sigma: Lognormal shape parameter
+        pareto_shape: Pareto tail index
+        max_burst: Cap on burst times (upper bound for 'uniform')
+        max_priority: Priorities are drawn uniformly from 1..max_priority
+        io_probability: Chance (0 to 1) that a process has an I/O operation
+        io_mean: Mean I/O duration (exponential, at least 1)
+
+    Returns:
+        GeneratedWorkload with pids 1..count in arrival order
+    """
+    if count < 0:
+        raise ValueError("Process count must not be negative")
+    if arrival_rate <= 0 or mean_burst <= 0:
+        raise ValueError("Arrival rate and mean burst must be positive")
+    if max_priority <= 0 or (max_burst is not None and max_burst <= 0):
+        raise ValueError("Maximum priority and burst must be positive")
+    if not 0 <= io_probability <= 1:
+        raise ValueError("I/O probability must be between 0 and 1")
+    rng = np.random.default_rng(seed)
+
+    if arrivals == 'poisson':
+        times = poisson_arrivals(rng, count, arrival_rate)
+    elif arrivals == 'mmpp':
+        rates = [arrival_rate * factor for factor in mmpp_rates]
+        times = mmpp_arrivals(rng, count, rates, mmpp_dwell)
+    elif arrivals == 'uniform':
+        if max_arrival is None:
+            max_arrival = int(count / arrival_rate)
+        if max_arrival < 0:
+            raise ValueError("Maximum arrival time must not be negative")
+        times = np.sort(rng.integers(0, max_arrival + 1, count, dtype=np.int64))
+    else:
+        raise ValueError(f"Unknown arrival process: {arrivals} "
+                         f"(expected {', '.join(ARRIVAL_PROCESSES)})")
+    arrival_time = times.astype(np.int64)
+
+    burst_time = burst_times(rng, count, bursts, mean_burst, burst_sigma,
+                             pareto_shape, max_burst)
+    priority = rng.integers(1, max_priority + 1, count, dtype=np.int32)
+
+    io_start = np.full(count, MISSING, dtype=np.int64)
+    io_duration = np.full(count, MISSING, dtype=np.int64)
+    if io_probability > 0:
+        with_io = np.flatnonzero(rng.random(count) < io_probability)
+        # The operation starts after 0 to burst - 1 units of execution
+        io_start[with_io] = (rng.random(len(with_io)) * burst_time[with_io]).astype(np.int64)
+        duration = np.rint(rng.exponential(io_mean, len(with_io)))
+        io_duration[with_io] = np.maximum(duration, 1).astype(np.int64)
+
+    return GeneratedWorkload(
+        pid=np.arange(1, count + 1, dtype=np.int64),
+        arrival_time=arrival_time,
+        burst_time=burst_time,
+        priority=priority,
+        io_start=io_start,
+        io_duration=io_duration,
+    )
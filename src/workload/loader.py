@@ -0,0 +1,141 @@
+# src/workload/loader.py
+import csv
+import json
+import os
+from typing import Dict, List
+from ..process.process import Process
+
+# Columns every workload file must provide
+REQUIRED_FIELDS = {'pid', 'arrival_time', 'burst_time'}
+
+
+def check_csv_fields(fieldnames) -> None:
+    """Raise ValueError if a CSV header lacks required columns"""
+    if not REQUIRED_FIELDS.issubset(fieldnames or []):
+        missing = REQUIRED_FIELDS - set(fieldnames or [])
+        raise ValueError(f"Missing required fields: {missing}")
+
+
+def process_from_csv_row(row: Dict[str, str]) -> Process:
+    """
+    Build a process from one CSV row
+
+    Columns: pid, arrival_time, burst_time and optionally priority,
+    io_start and io_duration (one I/O operation per process).
+    """
+    process = Process(
+        pid=int(row['pid']),
+        arrival_time=int(row['arrival_time']),
+        burst_time=int(row['burst_time']),
+        priority=int(row.get('priority', 0))
+    )
+
+    # Add I/O operations if present
+    if 'io_start' in row and 'io_duration' in row:
+        io_start = int(row['io_start'])
+        io_duration = int(row['io_duration'])
+        if io_start >= 0 and io_duration > 0:
+            process.io_operations = [{
+                'start_time': io_start,
+                'duration': io_duration,
+                'completed': False
+            }]
+    return process
+
+
+def process_from_record(item: Dict) -> Process:
+    """
+    Build a process from one JSON object
+
+    Objects need pid, arrival_time and burst_time, and may carry priority
+    and a list of io_operations with start_time and duration.
+    """
+    # Validate required fields
+    if not isinstance(item, dict):
+        raise ValueError("Process entries must be JSON objects")
+    if not REQUIRED_FIELDS.issubset(item.keys()):
+        missing = REQUIRED_FIELDS - set(item.keys())
+        raise ValueError(f"Missing required fields: {missing}")
+
+    try:
+        process = Process(
+            pid=int(item['pid']),
+            arrival_time=int(item['arrival_time']),
+            burst_time=int(item['burst_time']),
+            priority=int(item.get('priority', 0))
+        )
+
+        # Add I/O operations if present
+        if 'io_operations' in item:
+            io_ops = item['io_operations']
+            if isinstance(io_ops, list):
+                process.io_operations = [
+                    {
+                        'start_time': int(op['start_time']),
+                        'duration': int(op['duration']),
+                        'completed': False
+                    }
+                    for op in io_ops
+                    if 'start_time' in op and 'duration' in op
+                ]
+        return process
+
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid data in process {item.get('pid', '?')}: {e}")
+
+
+def load_csv(filename: str) -> List[Process]:
+    """
+    Load processes from a CSV file
+
+    Returns:
+        Processes sorted by arrival time
+    """
+    processes = []
+    with open(filename, 'r', newline='') as file:
+        reader = csv.DictReader(file)
+        check_csv_fields(reader.fieldnames)
+
+        for row in reader:
+            try:
+                processes.append(process_from_csv_row(row))
+            except ValueError as e:
+                raise ValueError(f"Invalid data in row {reader.line_num}: {e}")
+
+    processes.sort(key=lambda p: p.arrival_time)
+    return processes
+
+
+def load_json(filename: str) -> List[Process]:
+    """
+    Load processes from a JSON file holding a list of process objects
+
+    Returns:
+        Processes sorted by arrival time
+    """
+    with open(filename, 'r') as file:
+        try:
+            data = json.load(file)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON format")
+
+    if not isinstance(data, list):
+        raise ValueError("JSON file must contain a list of processes")
+
+    processes = [process_from_record(item) for item in data]
+    processes.sort(key=lambda p: p.arrival_time)
+    return processes
+
+
+def load_workload(filename: str) -> List[Process]:
+    """Load processes from a CSV, JSON or binary (.npy) file, chosen by extension"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        return load_csv(filename)
+    if extension == '.json':
+        return load_json(filename)
+    if extension == '.npy':
+        # Imported here, the binary module builds on the text readers
+        from .binary import load_binary_processes
+        return load_binary_processes(filename)
+    raise ValueError(f"Unsupported workload format: {extension or filename}")
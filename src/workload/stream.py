@@ -0,0 +1,138 @@
+# src/workload/stream.py
+import csv
+import json
+import os
+from typing import Dict, IO, Iterator
+from ..process.process import Process
+from .loader import check_csv_fields, process_from_csv_row, process_from_record
+
+# Characters read per chunk when scanning a JSON array
+CHUNK_SIZE = 1 << 16
+
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def iter_csv_records(file: IO[str]) -> Iterator[Process]:
+    """Yield processes from CSV rows one at a time"""
+    reader = csv.DictReader(file)
+    check_csv_fields(reader.fieldnames)
+    for row in reader:
+        try:
+            yield process_from_csv_row(row)
+        except ValueError as e:
+            raise ValueError(f"Invalid data in row {reader.line_num}: {e}")
+
+
+def iter_ndjson_records(file: IO[str]) -> Iterator[Process]:
+    """Yield processes from newline-delimited JSON, one object per line"""
+    for line_num, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON on line {line_num}")
+        yield process_from_record(item)
+
+
+def iter_json_array(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Yield the elements of a top-level JSON array without loading the document
+
+    Only the element being decoded and one read chunk are held in memory;
+    elements are decoded in place at an offset into the buffer.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    started = False
+
+    while True:
+        # Skip whitespace and separators, refilling the buffer as needed
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n' + (',' if started else ''):
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            buffer, position = file.read(chunk_size), 0
+            eof = not buffer
+
+        if position >= len(buffer):
+            raise ValueError("Invalid JSON format")
+        if not started:
+            if buffer[position] != '[':
+                raise ValueError("JSON file must contain a list of processes")
+            started = True
+            position += 1
+            continue
+        if buffer[position] == ']':
+            return
+
+        # Decode one element, reading more until it is complete
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # A number cut at the chunk boundary also decodes
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("Invalid JSON format")
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+        yield item
+        # Consumed text is only trimmed on the next refill, so decoding a
+        # chunk stays linear in its size
+        position = end
+
+
+def iter_json_records(file: IO[str]) -> Iterator[Process]:
+    """Yield processes from a JSON array of process objects"""
+    for item in iter_json_array(file):
+        yield process_from_record(item)
+
+
+def stream_workload(filename: str) -> Iterator[Process]:
+    """
+    Lazily read an arrival-ordered workload file
+
+    Supports CSV, JSON arrays, NDJSON (.ndjson/.jsonl) and binary .npy
+    files with the same schema as load_workload. Unlike load_workload the records are not
+    sorted, so the file must already be ordered by arrival time.
+
+    Args:
+        filename: Workload file path
+
+    Yields:
+        Processes in file order
+
+    Raises:
+        ValueError: If a record arrives earlier than the one before it
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.npy':
+        # Binary workloads are stored in arrival order and memory-mapped
+        from .binary import iter_binary_processes
+        yield from iter_binary_processes(filename)
+        return
+    if extension == '.csv':
+        reader = iter_csv_records
+    elif extension == '.json':
+        reader = iter_json_records
+    elif extension in NDJSON_EXTENSIONS:
+        reader = iter_ndjson_records
+    else:
+        raise ValueError(f"Unsupported workload format: {extension or filename}")
+
+    with open(filename, 'r', newline='') as file:
+        last_arrival = None
+        for process in reader(file):
+            if last_arrival is not None and process.arrival_time < last_arrival:
+                raise ValueError(
+                    f"Workload is not ordered by arrival time at process {process.pid}"
+                )
+            last_arrival = process.arrival_time
+            yield process
@@ -0,0 +1,132 @@
+# tests/test_cli/test_cli.py
+import csv
+import json
+import os
+import subprocess
+import sys
+from src.cli import main
+from src.workload.loader import load_workload
+
+WORKLOAD = "pid,arrival_time,burst_time,priority\n1,0,5,1\n2,1,4,2\n3,3,2,1\n"
+
+def test_run_writes_metrics_rows(tmp_path):
+    """One row per scheduler, in the requested output format"""
+    workload = tmp_path / "workload.csv"
+    workload.write_text(WORKLOAD)
+    json_out = tmp_path / "metrics.json"
+    csv_out = tmp_path / "metrics.csv"
+
+    assert main(["run", str(workload), "-s", "fcfs", "-s", "rr", "-q", "3",
+                 "-o", str(json_out)]) == 0
+    assert main(["run", str(workload), "-s", "fcfs", "-s", "rr", "-q", "3",
+                 "-o", str(csv_out)]) == 0
+
+    rows = json.loads(json_out.read_text())
+    assert [row["scheduler"] for row in rows] == ["FCFS", "Round Robin"]
+    assert rows[0]["avg_waiting_time"] == (0 + 4 + 6) / 3
+    with open(csv_out, newline='') as stream:
+        csv_rows = list(csv.DictReader(stream))
+    assert [float(row["avg_waiting_time"]) for row in csv_rows] == \
+        [row["avg_waiting_time"] for row in rows]
+
+def test_cached_runs_keep_admission_and_stepping_apart(tmp_path):
+    """Streamed and tick runs are not served results cached by other modes"""
+    workload = tmp_path / "workload.csv"
+    workload.write_text(WORKLOAD)
+    cache = tmp_path / "cache"
+
+    def run(*flags):
+        out = tmp_path / "metrics.json"
+        assert main(["run", str(workload), "-s", "mlfq", "--cache", str(cache),
+                     "-o", str(out), *flags]) == 0
+        return json.loads(out.read_text())
+
+    modes = [(), ("--stream",), ("--tick",), ("--stream", "--tick")]
+    fresh = [run(*flags) for flags in modes]
+    cached = [run(*flags) for flags in modes]
+    assert cached == fresh
+    # One entry per mode
+    assert sum(len(files) for _, _, files in os.walk(cache)) == len(modes)
+
+def test_sweep_writes_one_row_per_combination(tmp_path):
+    """Sweeps accept value lists and ranges and reject unknown parameters"""
+    workload = tmp_path / "workload.csv"
+    workload.write_text(WORKLOAD)
+    out = tmp_path / "sweep.csv"
+
+    assert main(["sweep", str(workload), "-s", "rr", "-s", "fcfs",
+                 "-p", "time_quantum=1:5:2,8", "-j", "2", "-o", str(out)]) == 0
+    with open(out, newline='') as stream:
+        rows = list(csv.DictReader(stream))
+    assert [(row["scheduler"], row["time_quantum"]) for row in rows] == [
+        ("Round Robin", "1"), ("Round Robin", "3"), ("Round Robin", "5"),
+        ("Round Robin", "8"), ("FCFS", ""),
+    ]
+    assert "p95_waiting_time" in rows[0]
+    assert main(["sweep", str(workload), "-p", "quantum=2"]) == 1
+
+def test_run_and_sweep_share_defaults(tmp_path):
+    """The same workload gives the same numbers from either command"""
+    workload = tmp_path / "workload.csv"
+    workload.write_text(WORKLOAD)
+    run_out = tmp_path / "run.json"
+    sweep_out = tmp_path / "sweep.json"
+
+    assert main(["run", str(workload), "-s", "mlfq", "-o", str(run_out)]) == 0
+    assert main(["sweep", str(workload), "-s", "mlfq", "-p", "base_quantum=2",
+                 "-j", "1", "-o", str(sweep_out)]) == 0
+    ran, = json.loads(run_out.read_text())
+    swept, = json.loads(sweep_out.read_text())
+    assert ran["avg_waiting_time"] == swept["avg_waiting_time"]
+    assert ran["context_switch"] == 0
+
+def test_cli_does_not_import_gui_libraries(tmp_path):
+    """The runner must work on machines without a display"""
+    workload = tmp_path / "workload.csv"
+    workload.write_text(WORKLOAD)
+    code = (
+        "import sys; from src.cli import main; "
+        f"main(['run', {str(workload)!r}, '-o', {str(tmp_path / 'out.json')!r}]); "
+        "print(sorted(m for m in sys.modules "
+        "if m.split('.')[0] in ('tkinter', 'matplotlib')))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True, cwd=root)
+    assert result.stdout.strip() == "[]"
+
+def test_generate_writes_seeded_workload(tmp_path):
+    """The same seed writes the same binary workload"""
+    first, second = tmp_path / "first.npy", tmp_path / "second.npy"
+    for path in (first, second):
+        assert main(["generate", str(path), "-n", "500", "--seed", "5",
+                     "--arrivals", "mmpp", "--bursts", "pareto"]) == 0
+    assert first.read_bytes() == second.read_bytes()
+    assert main(["run", str(first), "-s", "sjf", "-o", str(tmp_path / "out.json")]) == 0
+
+def test_generate_writes_io_operations(tmp_path):
+    """Generated I/O operations are written and simulated"""
+    path = tmp_path / "io.npy"
+    assert main(["generate", str(path), "-n", "200", "--seed", "3",
+                 "--io-probability", "0.5", "--io-mean", "4"]) == 0
+    with_io = [p for p in load_workload(str(path)) if getattr(p, 'io_operations', None)]
+    assert 0 < len(with_io) < 200
+
+    out = tmp_path / "out.json"
+    assert main(["run", str(path), "-s", "fcfs", "-o", str(out)]) == 0
+    assert json.loads(out.read_text())[0]["io_utilization"] > 0
+
+def test_bench_exits_with_1_on_regression(tmp_path):
+    """Results are written, then regressions against the baseline fail the run"""
+    baseline = tmp_path / "baseline.json"
+    out = tmp_path / "bench.json"
+    assert main(["bench", "-s", "fcfs", "-n", "100", "-n", "200", "-b", "1",
+                 "--save", str(baseline), "-o", str(out)]) == 0
+    assert [row["processes"] for row in json.loads(out.read_text())] == [100, 200]
+
+    # A baseline where time used to fall as the workload grew
+    saved = json.loads(baseline.read_text())
+    saved["slopes"][0]["slope"] = -10.0
+    baseline.write_text(json.dumps(saved))
+    assert main(["bench", "-s", "fcfs", "-n", "100", "-n", "200", "-b", "1",
+                 "--baseline", str(baseline), "-o", str(out)]) == 1
@@ -0,0 +1,41 @@
+# tests/test_process/test_process.py
+import pytest
+from src.process.process import Process, TIMESTAMP_OFF
+from src.schedulers.fcfs import FCFSScheduler
+
+@pytest.fixture
+def timestamp_mode():
+    """Restore the shared timestamp mode after a test"""
+    saved = Process.timestamp_mode
+    yield
+    Process.timestamp_mode = saved
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_transitions_stamped_with_simulated_time(event_driven):
+    """By default the scheduler stamps transitions when they happen"""
+    scheduler = FCFSScheduler()
+    scheduler.event_driven = event_driven
+    p1 = Process(pid=1, arrival_time=3, burst_time=2)
+    p2 = Process(pid=2, arrival_time=4, burst_time=2)
+    scheduler.add_process(p1)
+    scheduler.add_process(p2)
+    
+    assert p1.last_state_change is None
+    while scheduler.current_time < 5:
+        scheduler.run_step()
+    # NEW -> READY on arrival, inside the event-driven step running p1
+    assert p2.last_state_change == 4
+    scheduler.run()
+    # RUNNING -> TERMINATED at the end of the last time unit used
+    assert p1.last_state_change == p1.completion_time == 5
+    assert p2.last_state_change == p2.completion_time == 7
+
+def test_disabled_timestamps(timestamp_mode):
+    """Stamping can be turned off"""
+    scheduler = FCFSScheduler()
+    p1 = Process(pid=1, arrival_time=0, burst_time=1)
+    scheduler.add_process(p1)
+    
+    Process.timestamp_mode = TIMESTAMP_OFF
+    scheduler.run()
+    assert p1.last_state_change is None
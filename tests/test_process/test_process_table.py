@@ -0,0 +1,40 @@
+# tests/test_process/test_process_table.py
+from src.process.process import Process
+from src.process.process_state import ProcessState
+from src.process.process_table import ProcessTable
+from src.schedulers.sjf import SJFScheduler
+from src.utils.metrics import SchedulingMetrics
+
+def run_sjf(processes):
+    scheduler = SJFScheduler()
+    for p in processes:
+        scheduler.add_process(p)
+    scheduler.run()
+    return scheduler.current_time
+
+def test_table_views_schedule_like_processes():
+    """Schedulers produce the same results on table views as on processes"""
+    spec = [(1, 0, 5, 2), (2, 1, 2, 1), (3, 2, 8, 3), (4, 3, 1, 1)]
+    processes = [Process(pid=a, arrival_time=b, burst_time=c, priority=d) for a, b, c, d in spec]
+    table = ProcessTable.from_processes(processes)
+
+    total_time = run_sjf(processes)
+    assert run_sjf(table.views()) == total_time
+
+    for process, view in zip(processes, table):
+        assert view.waiting_time == process.waiting_time
+        assert view.start_time == process.start_time
+        assert view.completion_time == process.completion_time
+        assert view.context_switches == process.context_switches
+    assert table.is_all_completed()
+    assert table.count(ProcessState.TERMINATED) == 4
+    assert (SchedulingMetrics.calculate_metrics(table, total_time) ==
+            SchedulingMetrics.calculate_metrics(processes, total_time))
+
+def test_table_columns_are_compact():
+    """Per-process storage stays within a few dozen bytes"""
+    table = ProcessTable(pid=range(1000), arrival_time=range(1000), burst_time=[3] * 1000)
+
+    assert table[0].state == ProcessState.NEW
+    assert table[0].start_time is None
+    assert table.nbytes / len(table) < 100
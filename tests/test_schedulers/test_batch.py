@@ -0,0 +1,74 @@
+# tests/test_schedulers/test_batch.py
+import random
+import pytest
+from src.process.process import Process
+from src.schedulers.fcfs import FCFSScheduler
+from src.schedulers.sjf import SJFScheduler
+from src.schedulers.priority import PriorityScheduler
+from src.schedulers.batch import solve_batch
+
+SCHEDULERS = {
+    'fcfs': FCFSScheduler,
+    'sjf': SJFScheduler,
+    'priority': lambda: PriorityScheduler(preemptive=False),
+}
+
+@pytest.mark.parametrize("policy", sorted(SCHEDULERS))
+def test_batch_matches_tick_scheduler(policy):
+    """Closed-form schedule equals running the scheduler tick by tick"""
+    rng = random.Random(7)
+    workload = [
+        (pid, rng.randint(0, 40), rng.randint(0, 8), rng.randint(1, 4))
+        for pid in range(1, 31)
+    ]
+    scheduler = SCHEDULERS[policy]()
+    processes = [Process(pid, arrival, burst, priority)
+                 for pid, arrival, burst, priority in workload]
+    for process in processes:
+        scheduler.add_process(process)
+    scheduler.run()
+
+    result = solve_batch(
+        policy,
+        [p.arrival_time for p in processes],
+        [p.burst_time for p in processes],
+        [p.priority for p in processes],
+    )
+
+    assert result['start_time'].tolist() == [p.start_time for p in processes]
+    assert result['completion_time'].tolist() == [p.completion_time for p in processes]
+    assert result['waiting_time'].tolist() == [p.waiting_time for p in processes]
+    assert result['turnaround_time'].tolist() == [p.turnaround_time for p in processes]
+
+@pytest.mark.parametrize("policy", ["sjf", "priority"])
+def test_batch_mixes_idle_and_contended_periods(policy):
+    """Busy periods solved by sorting agree with those needing the heap pass"""
+    rng = random.Random(11)
+    workload = []
+    for pid in range(1, 121):
+        # Bursts of simultaneous arrivals, then trickles during busy periods
+        arrival = (pid // 10) * 60 + (0 if pid % 10 < 5 else rng.randint(0, 30))
+        workload.append((pid, arrival, rng.randint(1, 6), rng.randint(1, 4)))
+    scheduler = SCHEDULERS[policy]()
+    processes = [Process(pid, arrival, burst, priority)
+                 for pid, arrival, burst, priority in workload]
+    for process in processes:
+        scheduler.add_process(process)
+    scheduler.run()
+
+    result = solve_batch(
+        policy,
+        [p.arrival_time for p in processes],
+        [p.burst_time for p in processes],
+        [p.priority for p in processes],
+    )
+
+    assert result['start_time'].tolist() == [p.start_time for p in processes]
+    assert result['completion_time'].tolist() == [p.completion_time for p in processes]
+
+def test_batch_rejects_unknown_policy():
+    """Preemptive policies have no closed form and are rejected"""
+    with pytest.raises(ValueError):
+        solve_batch('round_robin', [0], [1])
+    with pytest.raises(ValueError):
+        solve_batch('priority', [0], [1])
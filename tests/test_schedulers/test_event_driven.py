@@ -0,0 +1,94 @@
+# tests/test_schedulers/test_event_driven.py
+import pytest
+from src.process.process import Process
+from src.process.process_state import ProcessState
+from src.schedulers.fcfs import FCFSScheduler
+from src.schedulers.sjf import SJFScheduler
+from src.schedulers.priority import PriorityScheduler
+from src.schedulers.mlfq import MLFQScheduler
+from src.schedulers.round_robin import RoundRobinScheduler
+
+WORKLOAD = [(1, 0, 7, 3), (2, 2, 4, 1), (3, 3, 9, 2), (4, 15, 1, 1), (5, 40, 5, 2)]
+# (pid, I/O start, I/O duration)
+IO_OPERATIONS = [(1, 3, 4), (3, 5, 10), (5, 41, 2)]
+
+def simulate(make_scheduler, event_driven, with_io=False):
+    """Run a scheduler to completion and return per-process results"""
+    scheduler = make_scheduler()
+    scheduler.event_driven = event_driven
+    processes = [
+        Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+        for pid, arrival, burst, priority in WORKLOAD
+    ]
+    if with_io:
+        for pid, start, duration in IO_OPERATIONS:
+            processes[pid - 1].io_operations = [
+                {'start_time': start, 'duration': duration, 'completed': False}
+            ]
+    for process in processes:
+        scheduler.add_process(process)
+    scheduler.run()
+    return scheduler.current_time, [
+        (p.waiting_time, p.turnaround_time, p.start_time, p.context_switches)
+        for p in processes
+    ]
+
+@pytest.mark.parametrize("make_scheduler", [
+    FCFSScheduler,
+    SJFScheduler,
+    lambda: PriorityScheduler(preemptive=True),
+    lambda: PriorityScheduler(preemptive=False),
+    lambda: MLFQScheduler(num_queues=3, base_quantum=2),
+    lambda: RoundRobinScheduler(time_quantum=3),
+])
+def test_event_driven_matches_tick_engine(make_scheduler):
+    """Event-driven mode must produce the same results as ticking"""
+    assert simulate(make_scheduler, True) == simulate(make_scheduler, False)
+
+@pytest.mark.parametrize("make_scheduler", [
+    FCFSScheduler,
+    SJFScheduler,
+    lambda: PriorityScheduler(preemptive=True),
+    lambda: MLFQScheduler(num_queues=3, base_quantum=2),
+    lambda: RoundRobinScheduler(time_quantum=3),
+])
+def test_event_driven_matches_tick_engine_with_io(make_scheduler):
+    """I/O starts and completions are events of both engines"""
+    event = simulate(make_scheduler, True, with_io=True)
+    assert event == simulate(make_scheduler, False, with_io=True)
+    assert event != simulate(make_scheduler, True)
+
+def test_event_driven_skips_idle_time():
+    """Clock jumps straight to arrivals and completions"""
+    scheduler = FCFSScheduler()
+    scheduler.event_driven = True
+    scheduler.add_process(Process(pid=1, arrival_time=1000, burst_time=5000))
+
+    steps = 0
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+        steps += 1
+
+    assert steps == 2
+    assert scheduler.current_time == 6000
+
+def test_idle_steps_stop_at_blocked_io():
+    """A blocked process gives up the CPU and an idle CPU wakes at its I/O completion"""
+    scheduler = FCFSScheduler()
+    scheduler.event_driven = True
+    blocked = Process(pid=1, arrival_time=0, burst_time=5)
+    blocked.io_operations = [{'start_time': 2, 'duration': 30, 'completed': False}]
+    scheduler.add_process(blocked)
+    scheduler.add_process(Process(pid=2, arrival_time=100, burst_time=1))
+
+    scheduler.run_step()
+    assert scheduler.current_time == 2
+    scheduler.run_step()
+    assert blocked.state == ProcessState.WAITING
+    assert blocked.io_operations[0]['started_at'] == 2
+    assert scheduler.current_time == 32
+
+    scheduler.run_step()
+    assert blocked.io_operations[0]['completed']
+    assert blocked.completion_time == 35
+    assert blocked.waiting_time == 0
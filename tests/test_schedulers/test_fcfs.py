@@ -33,4 +33,38 @@ def test_fcfs_process_metrics():
     
     assert p1.waiting_time == 0
     assert p1.turnaround_time == 4
-    assert p1.completion_time == 4
\ No newline at end of file
+    assert p1.completion_time == 4
+
+def test_fcfs_arrival_queue_admits_only_arrived_processes():
+    """Only processes whose arrival time has passed leave the arrival queue"""
+    scheduler = FCFSScheduler()
+    
+    p1 = Process(pid=1, arrival_time=5, burst_time=2)
+    p2 = Process(pid=2, arrival_time=0, burst_time=2)
+    scheduler.add_process(p1)
+    scheduler.add_process(p2)
+    
+    scheduler.update_process_states()
+    
+    assert [p.pid for p in scheduler.processes] == [2, 1]
+    assert len(scheduler.arrival_queue) == 1
+    assert scheduler.next_arrival_time() == 5
+
+def test_fcfs_waiting_time_materialized_on_demand():
+    """Waiting time of a ready process is brought up to date when read"""
+    scheduler = FCFSScheduler()
+    
+    p1 = Process(pid=1, arrival_time=0, burst_time=5)
+    p2 = Process(pid=2, arrival_time=1, burst_time=2)
+    scheduler.add_process(p1)
+    scheduler.add_process(p2)
+    
+    for _ in range(4):
+        scheduler.run_step()
+    
+    assert p2.waiting_time == 0
+    scheduler.update_waiting_times()
+    assert p2.waiting_time == 3
+    
+    scheduler.run()
+    assert p2.waiting_time == 4
@@ -2,6 +2,7 @@
 import pytest
 from src.schedulers.mlfq import MLFQScheduler
 from src.process.process import Process
+from src.process.process_state import ProcessState
 
 def test_mlfq_queue_demotion():
     """Test process demotion in MLFQ"""
@@ -31,4 +32,76 @@ def test_mlfq_multiple_processes():
     scheduler.run()
     
     # Verify all processes completed
-    assert all(p.is_completed() for p in processes)
\ No newline at end of file
+    assert all(p.is_completed() for p in processes)
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_mlfq_requeues_process_after_io(event_driven):
+    """A process back from I/O rejoins the queue of its level and finishes"""
+    scheduler = MLFQScheduler(num_queues=3, base_quantum=2)
+    scheduler.event_driven = event_driven
+    p1 = Process(pid=1, arrival_time=0, burst_time=6)
+    p1.io_operations = [{'start_time': 1, 'duration': 3, 'completed': False}]
+    p2 = Process(pid=2, arrival_time=0, burst_time=8)
+    for p in (p1, p2):
+        scheduler.add_process(p)
+
+    steps = 0
+    while scheduler.run_step():
+        steps += 1
+        if p1.io_operations[0]['completed'] and p1.state == ProcessState.READY:
+            assert scheduler.queued.get(1) == scheduler.process_queue_map[1]
+        assert steps < 500
+
+    assert p1.io_operations[0]['completed']
+    assert p1.state == ProcessState.TERMINATED
+    assert p2.state == ProcessState.TERMINATED
+
+def test_mlfq_boost_returns_long_job_to_top_level():
+    """Test the periodic boost moves demoted processes back to level 0"""
+    scheduler = MLFQScheduler(num_queues=3, base_quantum=1, boost_interval=10)
+    long_job = Process(pid=1, arrival_time=0, burst_time=40)
+    scheduler.add_process(long_job)
+    for pid in range(2, 6):
+        scheduler.add_process(Process(pid=pid, arrival_time=0, burst_time=3))
+
+    while scheduler.current_time < 10:
+        scheduler.run_step()
+    # Everyone used up a quantum and sits on level 1
+    assert [p.pid for p in scheduler.queues[1]] == [1, 2, 3, 4, 5]
+    scheduler.boost()
+    assert [p.pid for p in scheduler.queues[0]] == [1, 2, 3, 4, 5]
+    assert not scheduler.queues[1] and not scheduler.queues[2]
+    assert all(level == 0 for level in scheduler.process_queue_map.values())
+
+    # The next automatic boost is at time 20
+    scheduler.run_step()
+    assert scheduler.next_boost == 20
+
+    scheduler.run()
+    assert long_job.is_completed()
+
+    with pytest.raises(ValueError):
+        MLFQScheduler(boost_interval=0)
+
+@pytest.mark.parametrize("boost_interval", [None, 7])
+def test_mlfq_run_step_matches_run(boost_interval):
+    """Test stepping MLFQ gives the same schedule as run()"""
+    def workload():
+        return [Process(pid=i, arrival_time=i % 4, burst_time=1 + (i * 5) % 9)
+                for i in range(1, 13)]
+
+    results = []
+    for stepped in (False, True):
+        scheduler = MLFQScheduler(num_queues=3, base_quantum=2,
+                                  boost_interval=boost_interval)
+        processes = workload()
+        for p in processes:
+            scheduler.add_process(p)
+        if stepped:
+            while scheduler.run_step():
+                # Level bitmap must follow the queue contents
+                for level, queue in enumerate(scheduler.queues):
+                    assert bool(queue) == bool(scheduler.nonempty_levels >> level & 1)
+        else:
+            scheduler.run()
+        results.append([(p.completion_time, p.waiting_time) for p in processes])
+    assert results[0] == results[1]
@@ -0,0 +1,39 @@
+# tests/test_schedulers/test_ready_queue.py
+from src.process.process import Process
+from src.process.process_state import ProcessState
+from src.schedulers.ready_queue import ReadyQueue
+from src.schedulers.sjf import SJFScheduler
+
+def test_ready_queue_ties_follow_registration_order():
+    """Equal keys are served in registration order, like min() on a list"""
+    queue = ReadyQueue(key=lambda p: p.burst_time)
+    p1 = Process(pid=1, arrival_time=5, burst_time=3)
+    p2 = Process(pid=2, arrival_time=0, burst_time=3)
+    p3 = Process(pid=3, arrival_time=0, burst_time=1)
+    for p in (p1, p2, p3):
+        queue.track(p)
+
+    queue.push(p2)
+    queue.push(p1)
+    queue.push(p3)
+
+    assert queue.pop() is p3
+    assert queue.pop() is p1
+    assert queue.pop() is p2
+    assert queue.pop() is None
+
+def test_scheduler_heap_follows_state_changes():
+    """Processes leave the ready heap when they stop being READY"""
+    scheduler = SJFScheduler()
+    p1 = Process(pid=1, arrival_time=0, burst_time=4)
+    p2 = Process(pid=2, arrival_time=0, burst_time=2)
+    scheduler.add_process(p1)
+    scheduler.add_process(p2)
+    scheduler.update_process_states()
+
+    assert len(scheduler.ready_heap) == 2
+    assert scheduler.get_next_process() is p2
+
+    p2.update_state(ProcessState.RUNNING)
+    assert p2 not in scheduler.ready_heap
+    assert scheduler.get_next_process() is p1
@@ -18,6 +18,18 @@ def test_rms_schedulability():
     # Total utilization 70% should be schedulable
     assert scheduler.check_schedulability() == True
 
+def test_rms_schedulability_bound():
+    scheduler = RateMonotonicScheduler()
+    
+    p1 = Process(pid=1, arrival_time=0, burst_time=3)
+    p2 = Process(pid=2, arrival_time=0, burst_time=3)
+    
+    scheduler.add_process(p1, period=5)   # 60% utilization
+    scheduler.add_process(p2, period=10)  # 30% utilization
+    
+    # Total utilization 90% exceeds the two-task bound of about 82.8%
+    assert scheduler.check_schedulability() == False
+
 def test_edf_schedulability():
     scheduler = EarliestDeadlineFirstScheduler()
     
@@ -29,4 +41,21 @@ def test_edf_schedulability():
     scheduler.add_process(p2, deadline=10, period=10)
     
     # Total utilization 82.8% should be schedulable under EDF
-    assert scheduler.check_schedulability() == True
\ No newline at end of file
+    assert scheduler.check_schedulability() == True
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_rms_run_step_preempts_longer_period(event_driven):
+    """A shorter-period arrival takes the CPU when stepping, as in run()"""
+    scheduler = RateMonotonicScheduler()
+    scheduler.event_driven = event_driven
+    long_period = Process(pid=1, arrival_time=0, burst_time=6)
+    short_period = Process(pid=2, arrival_time=2, burst_time=2)
+    scheduler.add_process(long_period, period=20)
+    scheduler.add_process(short_period, period=5)
+
+    while scheduler.run_step():
+        pass
+
+    assert short_period.start_time == 2
+    assert short_period.completion_time == 4
+    assert long_period.completion_time == 8
+    assert long_period.context_switches == 2
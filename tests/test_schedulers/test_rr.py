@@ -30,4 +30,23 @@ def test_rr_process_completion():
     
     assert p1.is_completed()
     assert p1.remaining_time == 0
-    assert p1.turnaround_time == 3
\ No newline at end of file
+    assert p1.turnaround_time == 3
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_rr_queues_arrivals_in_order(event_driven):
+    """Test arrivals join the queue when they arrive, ahead of a preempted process"""
+    scheduler = RoundRobinScheduler(time_quantum=2)
+    scheduler.event_driven = event_driven
+    processes = [
+        Process(pid=1, arrival_time=0, burst_time=6),
+        Process(pid=2, arrival_time=0, burst_time=2),
+        # Arrives while the queue is not empty
+        Process(pid=3, arrival_time=1, burst_time=2),
+        # Arrives exactly when the quantum of P1 expires
+        Process(pid=4, arrival_time=8, burst_time=2),
+    ]
+    for p in processes:
+        scheduler.add_process(p)
+
+    scheduler.run()
+
+    assert [p.completion_time for p in processes] == [12, 4, 6, 10]
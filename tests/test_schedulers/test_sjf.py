@@ -32,4 +32,21 @@ def test_sjf_arrival_time_handling():
     scheduler.run()
     
     # First process should complete before second arrives
-    assert p1.completion_time < p2.start_time
\ No newline at end of file
+    assert p1.completion_time < p2.start_time
+def test_sjf_outstanding_process_count():
+    """Completion check uses the live count of unfinished processes"""
+    scheduler = SJFScheduler()
+    
+    p1 = Process(pid=1, arrival_time=0, burst_time=1)
+    p2 = Process(pid=2, arrival_time=0, burst_time=3)
+    scheduler.add_process(p1)
+    scheduler.add_process(p2)
+    
+    assert scheduler.outstanding_processes == 2
+    scheduler.run_step()
+    assert scheduler.outstanding_processes == 1
+    assert not scheduler.is_all_completed()
+    
+    scheduler.run()
+    assert scheduler.outstanding_processes == 0
+    assert scheduler.is_all_completed()
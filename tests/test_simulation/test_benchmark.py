@@ -0,0 +1,54 @@
+# tests/test_simulation/test_benchmark.py
+import json
+import pytest
+from src.simulation.benchmark import (
+    RESULT_FIELDS, benchmark_report, find_regressions, load_baseline, run_benchmark,
+    save_baseline, scaling_slopes,
+)
+
+def test_benchmark_measures_each_case():
+    """One result per case, in size order, stopping at the time limit"""
+    results = list(run_benchmark(['FCFS', 'Round Robin'], sizes=[400, 100, 200],
+                                 burst_scales=[1]))
+    assert [(r['scheduler'], r['processes']) for r in results] == [
+        ('FCFS', 100), ('FCFS', 200), ('FCFS', 400),
+        ('Round Robin', 100), ('Round Robin', 200), ('Round Robin', 400),
+    ]
+    for result in results:
+        assert tuple(result) == RESULT_FIELDS
+        assert result['ticks'] > 0 and result['wall_time'] > 0
+        assert result['ticks_per_second'] == pytest.approx(result['ticks'] / result['wall_time'])
+    # Workloads depend on the seed only, not on the scheduler
+    assert results[2]['ticks'] == results[5]['ticks']
+    assert [s['scheduler'] for s in scaling_slopes(results)] == ['FCFS', 'Round Robin']
+
+    limited = list(run_benchmark(['FCFS'], sizes=[100, 200], burst_scales=[1, 2],
+                                 time_limit=0))
+    assert [(r['processes'], r['burst_scale']) for r in limited] == [(100, 1), (100, 2)]
+
+def test_regressions_against_baseline(tmp_path):
+    """Slower cases and steeper scaling are flagged, noise is not"""
+    def case(size, wall, memory=10.0):
+        return {'scheduler': 'SJF', 'processes': size, 'burst_scale': 1, 'ticks': size,
+                'wall_time': wall, 'ticks_per_second': size / wall,
+                'processes_per_second': size / wall, 'peak_memory_mb': memory}
+
+    sizes = [1000, 10000, 100000]
+    linear = benchmark_report([case(n, n / 1e4) for n in sizes])
+    path = str(tmp_path / "baseline.json")
+    save_baseline(linear, path)
+    baseline = load_baseline(path)
+    assert baseline['slopes'][0]['slope'] == pytest.approx(1.0)
+
+    # Within the absolute margins: a slow 1k case and a little more memory
+    noisy = benchmark_report([case(1000, 0.14, 12.0), case(10000, 1.0), case(100000, 10.0)])
+    assert find_regressions(noisy, baseline) == []
+
+    quadratic = benchmark_report([case(n, (n / 1e4) ** 2, 10.0 if n < 1e5 else 80.0)
+                                  for n in sizes])
+    flagged = {(r['processes'], r['metric']) for r in find_regressions(quadratic, baseline)}
+    assert flagged == {(100000, 'wall_time'), (100000, 'peak_memory_mb'), (None, 'slope')}
+
+    (tmp_path / "other.json").write_text(json.dumps({'version': 0}))
+    with pytest.raises(ValueError):
+        load_baseline(str(tmp_path / "other.json"))
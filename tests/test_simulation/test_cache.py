@@ -0,0 +1,51 @@
+# tests/test_simulation/test_cache.py
+import os
+import numpy as np
+from src.schedulers.factory import SCHEDULER_TYPES, create_scheduler
+from src.simulation.cache import ResultCache
+from src.simulation.comparison import compare_schedulers, simulate_spec, submit_comparison
+
+WORKLOAD = [(1, 0, 6, 2), (2, 1, 3, 1), (3, 4, 8, 3), (4, 6, 2, 1), (5, 20, 4, 2)]
+
+def test_cache_keys_and_lru_eviction(tmp_path):
+    """Keys follow workload and settings; least recently read entries go first"""
+    cache = ResultCache(str(tmp_path), max_bytes=10 ** 6)
+    rr2 = cache.key(WORKLOAD, create_scheduler('Round Robin', quantum=2))
+    assert rr2 == cache.key(list(WORKLOAD), create_scheduler('Round Robin', quantum=2))
+    assert rr2 != cache.key(WORKLOAD, create_scheduler('Round Robin', quantum=3))
+    assert rr2 != cache.key(WORKLOAD[:-1], create_scheduler('Round Robin', quantum=2))
+    # Settings a scheduler does not use do not split its entries
+    assert cache.key(WORKLOAD, create_scheduler('FCFS', quantum=2)) == \
+        cache.key(WORKLOAD, create_scheduler('FCFS', quantum=5))
+
+    keys = [f"{i:02x}" * 32 for i in range(4)]
+    for age, key in enumerate(keys):
+        cache.put(key, {'avg_waiting_time': float(age)})
+        os.utime(cache.path(key), (1000 + age, 1000 + age))
+    assert cache.get(keys[0]).metrics == {'avg_waiting_time': 0.0}  # now most recent
+    assert cache.get('ff' * 32) is None
+
+    cache.max_bytes = cache.size() - 1
+    cache.evict()
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in (keys[0], keys[2], keys[3]))
+
+def test_repeated_comparison_is_served_from_cache(tmp_path):
+    """Hits skip the executor and return what the simulation returned"""
+    cache = ResultCache(str(tmp_path))
+    first = compare_schedulers(WORKLOAD, quantum=2, context_switch=1,
+                               max_workers=2, cache=cache)
+
+    class NoExecutor:
+        def submit(self, *args):
+            raise AssertionError("cached runs must not be submitted")
+
+    futures = submit_comparison(NoExecutor(), WORKLOAD, SCHEDULER_TYPES, 2, 1, cache=cache)
+    assert {name: future.result() for name, future in futures.items()} == first
+
+    traces = ResultCache(str(tmp_path), traces=True)
+    scheduler = create_scheduler('Round Robin', quantum=2)
+    metrics = simulate_spec(scheduler, WORKLOAD, cache=traces)
+    hit = traces.get(traces.key(WORKLOAD, create_scheduler('Round Robin', quantum=2)))
+    assert hit.metrics == metrics
+    assert np.array_equal(hit.trace['end'], scheduler.trace.arrays()['end'])
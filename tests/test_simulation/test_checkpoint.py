@@ -0,0 +1,89 @@
+# tests/test_simulation/test_checkpoint.py
+import pytest
+from src.process.process import Process
+from src.schedulers.factory import SCHEDULER_TYPES, create_scheduler, add_processes, process_adder
+from src.simulation.checkpoint import load_checkpoint, save_checkpoint
+
+WORKLOAD = [(1, 0, 6, 2), (2, 1, 3, 1), (3, 4, 8, 3), (4, 6, 2, 1), (5, 20, 4, 2),
+            (6, 2, 5, 4), (7, 9, 1, 5), (8, 9, 7, 2)]
+
+# (pid, I/O start, I/O duration)
+IO_OPERATIONS = [(1, 2, 5), (3, 8, 3), (8, 12, 4)]
+
+def workload(with_io=False):
+    io_operations = dict((pid, (start, duration)) for pid, start, duration in IO_OPERATIONS)
+    for pid, arrival, burst, priority in WORKLOAD:
+        process = Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+        if with_io and pid in io_operations:
+            start, duration = io_operations[pid]
+            process.io_operations = [{'start_time': start, 'duration': duration, 'completed': False}]
+        yield process
+
+def new_scheduler(scheduler_type, event_driven):
+    scheduler = create_scheduler(scheduler_type, quantum=2, context_switch=1, boost_interval=5)
+    scheduler.event_driven = event_driven
+    scheduler.enable_trace()
+    scheduler.enable_metrics()
+    return scheduler
+
+def outcome(scheduler):
+    processes = sorted(scheduler.completed_processes, key=lambda p: p.pid)
+    return (scheduler.current_time,
+            [(p.pid, p.start_time, p.completion_time, p.waiting_time, p.context_switches)
+             for p in processes],
+            scheduler.trace.segments(),
+            scheduler.metrics.detailed_metrics(scheduler.current_time))
+
+@pytest.mark.parametrize("scheduler_type", SCHEDULER_TYPES)
+@pytest.mark.parametrize("event_driven", [False, True])
+@pytest.mark.parametrize("with_io", [False, True])
+def test_restored_run_matches_uninterrupted_run(tmp_path, scheduler_type, event_driven, with_io):
+    """Queues, clock, running I/O, trace and metrics survive a save and load mid-run"""
+    reference = new_scheduler(scheduler_type, event_driven)
+    add_processes(reference, workload(with_io))
+    while reference.run_step():
+        pass
+
+    scheduler = new_scheduler(scheduler_type, event_driven)
+    add_processes(scheduler, workload(with_io))
+    for _ in range(7):
+        scheduler.run_step()
+    path = str(tmp_path / "run.ckpt")
+    save_checkpoint(scheduler, path)
+    restored = load_checkpoint(path)
+    assert type(restored) is type(scheduler)
+    assert restored.current_time == scheduler.current_time
+
+    # The original and the restored copy continue independently
+    for copy in (scheduler, restored):
+        while not copy.is_all_completed():
+            copy.run_step()
+        assert outcome(copy) == outcome(reference)
+
+@pytest.mark.parametrize("scheduler_type", [
+    'Round Robin', 'Rate Monotonic', 'Earliest Deadline First'
+])
+def test_streamed_run_resumes_from_its_source(tmp_path, scheduler_type):
+    """The source is skipped past processes pulled before the checkpoint"""
+    reference = new_scheduler(scheduler_type, True)
+    reference.attach_arrivals(workload(), add=process_adder(reference))
+    while reference.run_step():
+        pass
+
+    scheduler = new_scheduler(scheduler_type, True)
+    scheduler.attach_arrivals(workload(), add=process_adder(scheduler))
+    for _ in range(4):
+        scheduler.run_step()
+    path = str(tmp_path / "stream.ckpt")
+    save_checkpoint(scheduler, path)
+    restored = load_checkpoint(path, source=workload())
+    while restored.run_step():
+        pass
+    assert restored.current_time == reference.current_time
+    assert restored.metrics.detailed_metrics(restored.current_time) == \
+        reference.metrics.detailed_metrics(reference.current_time)
+
+    broken = tmp_path / "broken.ckpt"
+    broken.write_text("not a checkpoint")
+    with pytest.raises(ValueError):
+        load_checkpoint(str(broken))
@@ -0,0 +1,42 @@
+# tests/test_simulation/test_comparison.py
+from src.schedulers.factory import SCHEDULER_TYPES, create_scheduler, add_processes
+from src.simulation.comparison import (
+    build_processes, compare_schedulers, run_scheduler, workload_spec
+)
+from src.utils.metrics import SchedulingMetrics
+
+WORKLOAD = [(1, 0, 6, 2), (2, 1, 3, 1), (3, 4, 8, 3), (4, 6, 2, 1), (5, 20, 4, 2)]
+
+def serial_metrics(scheduler_type):
+    """Metrics of a tick-by-tick run, as the GUI used to compute them"""
+    scheduler = create_scheduler(scheduler_type, quantum=2, context_switch=1)
+    add_processes(scheduler, build_processes(WORKLOAD))
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+    return SchedulingMetrics.calculate_detailed_metrics(
+        scheduler.processes, scheduler.current_time
+    )
+
+def test_workload_spec_round_trip():
+    """Specs rebuild fresh processes with the same static attributes"""
+    processes = build_processes(WORKLOAD)
+    assert workload_spec(processes) == WORKLOAD
+    assert all(p.waiting_time == 0 and p.start_time is None for p in processes)
+
+def test_workload_spec_keeps_io_operations():
+    """I/O operations survive the trip to worker processes and change results"""
+    with_io = WORKLOAD[:2] + [WORKLOAD[2] + (((5, 3),),)] + WORKLOAD[3:]
+    processes = build_processes(with_io)
+    assert processes[2].io_operations == [{'start_time': 5, 'duration': 3, 'completed': False}]
+    assert workload_spec(processes) == with_io
+    assert run_scheduler('FCFS', with_io) != run_scheduler('FCFS', WORKLOAD)
+
+def test_parallel_comparison_matches_serial_runs():
+    """Worker processes return the same metrics as running in-process"""
+    results = compare_schedulers(WORKLOAD, quantum=2, context_switch=1, max_workers=2)
+
+    assert list(results) == SCHEDULER_TYPES
+    for scheduler_type in SCHEDULER_TYPES:
+        assert results[scheduler_type] == serial_metrics(scheduler_type)
+        assert run_scheduler(scheduler_type, WORKLOAD, 2, 1, event_driven=False) == \
+            results[scheduler_type]
@@ -0,0 +1,48 @@
+# tests/test_simulation/test_sweep.py
+import pytest
+from src.simulation.comparison import build_processes, run_processes
+from src.simulation.sweep import expand_grid, sweep, sweep_configurations
+
+WORKLOAD = [(1, 0, 9, 5), (2, 1, 3, 1), (3, 2, 6, 2), (4, 5, 2, 1), (5, 20, 4, 2)]
+
+def test_sweep_configurations_skip_unused_parameters():
+    """Combinations only differ by parameters the scheduler actually uses"""
+    grid = {'time_quantum': [1, 2, 4], 'preemptive': [True, False]}
+    assert len(expand_grid(grid)) == 6
+
+    configurations = sweep_configurations(['FCFS', 'Round Robin', 'Priority (Preemptive)'], grid)
+    assert configurations == [
+        ('FCFS', {}),
+        ('Round Robin', {'time_quantum': 1}),
+        ('Round Robin', {'time_quantum': 2}),
+        ('Round Robin', {'time_quantum': 4}),
+        ('Priority (Preemptive)', {'preemptive': True}),
+        ('Priority (Non-preemptive)', {'preemptive': False}),
+    ]
+    # Both Priority types swept over preemption are the same two runs
+    assert sweep_configurations(
+        ['Priority (Preemptive)', 'Priority (Non-preemptive)'], {'preemptive': [True, False]}
+    ) == [
+        ('Priority (Preemptive)', {'preemptive': True}),
+        ('Priority (Non-preemptive)', {'preemptive': False}),
+    ]
+    with pytest.raises(ValueError):
+        expand_grid({'quantum': [1]})
+
+def test_parallel_sweep_matches_single_runs():
+    """Rows arrive in configuration order with the metrics of a direct run"""
+    grid = [{'time_quantum': q, 'preemptive': p} for q in (1, 3) for p in (True, False)]
+    rows = list(sweep(WORKLOAD, grid, ['Round Robin', 'Priority (Preemptive)'], max_workers=2))
+
+    assert [(r['scheduler'], r['time_quantum'], r['preemptive']) for r in rows] == [
+        ('Round Robin', 1, None), ('Round Robin', 3, None),
+        ('Priority (Preemptive)', None, True), ('Priority (Non-preemptive)', None, False),
+    ]
+    for row, quantum in zip(rows, (1, 3)):
+        expected = run_processes('Round Robin', build_processes(WORKLOAD), quantum=quantum)
+        assert {k: row[k] for k in expected} == expected
+    preemptive = run_processes('Priority (Preemptive)', build_processes(WORKLOAD))
+    non_preemptive = run_processes('Priority (Non-preemptive)', build_processes(WORKLOAD))
+    assert rows[2]['avg_waiting_time'] == preemptive['avg_waiting_time']
+    assert rows[3]['avg_waiting_time'] == non_preemptive['avg_waiting_time']
+    assert preemptive['avg_waiting_time'] != non_preemptive['avg_waiting_time']
@@ -0,0 +1,101 @@
+# tests/test_simulation/test_worker.py
+import dataclasses
+import pytest
+from src.schedulers.factory import create_scheduler, add_processes
+from src.simulation.comparison import build_processes
+from src.simulation.worker import (
+    SPEED_SLIDER_MAX, SPEED_SLIDER_MIN, SharedVector, SimulationWorker, SnapshotTaker,
+    describe_speed, steps_per_second_at,
+)
+
+WORKLOAD = [(1, 0, 6, 2), (2, 1, 3, 1), (3, 4, 8, 3), (4, 6, 2, 1), (5, 20, 4, 2)]
+
+def start_worker(scheduler_type, **kwargs):
+    """Run a traced scheduler on a worker thread until it finishes"""
+    scheduler = create_scheduler(scheduler_type, quantum=2)
+    scheduler.enable_trace()
+    processes = build_processes(WORKLOAD)
+    add_processes(scheduler, processes)
+    worker = SimulationWorker(scheduler, processes, **kwargs)
+    worker.start()
+    worker.join(10)
+    return worker, processes
+
+@pytest.mark.parametrize("scheduler_type", ["FCFS", "Round Robin"])
+def test_final_snapshot_matches_direct_run(scheduler_type):
+    """An unthrottled worker publishes the same end state as run_step()"""
+    worker, processes = start_worker(scheduler_type, steps_per_second=lambda: None)
+
+    scheduler = create_scheduler(scheduler_type, quantum=2)
+    expected = build_processes(WORKLOAD)
+    add_processes(scheduler, expected)
+    while scheduler.run_step():
+        pass
+
+    snapshot = worker.latest
+    assert worker.finished and worker.error is None
+    assert snapshot.time == scheduler.current_time
+    assert [(p.pid, p.waiting_time, p.completion_time, p.start_time) for p in snapshot.processes] == [
+        (p.pid, p.waiting_time, p.completion_time, p.start_time) for p in expected
+    ]
+    assert snapshot.trace.arrays()['end'].max() == scheduler.current_time
+
+def test_snapshots_are_immutable():
+    """Snapshots share nothing writable with the running simulation"""
+    steps = []
+    worker, processes = start_worker(
+        "FCFS",
+        steps_per_second=lambda: None,
+        step_hook=lambda scheduler: steps.append(scheduler.current_time),
+    )
+    snapshot = worker.latest
+
+    assert steps[-1] == snapshot.time
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.processes[0].waiting_time = 0
+    with pytest.raises(ValueError):
+        snapshot.trace.arrays()['start'][0] = 99
+
+    processes[0].waiting_time = 1234
+    assert snapshot.processes[0].waiting_time != 1234
+
+def test_snapshots_copy_only_changed_processes():
+    """Successive snapshots share the processes that did not change"""
+    scheduler = create_scheduler("FCFS")
+    processes = build_processes(WORKLOAD)
+    scheduler.event_driven = False
+    add_processes(scheduler, processes)
+    taker = SnapshotTaker(scheduler, processes)
+    scheduler.run_step()
+    scheduler.run_step()
+    before = taker.take()
+    scheduler.run_step()
+    after = taker.take()
+
+    # Process 1 ran, process 2 kept waiting, the rest had not arrived
+    assert after.processes.items[0] is not before.processes.items[0]
+    for i in range(1, len(processes)):
+        assert after.processes.items[i] is before.processes.items[i]
+    # Waiting time is still brought up to each snapshot's time
+    scheduler.update_waiting_times()
+    assert after.processes[1].waiting_time == processes[1].waiting_time
+    assert before.processes[1].waiting_time < after.processes[1].waiting_time
+
+def test_shared_vector_updates():
+    """Updated vectors hold the new items and leave the original untouched"""
+    items = list(range(5000))
+    vector = SharedVector.of(items)
+    changes = {0: -1, 31: -2, 32: -3, 1055: -4, 4999: -5}
+    updated = vector.updated(changes)
+
+    assert list(vector) == items
+    assert list(updated) == [changes.get(i, item) for i, item in enumerate(items)]
+    assert updated[-1] == -5 and len(updated) == 5000
+    assert list(SharedVector.of([]).updated({})) == []
+
+def test_speed_slider_positions():
+    """The slider spans one step per second up to an unthrottled end"""
+    assert steps_per_second_at(SPEED_SLIDER_MIN) == 1
+    assert steps_per_second_at(3.0) == 1000
+    assert steps_per_second_at(SPEED_SLIDER_MAX) is None
+    assert describe_speed(None) == "max"
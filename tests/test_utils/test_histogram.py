@@ -0,0 +1,41 @@
+# tests/test_utils/test_histogram.py
+import numpy as np
+import pytest
+from src.utils.histogram import LatencyHistogram
+
+def test_percentiles_within_relative_error():
+    """Small values are exact, large ones within the bucket resolution"""
+    histogram = LatencyHistogram(bits=7)
+    values = np.random.default_rng(7).lognormal(4, 2, 20000).astype(np.int64)
+    for value in values.tolist():
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.mean() == pytest.approx(values.mean())
+    for q in (50, 95, 99, 100):
+        exact = np.percentile(values, q, method='inverted_cdf')
+        assert histogram.percentile(q) == pytest.approx(exact, rel=2 ** -8, abs=0.5)
+
+    small = LatencyHistogram(bits=7)
+    for value in (3, 1, 4, 1, 5, 9, 2, 6):
+        small.record(value)
+    assert small.percentiles((50, 100)) == {50: 3, 100: 9}
+
+def test_merge_equals_recording_everything():
+    """Shards merge into the histogram of the combined data"""
+    values = list(range(0, 100000, 7))
+    left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in values[:5000]:
+        left.record(value)
+    for value in values[5000:]:
+        right.record(value)
+    for value in values:
+        combined.record(value)
+
+    left.merge(right)
+    assert left.counts == combined.counts
+    assert (left.count, left.total, left.min, left.max) == (
+        combined.count, combined.total, combined.min, combined.max
+    )
+    with pytest.raises(ValueError):
+        left.merge(LatencyHistogram(bits=3))
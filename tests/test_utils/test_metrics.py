@@ -0,0 +1,37 @@
+# tests/test_utils/test_metrics.py
+import pytest
+from src.schedulers.factory import SCHEDULER_TYPES, create_scheduler, add_processes
+from src.simulation.comparison import build_processes, run_processes, run_stream
+from src.utils.metrics import MetricTotals, SchedulingMetrics
+
+WORKLOAD = [(1, 0, 6, 2), (2, 1, 3, 1), (3, 4, 8, 3), (4, 6, 2, 1), (5, 20, 4, 2)]
+
+@pytest.mark.parametrize("scheduler_type", SCHEDULER_TYPES)
+def test_online_metrics_match_offline_pass(scheduler_type):
+    """Metrics kept on dispatch and completion equal a pass over the processes"""
+    scheduler = create_scheduler(scheduler_type, quantum=2, context_switch=1)
+    totals = scheduler.enable_metrics()
+    processes = build_processes(WORKLOAD)
+    add_processes(scheduler, processes)
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+
+    offline = SchedulingMetrics.calculate_detailed_metrics(processes, scheduler.current_time)
+    assert totals.detailed_metrics(scheduler.current_time) == offline
+    assert offline['p50_waiting_time'] <= offline['p95_waiting_time'] <= offline['p99_waiting_time']
+
+@pytest.mark.parametrize("scheduler_type", SCHEDULER_TYPES)
+def test_no_process_runs_before_it_arrives(scheduler_type):
+    """Response times are never negative, so means and percentiles agree"""
+    processes = build_processes(WORKLOAD)
+    metrics = run_processes(scheduler_type, processes)
+
+    assert all(p.start_time >= p.arrival_time for p in processes)
+    assert metrics['avg_response_time'] >= 0
+    assert metrics == run_stream(scheduler_type, iter(build_processes(WORKLOAD)))
+
+def test_empty_workload_metrics():
+    """Averages of no processes are 0 instead of a division error"""
+    metrics = MetricTotals().detailed_metrics(0)
+    assert metrics['avg_waiting_time'] == metrics['avg_response_time'] == 0
+    assert metrics['p95_turnaround_time'] == 0
@@ -0,0 +1,48 @@
+# tests/test_utils/test_trace.py
+import pytest
+from src.process.process import Process
+from src.schedulers.priority import PriorityScheduler
+from src.schedulers.mlfq import MLFQScheduler
+from src.utils.trace import TraceRecorder, REASON_COMPLETED, REASON_PREEMPTED
+
+def test_recorder_merges_consecutive_slices():
+    """Only switches between processes append segments"""
+    trace = TraceRecorder(capacity=1)
+    for t in range(100):
+        trace.extend(1, t, t + 1)
+    trace.end_segment(REASON_PREEMPTED)
+    trace.extend(2, 100, 103)
+    trace.end_segment(REASON_COMPLETED)
+    trace.extend(1, 105, 106)
+
+    assert trace.segments() == [
+        (1, 0, 100, 'preempted'),
+        (2, 100, 103, 'completed'),
+        (1, 105, 106, 'running'),
+    ]
+    assert trace.arrays()['end'].tolist() == [100, 103, 106]
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_scheduler_trace_records_switches(event_driven):
+    """Segments follow preemption and quantum expiry in both stepping modes"""
+    scheduler = PriorityScheduler(preemptive=True)
+    scheduler.event_driven = event_driven
+    trace = scheduler.enable_trace()
+    for process in [Process(1, 0, 5, 3), Process(2, 1, 3, 1)]:
+        scheduler.add_process(process)
+    scheduler.run()
+
+    assert trace.segments() == [
+        (1, 0, 1, 'preempted'),
+        (2, 1, 4, 'completed'),
+        (1, 4, 8, 'completed'),
+    ]
+
+    scheduler = MLFQScheduler(num_queues=2, base_quantum=2)
+    scheduler.event_driven = event_driven
+    scheduler.context_switch_penalty = 0
+    trace = scheduler.enable_trace()
+    scheduler.add_process(Process(1, 0, 5))
+    scheduler.run()
+
+    assert trace.segments() == [(1, 0, 5, 'completed')]
@@ -0,0 +1,61 @@
+# tests/test_visualization/test_gantt.py
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from src.process.process import Process
+from src.process.process_state import ProcessState
+from src.schedulers.fcfs import FCFSScheduler
+from src.visualization.gantt import LiveGanttChart, busy_heatmap, draw_segments
+
+def test_draw_segments_uses_one_artist():
+    """Segments become one collection, or a heatmap above the threshold"""
+    rows = np.arange(300) % 30
+    starts = np.arange(300) * 2
+    ends = starts + 2
+
+    ax = Figure().add_subplot(111)
+    artist = draw_segments(ax, rows, starts, ends, 'green', lod_threshold=1000)
+    assert isinstance(artist, PolyCollection)
+    assert len(ax.collections) == 1 and len(ax.patches) == 0
+
+    ax = Figure().add_subplot(111)
+    artist = draw_segments(ax, rows, starts, ends, 'green', lod_threshold=100)
+    assert isinstance(artist, AxesImage)
+    assert len(ax.collections) == 0
+
+def test_heatmap_preserves_busy_time():
+    """Each segment is split exactly across the time buckets it overlaps"""
+    grid, row_edges, time_edges = busy_heatmap(
+        rows=[0, 0, 0], starts=[0, 2.5, 7], ends=[1, 6, 10], n_rows=1,
+        row_buckets=1, time_bins=5
+    )
+    assert time_edges.tolist() == [0, 2, 4, 6, 8, 10]
+    assert grid.tolist() == [[0.5, 0.75, 1.0, 0.5, 1.0]]
+
+def test_live_gantt_paints_finished_segments_once():
+    """Frames blit live bars; terminated processes move to the background"""
+    scheduler = FCFSScheduler()
+    trace = scheduler.enable_trace()
+    processes = [Process(pid=pid, arrival_time=0, burst_time=3) for pid in range(8)]
+    for process in processes:
+        scheduler.add_process(process)
+    figure = Figure()
+    chart = LiveGanttChart(figure, FigureCanvasAgg(figure),
+                           {state: 'green' for state in ProcessState})
+
+    chart.update(processes, trace)
+    frames = 1
+    while scheduler.run_step():
+        chart.update(processes, trace)
+        frames += 1
+    chart.update(processes, trace)
+
+    # Layout happens for the first frame, new legend entries and a wider
+    # time range; every other frame is blitted
+    assert chart.layouts == chart.blit.full_draws <= 4 < frames
+    assert len(chart.settled.get_paths()) == 8
+    assert len(chart.live.get_paths()) == 0
@@ -0,0 +1,65 @@
+# tests/test_visualization/test_table.py
+from src.process.process import Process
+from src.visualization.table import VirtualTable
+
+class FakeTree:
+    """Records the Treeview calls a VirtualTable makes"""
+    def __init__(self):
+        self.values = {}
+        self.calls = 0
+
+    def insert(self, parent, index, values=()):
+        self.calls += 1
+        item = f"I{len(self.values)}"
+        self.values[item] = values
+        return item
+
+    def item(self, item, values=()):
+        self.calls += 1
+        self.values[item] = values
+
+    def delete(self, item):
+        self.calls += 1
+        del self.values[item]
+
+def row(process):
+    return (process.pid, process.remaining_time)
+
+def test_only_changed_visible_rows_are_updated():
+    """A refresh costs Tk calls for changed rows in the window only"""
+    processes = [Process(pid=i, arrival_time=0, burst_time=5) for i in range(5000)]
+    tree = FakeTree()
+    table = VirtualTable(tree, row, key=lambda p: p.pid, window=20)
+
+    table.set_rows(processes)
+    assert len(tree.values) == 20
+    assert set(table.items) == set(range(20))
+
+    tree.calls = 0
+    table.refresh()
+    assert tree.calls == 0
+
+    processes[3].remaining_time = 4
+    processes[4000].remaining_time = 4
+    table.refresh()
+    assert tree.calls == 1
+    assert tree.values[table.items[3]] == (3, 4)
+
+def test_scrolling_reuses_items():
+    """Scrolling rebinds the existing items to other rows"""
+    processes = [Process(pid=i, arrival_time=0, burst_time=5) for i in range(100)]
+    tree = FakeTree()
+    table = VirtualTable(tree, row, key=lambda p: p.pid, window=10)
+    table.set_rows(processes)
+    items = set(tree.values)
+
+    table.yview('moveto', '0.5')
+    assert set(tree.values) == items
+    assert set(table.items) == set(range(50, 60))
+
+    table.yview('scroll', '1', 'pages')
+    table.yview('scroll', '100', 'units')
+    assert set(table.items) == set(range(90, 100))
+
+    table.clear()
+    assert tree.values == {}
@@ -0,0 +1,45 @@
+# tests/test_visualization/test_timeline.py
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from src.process.process import Process
+from src.process.process_state import ProcessState
+from src.visualization.timeline import LiveTimeline
+
+COLORS = {state: 'gray' for state in ProcessState}
+
+def make_timeline():
+    figure = Figure()
+    return LiveTimeline(figure, FigureCanvasAgg(figure), COLORS)
+
+def test_frames_reuse_artists_until_limits_change():
+    """Bars grow in place; only leaving the axis limits triggers a layout"""
+    processes = [Process(pid=1, arrival_time=0, burst_time=5),
+                 Process(pid=2, arrival_time=3, burst_time=2)]
+    timeline = make_timeline()
+    timeline.update(processes, 1)
+    bars = timeline.bars
+    for now in range(2, 8):
+        processes[0].state = ProcessState.RUNNING
+        timeline.update(processes, now)
+
+    assert timeline.layouts == 1 and timeline.blit.full_draws == 1
+    assert timeline.bars is bars
+    ends = [path.vertices[:, 0].max() for path in bars.get_paths()]
+    assert ends == [7, 7]
+
+    timeline.update(processes, 1000)
+    assert timeline.layouts == 2
+
+def test_new_processes_rebuild_layout():
+    """A different process list gets fresh artists"""
+    timeline = make_timeline()
+    timeline.update([Process(pid=1, arrival_time=0, burst_time=5)], 2)
+    timeline.update([Process(pid=1, arrival_time=0, burst_time=5),
+                     Process(pid=2, arrival_time=1, burst_time=3)], 2)
+    assert timeline.layouts == 2
+    assert len(timeline.bars.get_paths()) == 2
+
+    timeline.update([], 2)
+    assert timeline.bars is None
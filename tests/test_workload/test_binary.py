@@ -0,0 +1,81 @@
+# tests/test_workload/test_binary.py
+import json
+import numpy as np
+import pytest
+from src.process.process_table import MISSING
+from src.simulation.comparison import run_processes, run_stream
+from src.workload import binary
+from src.workload.binary import WORKLOAD_DTYPE, convert_workload, load_binary, load_table
+from src.workload.loader import load_workload
+from src.workload.stream import stream_workload
+
+RECORDS = [
+    {"pid": 3, "arrival_time": 4, "burst_time": 2, "priority": 1},
+    {"pid": 1, "arrival_time": 0, "burst_time": 6, "priority": 3},
+    {"pid": 2, "arrival_time": 1, "burst_time": 3, "priority": 2},
+]
+
+@pytest.mark.parametrize("batch_size", [2, binary.BATCH_SIZE])
+def test_convert_writes_arrival_ordered_records(tmp_path, monkeypatch, batch_size):
+    """Text workloads convert batch by batch to fixed-width records sorted by arrival"""
+    monkeypatch.setattr(binary, 'BATCH_SIZE', batch_size)
+    source = tmp_path / "workload.json"
+    source.write_text(json.dumps(RECORDS))
+    destination = tmp_path / "workload.npy"
+
+    assert convert_workload(str(source), str(destination)) == 3
+
+    records = load_binary(str(destination))
+    assert records.dtype == WORKLOAD_DTYPE
+    assert isinstance(records, np.memmap)
+    assert records['pid'].tolist() == [1, 2, 3]
+    assert records['arrival_time'].tolist() == [0, 1, 4]
+    # The staging file is removed
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["workload.json", "workload.npy"]
+
+def test_binary_workload_simulates_like_text(tmp_path):
+    """Mapped columns feed the schedulers without copies"""
+    source = tmp_path / "workload.json"
+    source.write_text(json.dumps(RECORDS))
+    destination = tmp_path / "workload.npy"
+    convert_workload(str(source), str(destination))
+
+    table = load_table(str(destination))
+    assert isinstance(table.arrival_time.base, np.memmap)
+
+    for scheduler_type in ('SJF', 'Round Robin', 'Rate Monotonic'):
+        assert run_processes(scheduler_type, load_workload(str(destination))) == \
+            run_processes(scheduler_type, load_workload(str(source)))
+
+IO_WORKLOAD = (
+    "pid,arrival_time,burst_time,priority,io_start,io_duration\n"
+    "1,0,8,2,3,4\n"
+    "2,1,5,1,-1,0\n"
+    "3,2,6,3,1,2\n"
+    "4,6,3,1,-1,0\n"
+)
+
+def test_convert_keeps_io_operations(tmp_path):
+    """Converting a workload with I/O does not change simulation results"""
+    source = tmp_path / "workload.csv"
+    source.write_text(IO_WORKLOAD)
+    destination = tmp_path / "workload.npy"
+    convert_workload(str(source), str(destination))
+
+    records = load_binary(str(destination))
+    assert records['io_start'].tolist() == [3, MISSING, 1, MISSING]
+    for scheduler_type in ('FCFS', 'Round Robin', 'Multi-Level Queue'):
+        expected = run_processes(scheduler_type, load_workload(str(source)))
+        assert expected['io_utilization'] > 0
+        assert run_processes(scheduler_type, load_workload(str(destination))) == expected
+        assert run_stream(scheduler_type, stream_workload(str(destination))) == expected
+
+def test_convert_rejects_several_io_operations(tmp_path):
+    """Records hold one I/O operation, more cannot be converted silently"""
+    source = tmp_path / "workload.json"
+    source.write_text(json.dumps([{
+        "pid": 1, "arrival_time": 0, "burst_time": 9,
+        "io_operations": [{"start_time": 1, "duration": 2}, {"start_time": 5, "duration": 1}],
+    }]))
+    with pytest.raises(ValueError, match="at most one"):
+        convert_workload(str(source), str(tmp_path / "workload.npy"))
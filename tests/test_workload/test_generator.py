@@ -0,0 +1,60 @@
+# tests/test_workload/test_generator.py
+import numpy as np
+import pytest
+from src.process.process_table import MISSING
+from src.simulation.comparison import run_processes
+from src.workload.generator import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, generate_workload
+
+COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority', 'io_start', 'io_duration')
+
+@pytest.mark.parametrize("arrivals", ARRIVAL_PROCESSES)
+@pytest.mark.parametrize("bursts", BURST_DISTRIBUTIONS)
+def test_generated_workload_is_reproducible(arrivals, bursts):
+    """The same seed gives the same columns, all well-formed"""
+    first = generate_workload(2000, seed=42, arrivals=arrivals, bursts=bursts,
+                              max_burst=50, io_probability=0.3)
+    second = generate_workload(2000, seed=42, arrivals=arrivals, bursts=bursts,
+                               max_burst=50, io_probability=0.3)
+    other = generate_workload(2000, seed=43, arrivals=arrivals, bursts=bursts,
+                              max_burst=50, io_probability=0.3)
+
+    for name in COLUMNS:
+        assert np.array_equal(getattr(first, name), getattr(second, name))
+    assert not np.array_equal(first.burst_time, other.burst_time)
+
+    assert first.pid.tolist() == list(range(1, 2001))
+    assert np.all(np.diff(first.arrival_time) >= 0)
+    assert first.burst_time.min() >= 1 and first.burst_time.max() <= 50
+    assert set(first.priority.tolist()) <= set(range(1, 6))
+    with_io = first.io_start != MISSING
+    assert np.all(first.io_start[with_io] < first.burst_time[with_io])
+    assert np.all(first.io_duration[with_io] >= 1)
+    assert np.all(first.io_duration[~with_io] == MISSING)
+
+def test_generated_distributions():
+    """Bursts keep their mean, Pareto has the heavier tail, MMPP is burstier"""
+    n = 200_000
+    exponential = generate_workload(n, seed=1, bursts='exponential', mean_burst=20)
+    pareto = generate_workload(n, seed=1, bursts='pareto', mean_burst=20, pareto_shape=1.5)
+    lognormal = generate_workload(n, seed=1, bursts='lognormal', mean_burst=20)
+    for workload in (exponential, pareto, lognormal):
+        assert workload.burst_time.mean() == pytest.approx(20, rel=0.1)
+    assert np.percentile(pareto.burst_time, 99.9) > 2 * np.percentile(exponential.burst_time, 99.9)
+
+    def dispersion(workload):
+        per_tick = np.bincount(workload.arrival_time)
+        return per_tick.var() / per_tick.mean()
+
+    poisson = generate_workload(n, seed=1, arrivals='poisson', arrival_rate=2.0)
+    mmpp = generate_workload(n, seed=1, arrivals='mmpp', arrival_rate=2.0)
+    assert len(poisson) / poisson.arrival_time[-1] == pytest.approx(2.0, rel=0.05)
+    assert dispersion(poisson) == pytest.approx(1.0, abs=0.1)
+    assert dispersion(mmpp) > 2
+
+    small = generate_workload(50, seed=3)
+    assert run_processes('FCFS', small.processes()) == run_processes('FCFS', small.table().views())
+    with_io = generate_workload(50, seed=3, io_probability=0.5)
+    processes = with_io.processes()
+    assert sum(hasattr(p, 'io_operations') for p in processes) == \
+        np.count_nonzero(with_io.io_start != MISSING)
+    assert run_processes('FCFS', processes)['io_utilization'] > 0
@@ -0,0 +1,29 @@
+# tests/test_workload/test_loader.py
+import json
+import pytest
+from src.workload.loader import load_csv, load_json, load_workload
+
+def test_csv_and_json_load_the_same_workload(tmp_path):
+    """Both formats produce arrival-sorted processes with I/O operations"""
+    csv_file = tmp_path / "workload.csv"
+    csv_file.write_text(
+        "pid,arrival_time,burst_time,priority,io_start,io_duration\n"
+        "2,3,4,2,1,1\n"
+        "1,0,5,1,2,2\n"
+    )
+    json_file = tmp_path / "workload.json"
+    json_file.write_text(json.dumps([
+        {"pid": 2, "arrival_time": 3, "burst_time": 4, "priority": 2,
+         "io_operations": [{"start_time": 1, "duration": 1}]},
+        {"pid": 1, "arrival_time": 0, "burst_time": 5, "priority": 1,
+         "io_operations": [{"start_time": 2, "duration": 2}]},
+    ]))
+
+    for processes in (load_csv(str(csv_file)), load_json(str(json_file))):
+        assert [p.pid for p in processes] == [1, 2]
+        assert processes[0].io_operations == [
+            {'start_time': 2, 'duration': 2, 'completed': False}
+        ]
+
+    with pytest.raises(ValueError):
+        load_workload(str(tmp_path / "workload.txt"))
@@ -0,0 +1,66 @@
+# tests/test_workload/test_stream.py
+import io
+import json
+import pytest
+from src.process.process import Process
+from src.schedulers.fcfs import FCFSScheduler
+from src.simulation.comparison import build_processes, run_processes, run_stream
+from src.workload.binary import convert_workload
+from src.workload.stream import iter_json_array, stream_workload
+
+WORKLOAD = [(1, 0, 5, 1), (2, 1, 4, 2), (3, 3, 2, 1), (4, 30, 3, 2)]
+
+def test_stream_formats_yield_the_same_records(tmp_path):
+    """CSV, JSON arrays and NDJSON stream identical arrival-ordered processes"""
+    records = [
+        {"pid": pid, "arrival_time": arrival, "burst_time": burst, "priority": priority}
+        for pid, arrival, burst, priority in WORKLOAD
+    ]
+    csv_file = tmp_path / "trace.csv"
+    csv_file.write_text("pid,arrival_time,burst_time,priority\n" + "".join(
+        f"{pid},{arrival},{burst},{priority}\n" for pid, arrival, burst, priority in WORKLOAD
+    ))
+    json_file = tmp_path / "trace.json"
+    json_file.write_text(json.dumps(records, indent=2))
+    ndjson_file = tmp_path / "trace.ndjson"
+    ndjson_file.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    npy_file = tmp_path / "trace.npy"
+    convert_workload(str(csv_file), str(npy_file))
+
+    for path in (csv_file, json_file, ndjson_file, npy_file):
+        processes = list(stream_workload(str(path)))
+        assert [(p.pid, p.arrival_time, p.burst_time, p.priority)
+                for p in processes] == WORKLOAD
+
+    unordered = tmp_path / "unordered.ndjson"
+    unordered.write_text("".join(json.dumps(r) + "\n" for r in reversed(records)))
+    with pytest.raises(ValueError):
+        list(stream_workload(str(unordered)))
+
+def test_streamed_run_keeps_only_live_processes():
+    """Arrivals are pulled lazily and finished processes are dropped"""
+    scheduler = FCFSScheduler()
+    scheduler.event_driven = True
+    finished = []
+    scheduler.completion_listener = finished.append
+    source = (Process(pid=i, arrival_time=10 * i, burst_time=4) for i in range(1000))
+    scheduler.attach_arrivals(source)
+
+    peak = 0
+    while not scheduler.is_all_completed():
+        scheduler.run_step()
+        peak = max(peak, len(scheduler.processes))
+
+    assert len(finished) == 1000
+    assert peak <= 4
+    assert scheduler.completed_processes == []
+    assert run_stream('SJF', iter(build_processes(WORKLOAD))) == \
+        run_processes('SJF', build_processes(WORKLOAD))
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_json_array_elements_across_chunks(chunk_size):
+    """Elements and numbers split over chunk boundaries decode the same"""
+    items = [{"pid": i, "arrival_time": i * 1234567, "burst_time": 3} for i in range(200)]
+    text = " [ " + ",\n".join(json.dumps(item) for item in items) + " ] "
+    assert list(iter_json_array(io.StringIO(text), chunk_size)) == items